@@ -0,0 +1,796 @@
+# Questionnaire definitions, compiled once per process by utils.questionnaire
+#
+# Platform questions are answered one at a time. A question with a "metric"
+# also sets that standard metric (mood 1-5, stress 1-5 or anxiety True/False)
+# from the chosen option through "scores"; options without a score use the
+# metric's default.
+
+# General Mood Questionnaire
+general_questions = [
+    {
+        "id": "mood",
+        "text": "How are you *really* feeling today?",
+        "type": "emoji",
+        "options": [
+            {
+                "label": "Great",
+                "value": 5,
+                "emoji": "😄"
+            },
+            {
+                "label": "Good",
+                "value": 4,
+                "emoji": "🙂"
+            },
+            {
+                "label": "Neutral",
+                "value": 3,
+                "emoji": "😐"
+            },
+            {
+                "label": "Low",
+                "value": 2,
+                "emoji": "😔"
+            },
+            {
+                "label": "Struggling",
+                "value": 1,
+                "emoji": "😢"
+            }
+        ]
+    },
+    {
+        "id": "sleep",
+        "text": "How was your sleep?",
+        "type": "slider",
+        "min": 1,
+        "max": 5,
+        "help": "1 = Poor sleep, 5 = Great sleep"
+    },
+    {
+        "id": "stress",
+        "text": "What's your stress level today?",
+        "type": "slider",
+        "min": 1,
+        "max": 5,
+        "help": "1 = Very low stress, 5 = Very high stress"
+    },
+    {
+        "id": "anxiety",
+        "text": "Did you feel anxious today?",
+        "type": "boolean",
+        "options": [
+            "No",
+            "Yes"
+        ]
+    }
+]
+
+platform_questionnaires = {
+    "Instagram": {
+        "emoji": "📸",
+        "questions": [
+            {
+                "id": "instagram_experience",
+                "text": "How would you describe your current experience with Instagram?",
+                "options": [
+                    "Uplifting and inspiring",
+                    "A mix of fun and distraction",
+                    "Sometimes overwhelming",
+                    "I'd like to explore a healthier balance"
+                ]
+            },
+            {
+                "id": "instagram_frequency",
+                "text": "How often do you use Instagram during your free time?",
+                "options": [
+                    "Rarely",
+                    "Occasionally",
+                    "A few times a day",
+                    "Regularly throughout the day"
+                ]
+            },
+            {
+                "id": "instagram_content",
+                "text": "What type of content do you engage with the most?",
+                "options": [
+                    "Educational and career-oriented",
+                    "Fitness, motivation, or self-growth",
+                    "Entertainment and lifestyle",
+                    "Mixed or not sure"
+                ]
+            },
+            {
+                "id": "instagram_feeling",
+                "text": "After using Instagram, how do you typically feel?",
+                "options": [
+                    "Energized and positive",
+                    "Neutral",
+                    "Slightly distracted",
+                    "Emotionally drained or overstimulated"
+                ],
+                "metric": "mood",
+                "scores": {
+                    "Energized and positive": 5,
+                    "Neutral": 3,
+                    "Slightly distracted": 2,
+                    "Emotionally drained or overstimulated": 1
+                }
+            },
+            {
+                "id": "instagram_self_image",
+                "text": "Has Instagram influenced your self-image or emotions?",
+                "options": [
+                    "Not really",
+                    "Sometimes I feel inspired, other times unsure",
+                    "Yes, I've reflected more on how I view myself",
+                    "Yes, and I'm looking to understand this better"
+                ],
+                "metric": "anxiety",
+                "scores": {
+                    "Not really": False,
+                    "Sometimes I feel inspired, other times unsure": False,
+                    "Yes, I've reflected more on how I view myself": False,
+                    "Yes, and I'm looking to understand this better": True
+                }
+            },
+            {
+                "id": "instagram_growth",
+                "text": "Does Instagram help or hinder your personal growth?",
+                "options": [
+                    "It supports my goals",
+                    "A bit of both",
+                    "It distracts me at times",
+                    "I'd like to realign my time better"
+                ]
+            },
+            {
+                "id": "instagram_engagement",
+                "text": "How important are likes/comments/followers to you?",
+                "options": [
+                    "Not important",
+                    "Somewhat noticeable",
+                    "I often track them",
+                    "I feel affected when engagement changes"
+                ]
+            },
+            {
+                "id": "instagram_boundaries",
+                "text": "Would you consider taking breaks or setting boundaries with Instagram?",
+                "options": [
+                    "I already take breaks regularly",
+                    "I've considered it but haven't started",
+                    "It's hard to step away",
+                    "I'd like help creating healthy boundaries"
+                ],
+                "metric": "stress",
+                "scores": {
+                    "I already take breaks regularly": 1,
+                    "I've considered it but haven't started": 3,
+                    "It's hard to step away": 4,
+                    "I'd like help creating healthy boundaries": 3
+                }
+            },
+            {
+                "id": "instagram_resources",
+                "text": "Would you be interested in resources or support for mindful Instagram use?",
+                "options": [
+                    "Yes, that would be helpful",
+                    "Maybe, if it fits my needs",
+                    "Not right now",
+                    "I'm not sure"
+                ]
+            }
+        ]
+    },
+    "Facebook": {
+        "emoji": "📘",
+        "questions": [
+            {
+                "id": "facebook_frequency",
+                "text": "How often do you check Facebook?",
+                "options": [
+                    "Occasionally",
+                    "Once or twice daily",
+                    "Several times a day",
+                    "Continuously throughout the day"
+                ]
+            },
+            {
+                "id": "facebook_purpose",
+                "text": "What do you mainly use Facebook for?",
+                "options": [
+                    "Staying in touch with friends/family",
+                    "Sharing memories or thoughts",
+                    "Browsing groups or marketplace",
+                    "A mix of everything"
+                ]
+            },
+            {
+                "id": "facebook_feeling",
+                "text": "How do you usually feel after using Facebook?",
+                "options": [
+                    "Connected and positive",
+                    "Neutral",
+                    "Slightly distracted or overwhelmed",
+                    "Anxious or left out"
+                ],
+                "metric": "mood",
+                "scores": {
+                    "Connected and positive": 5,
+                    "Neutral": 3,
+                    "Slightly distracted or overwhelmed": 2,
+                    "Anxious or left out": 1
+                }
+            },
+            {
+                "id": "facebook_comparison",
+                "text": "Do you find yourself comparing your life with others based on posts?",
+                "options": [
+                    "Not at all",
+                    "Occasionally",
+                    "Frequently",
+                    "Almost always"
+                ],
+                "metric": "anxiety",
+                "scores": {
+                    "Not at all": False,
+                    "Occasionally": False,
+                    "Frequently": True,
+                    "Almost always": True
+                }
+            },
+            {
+                "id": "facebook_meaningful",
+                "text": "How often do you feel your time on Facebook is meaningful?",
+                "options": [
+                    "Very often",
+                    "Sometimes",
+                    "Rarely",
+                    "Unsure"
+                ]
+            },
+            {
+                "id": "facebook_interactions",
+                "text": "Do interactions (likes, comments) influence how you feel about yourself or others?",
+                "options": [
+                    "Not really",
+                    "Occasionally",
+                    "Yes, sometimes",
+                    "Yes, frequently"
+                ]
+            },
+            {
+                "id": "facebook_emotional",
+                "text": "Do family posts or social updates ever trigger emotional reactions?",
+                "options": [
+                    "Not at all",
+                    "Slightly",
+                    "Often",
+                    "Strongly"
+                ],
+                "metric": "stress",
+                "scores": {
+                    "Not at all": 1,
+                    "Slightly": 2,
+                    "Often": 4,
+                    "Strongly": 5
+                }
+            },
+            {
+                "id": "facebook_goals",
+                "text": "Does Facebook support or distract you from personal goals or mental peace?",
+                "options": [
+                    "It supports me",
+                    "A mix of both",
+                    "It distracts me occasionally",
+                    "It affects me deeply"
+                ]
+            },
+            {
+                "id": "facebook_communities",
+                "text": "Do you use Facebook groups or communities for emotional support or hobbies?",
+                "options": [
+                    "Yes, regularly",
+                    "Sometimes",
+                    "Rarely",
+                    "No"
+                ]
+            },
+            {
+                "id": "facebook_tips",
+                "text": "Are you open to mental wellness tips tailored to your Facebook use?",
+                "options": [
+                    "Yes",
+                    "Maybe",
+                    "Not sure",
+                    "No"
+                ]
+            }
+        ]
+    },
+    "Snapchat": {
+        "emoji": "👻",
+        "questions": [
+            {
+                "id": "snapchat_frequency",
+                "text": "How often do you use Snapchat daily?",
+                "options": [
+                    "Less than 30 minutes",
+                    "30 minutes to 1 hour",
+                    "1–2 hours",
+                    "More than 2 hours"
+                ]
+            },
+            {
+                "id": "snapchat_purpose",
+                "text": "What do you primarily use Snapchat for?",
+                "options": [
+                    "Staying connected with friends",
+                    "Sharing personal moments",
+                    "Exploring content/stories",
+                    "Maintaining streaks"
+                ]
+            },
+            {
+                "id": "snapchat_streaks",
+                "text": "How do you feel when a streak breaks or snaps go unanswered?",
+                "options": [
+                    "Unaffected",
+                    "Slightly concerned",
+                    "Stressed or anxious",
+                    "Upset or emotional"
+                ],
+                "metric": "stress",
+                "scores": {
+                    "Unaffected": 1,
+                    "Slightly concerned": 2,
+                    "Stressed or anxious": 4,
+                    "Upset or emotional": 5
+                }
+            },
+            {
+                "id": "snapchat_fomo",
+                "text": "Do you ever feel left out due to content shared by others?",
+                "options": [
+                    "Never",
+                    "Rarely",
+                    "Sometimes",
+                    "Often"
+                ],
+                "metric": "anxiety",
+                "scores": {
+                    "Never": False,
+                    "Rarely": False,
+                    "Sometimes": True,
+                    "Often": True
+                }
+            },
+            {
+                "id": "snapchat_image",
+                "text": "How much effort do you put into appearing fun or perfect on Snapchat?",
+                "options": [
+                    "None — I post casually",
+                    "A little — for fun",
+                    "Moderate — I like to be seen a certain way",
+                    "A lot — I feel pressured to present a certain image"
+                ]
+            },
+            {
+                "id": "snapchat_connection",
+                "text": "Do you feel seen and understood through your Snapchat interactions?",
+                "options": [
+                    "Yes, always",
+                    "Mostly",
+                    "Sometimes",
+                    "Rarely"
+                ]
+            },
+            {
+                "id": "snapchat_emotional",
+                "text": "How does using Snapchat affect your emotional state overall?",
+                "options": [
+                    "I feel happy and connected",
+                    "Neutral",
+                    "Mixed emotions",
+                    "Emotionally drained sometimes"
+                ],
+                "metric": "mood",
+                "scores": {
+                    "I feel happy and connected": 5,
+                    "Neutral": 3,
+                    "Mixed emotions": 2,
+                    "Emotionally drained sometimes": 1
+                }
+            },
+            {
+                "id": "snapchat_impact",
+                "text": "Has your Snapchat use ever impacted your studies, work, or goals?",
+                "options": [
+                    "Never",
+                    "Rarely",
+                    "Occasionally",
+                    "Often"
+                ]
+            },
+            {
+                "id": "snapchat_authenticity",
+                "text": "Do you feel comfortable expressing your real self on Snapchat?",
+                "options": [
+                    "Always",
+                    "Mostly",
+                    "Sometimes",
+                    "Not really"
+                ]
+            },
+            {
+                "id": "snapchat_balance",
+                "text": "Would you like tips to better balance your digital and emotional life?",
+                "options": [
+                    "Definitely",
+                    "Maybe",
+                    "Not sure",
+                    "No"
+                ]
+            }
+        ]
+    },
+    "Twitter": {
+        "emoji": "🐦",
+        "questions": [
+            {
+                "id": "twitter_experience",
+                "text": "How would you describe your experience with Twitter/X?",
+                "options": [
+                    "Engaging and informative",
+                    "A mix of value and noise",
+                    "Sometimes intense or draining",
+                    "I use it mostly out of habit"
+                ]
+            },
+            {
+                "id": "twitter_content",
+                "text": "What kind of content do you usually interact with?",
+                "options": [
+                    "News and world events",
+                    "Memes and humor",
+                    "Discussions and debates",
+                    "A variety / not sure"
+                ]
+            },
+            {
+                "id": "twitter_feeling",
+                "text": "After scrolling through Twitter, how do you typically feel?",
+                "options": [
+                    "Informed and curious",
+                    "Neutral or unaffected",
+                    "A bit overwhelmed or reactive",
+                    "Emotionally unsettled"
+                ],
+                "metric": "mood",
+                "scores": {
+                    "Informed and curious": 5,
+                    "Neutral or unaffected": 3,
+                    "A bit overwhelmed or reactive": 2,
+                    "Emotionally unsettled": 1
+                }
+            },
+            {
+                "id": "twitter_trending",
+                "text": "How frequently do trending topics affect your emotions or opinions?",
+                "options": [
+                    "Rarely",
+                    "Sometimes",
+                    "Frequently",
+                    "Very often"
+                ]
+            },
+            {
+                "id": "twitter_arguments",
+                "text": "Do online arguments or intense threads impact your mood?",
+                "options": [
+                    "Not at all",
+                    "Occasionally",
+                    "Yes, they sometimes affect me",
+                    "Yes, quite significantly"
+                ],
+                "metric": "stress",
+                "scores": {
+                    "Not at all": 1,
+                    "Occasionally": 2,
+                    "Yes, they sometimes affect me": 4,
+                    "Yes, quite significantly": 5
+                }
+            },
+            {
+                "id": "twitter_expression",
+                "text": "Do you use Twitter to express emotions or vent?",
+                "options": [
+                    "Never",
+                    "Rarely",
+                    "Sometimes",
+                    "Frequently"
+                ]
+            },
+            {
+                "id": "twitter_pressure",
+                "text": "Do you feel pressure to respond or stay constantly updated?",
+                "options": [
+                    "No pressure at all",
+                    "Mild pressure",
+                    "Quite often",
+                    "Constantly"
+                ],
+                "metric": "anxiety",
+                "scores": {
+                    "No pressure at all": False,
+                    "Mild pressure": False,
+                    "Quite often": True,
+                    "Constantly": True
+                }
+            },
+            {
+                "id": "twitter_wellbeing",
+                "text": "Does Twitter support or hinder your daily focus and well-being?",
+                "options": [
+                    "It helps me stay sharp and informed",
+                    "It's neutral",
+                    "It's a bit distracting",
+                    "It affects my focus significantly"
+                ]
+            },
+            {
+                "id": "twitter_safety",
+                "text": "How safe or respected do you feel on Twitter?",
+                "options": [
+                    "Very safe and respected",
+                    "Mostly okay",
+                    "Sometimes judged or misunderstood",
+                    "Often exposed to negativity"
+                ]
+            },
+            {
+                "id": "twitter_strategies",
+                "text": "Are you open to strategies that help reduce online stress?",
+                "options": [
+                    "Definitely",
+                    "Maybe",
+                    "I'm thinking about it",
+                    "Not right now"
+                ]
+            }
+        ]
+    },
+    "YouTube": {
+        "emoji": "🎬",
+        "questions": [
+            {
+                "id": "youtube_frequency",
+                "text": "How much time do you spend on YouTube daily?",
+                "options": [
+                    "Less than 30 minutes",
+                    "30 minutes to 1 hour",
+                    "1-2 hours",
+                    "More than 2 hours"
+                ]
+            },
+            {
+                "id": "youtube_content",
+                "text": "What type of content do you typically watch?",
+                "options": [
+                    "Educational/informational",
+                    "Entertainment/comedy",
+                    "Music/relaxation",
+                    "Mixed content"
+                ]
+            },
+            {
+                "id": "youtube_behavior",
+                "text": "How do you usually navigate YouTube?",
+                "options": [
+                    "I search for specific videos",
+                    "I browse my subscriptions",
+                    "I follow recommended videos",
+                    "I watch trending content"
+                ]
+            },
+            {
+                "id": "youtube_feelings",
+                "text": "How do you feel after watching YouTube?",
+                "options": [
+                    "Informed or inspired",
+                    "Entertained and relaxed",
+                    "Sometimes distracted",
+                    "Often like I've wasted time"
+                ],
+                "metric": "mood",
+                "scores": {
+                    "Informed or inspired": 5,
+                    "Entertained and relaxed": 4,
+                    "Sometimes distracted": 2,
+                    "Often like I've wasted time": 1
+                }
+            },
+            {
+                "id": "youtube_breaks",
+                "text": "Do you take breaks between videos?",
+                "options": [
+                    "Yes, regularly",
+                    "Sometimes",
+                    "Rarely",
+                    "I usually watch continuously"
+                ]
+            },
+            {
+                "id": "youtube_comparison",
+                "text": "Do you ever compare yourself to content creators?",
+                "options": [
+                    "Never",
+                    "Occasionally",
+                    "Sometimes",
+                    "Frequently"
+                ]
+            },
+            {
+                "id": "youtube_balance",
+                "text": "How well do you balance YouTube with other activities?",
+                "options": [
+                    "Very well - it's just one of many activities",
+                    "Fairly well",
+                    "Could be better",
+                    "It often takes priority over other things"
+                ],
+                "metric": "stress",
+                "scores": {
+                    "Very well - it's just one of many activities": 1,
+                    "Fairly well": 2,
+                    "Could be better": 3,
+                    "It often takes priority over other things": 5
+                }
+            },
+            {
+                "id": "youtube_sleep",
+                "text": "Does YouTube ever affect your sleep?",
+                "options": [
+                    "Never",
+                    "Rarely",
+                    "Sometimes",
+                    "Often"
+                ],
+                "metric": "anxiety",
+                "scores": {
+                    "Never": False,
+                    "Rarely": False,
+                    "Sometimes": True,
+                    "Often": True
+                }
+            },
+            {
+                "id": "youtube_suggestions",
+                "text": "Would you like suggestions for healthier YouTube habits?",
+                "options": [
+                    "Yes, definitely",
+                    "Maybe",
+                    "Not sure",
+                    "No"
+                ]
+            }
+        ]
+    },
+    "TikTok": {
+        "emoji": "🎵",
+        "questions": [
+            {
+                "id": "tiktok_frequency",
+                "text": "How much time do you spend on TikTok daily?",
+                "options": [
+                    "Less than 30 minutes",
+                    "30 minutes to 1 hour",
+                    "1-2 hours",
+                    "More than 2 hours"
+                ]
+            },
+            {
+                "id": "tiktok_content",
+                "text": "What kind of videos fill most of your For You feed?",
+                "options": [
+                    "Learning, tips and how-tos",
+                    "Comedy and entertainment",
+                    "Lifestyle, beauty or fitness",
+                    "A bit of everything"
+                ]
+            },
+            {
+                "id": "tiktok_scrolling",
+                "text": "How often do you keep scrolling longer than you meant to?",
+                "options": [
+                    "Rarely",
+                    "Sometimes",
+                    "Often",
+                    "Almost every time"
+                ],
+                "metric": "stress",
+                "scores": {
+                    "Rarely": 1,
+                    "Sometimes": 2,
+                    "Often": 4,
+                    "Almost every time": 5
+                }
+            },
+            {
+                "id": "tiktok_feeling",
+                "text": "How do you usually feel after a TikTok session?",
+                "options": [
+                    "Entertained and upbeat",
+                    "Neutral",
+                    "A bit restless or scattered",
+                    "Drained or low"
+                ],
+                "metric": "mood",
+                "scores": {
+                    "Entertained and upbeat": 5,
+                    "Neutral": 3,
+                    "A bit restless or scattered": 2,
+                    "Drained or low": 1
+                }
+            },
+            {
+                "id": "tiktok_focus",
+                "text": "Do you find it harder to focus on longer tasks after using TikTok?",
+                "options": [
+                    "Not at all",
+                    "Slightly",
+                    "Noticeably",
+                    "Very much"
+                ]
+            },
+            {
+                "id": "tiktok_comparison",
+                "text": "Do trends or creators make you feel you should look or live differently?",
+                "options": [
+                    "Never",
+                    "Occasionally",
+                    "Frequently",
+                    "Almost always"
+                ],
+                "metric": "anxiety",
+                "scores": {
+                    "Never": False,
+                    "Occasionally": False,
+                    "Frequently": True,
+                    "Almost always": True
+                }
+            },
+            {
+                "id": "tiktok_sleep",
+                "text": "Does late-night scrolling on TikTok cut into your sleep?",
+                "options": [
+                    "Never",
+                    "Rarely",
+                    "Sometimes",
+                    "Often"
+                ]
+            },
+            {
+                "id": "tiktok_posting",
+                "text": "How do you feel about the views and likes on your own videos?",
+                "options": [
+                    "I don't post",
+                    "I don't pay much attention",
+                    "I check them now and then",
+                    "They affect my mood"
+                ]
+            },
+            {
+                "id": "tiktok_breaks",
+                "text": "Would you like help setting limits on your TikTok use?",
+                "options": [
+                    "Yes, definitely",
+                    "Maybe",
+                    "Not sure",
+                    "No"
+                ]
+            }
+        ]
+    }
+}
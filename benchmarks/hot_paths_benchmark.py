@@ -0,0 +1,234 @@
+"""Benchmark the data and scoring hot paths of utils.data_utils.
+
+Each dataset size runs in a fresh temporary working directory with
+synthetic, seeded data, so runs are reproducible and need no network or
+existing data/. Streamlit's session is replaced by a plain dict. Run from
+the repository root:
+
+    python -m benchmarks.hot_paths_benchmark run --sizes 100 1000 10000 --output before.json
+    python -m benchmarks.hot_paths_benchmark run --output after.json
+    python -m benchmarks.hot_paths_benchmark compare before.json after.json --threshold 0.2
+
+compare exits with status 1 when any benchmark's median latency grew by
+more than the threshold.
+"""
+import os
+import sys
+import json
+import time
+import types
+import random
+import shutil
+import argparse
+import datetime
+import platform
+import tempfile
+import statistics
+
+# Keep the background retraining worker from training in the middle of a measurement
+os.environ.setdefault("RETRAIN_MIN_NEW_ROWS", str(10 ** 12))
+os.environ.setdefault("RETRAIN_DRIFT_MIN_ROWS", str(10 ** 12))
+os.environ.setdefault("RETRAIN_CHECK_INTERVAL", str(10 ** 6))
+
+from utils import data_utils, storage_utils
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000, 1000000]
+PLATFORMS = ["Instagram", "Facebook", "Twitter", "Snapchat", "YouTube"]
+TIMES = ["Less than 30 minutes", "30 minutes to 1 hour", "1-2 hours", "2-3 hours", "More than 3 hours"]
+IMPACTS = ["Positive", "Neutral", "Negative"]
+
+def make_response(rng):
+    """Generate one synthetic questionnaire response in the app's format"""
+    response = {
+        "mood": rng.randint(1, 5),
+        "sleep": rng.randint(1, 5),
+        "stress": rng.randint(1, 5),
+        "anxiety": rng.random() < 0.3,
+        "date": "2025-04-21 06:09:24"
+    }
+    if rng.random() < 0.8:
+        response["platform"] = rng.choice(PLATFORMS)
+        response["platform_time"] = rng.choice(TIMES)
+        response["content_impact"] = rng.choice(IMPACTS)
+    return response
+
+def make_responses(count, seed=0):
+    rng = random.Random(seed)
+    return [make_response(rng) for _ in range(count)]
+
+def summarize(name, size, durations, items_per_call=1):
+    """Return one result record for a list of per-call durations in seconds"""
+    ordered = sorted(durations)
+    median = statistics.median(ordered)
+    return {
+        "benchmark": name,
+        "size": size,
+        "calls": len(ordered),
+        "items_per_call": items_per_call,
+        "min_s": ordered[0],
+        "median_s": median,
+        "mean_s": statistics.fmean(ordered),
+        "p95_s": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "throughput_per_s": items_per_call / median if median > 0 else None
+    }
+
+def time_calls(func, calls, setup=None):
+    """Call func `calls` times and return each call's duration in seconds"""
+    durations = []
+    for _ in range(calls):
+        args = setup() if setup else ()
+        start = time.perf_counter()
+        func(*args)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+def fake_streamlit(session_state):
+    """The parts of the streamlit module data_utils uses outside a page"""
+    return types.SimpleNamespace(session_state=session_state, error=lambda message: print(message, file=sys.stderr))
+
+def bench_size(size, calls, per_row_cap, seed):
+    """Run every benchmark against a dataset of `size` records; return result records"""
+    results = []
+    responses = make_responses(size, seed)
+    new_responses = make_responses(calls, seed + 1)
+
+    # Dataset log the app would have accumulated
+    with open(data_utils.ML_DATASET_LOG_FILE, "w") as f:
+        f.writelines(json.dumps(response) + "\n" for response in responses)
+
+    user = storage_utils.create_user(f"bench{size}@example.com", "Bench", "x")
+    session_state = {
+        "user_name": "Bench",
+        "mood_data": list(responses),
+        "current_responses": {},
+        "current_step": 1,
+        "authenticated": True,
+        "user_id": user["id"],
+        "user_email": user["email"]
+    }
+    data_utils.st = fake_streamlit(session_state)
+
+    # First training builds the columnar store and statistics from the log
+    results.append(summarize("train_ml_model_cold", size, time_calls(data_utils.train_ml_model, 1), size))
+    results.append(summarize("train_ml_model", size, time_calls(data_utils.train_ml_model, 3), size))
+
+    sample = iter(new_responses)
+    results.append(summarize("predict_ml_score", size, time_calls(
+        data_utils.predict_ml_score, calls, lambda: (next(sample),))))
+    batch = responses[:per_row_cap]
+    results.append(summarize("predict_ml_scores", size, time_calls(
+        data_utils.predict_ml_scores, 3, lambda: (batch,)), len(batch)))
+
+    sample = iter(new_responses)
+    results.append(summarize("save_to_ml_dataset", size, time_calls(
+        data_utils.save_to_ml_dataset, calls, lambda: (dict(next(sample)),))))
+
+    sample = iter(new_responses)
+    results.append(summarize("save_user_data", size, time_calls(
+        data_utils.save_user_data, calls, lambda: (dict(next(sample)),))))
+
+    # Cold builds invalidate the session's derived-data cache before each call
+    def invalidate():
+        data_utils.bump_history_version()
+        return ()
+    results.append(summarize("get_mood_data_as_df", size, time_calls(
+        data_utils.get_mood_data_as_df, 3, invalidate), size))
+    results.append(summarize("get_mood_data_as_df_cached", size, time_calls(
+        data_utils.get_mood_data_as_df, calls), size))
+
+    # The per-row function is timed on a capped sample so 1M-row runs stay practical
+    rows = session_state["mood_data"][:per_row_cap]
+    results.append(summarize("calculate_wellbeing_score", size, time_calls(
+        lambda: [data_utils.calculate_wellbeing_score(row) for row in rows], 3), len(rows)))
+    df = data_utils.get_mood_data_as_df()
+    results.append(summarize("calculate_wellbeing_scores", size, time_calls(
+        data_utils.calculate_wellbeing_scores, 3, lambda: (df,)), len(df)))
+
+    results.append(summarize("export_user_data_csv", size, time_calls(data_utils.export_user_data_csv, 3), size))
+    return results
+
+def run(args):
+    original_dir = os.getcwd()
+    original_st = data_utils.st
+    results = []
+    try:
+        for size in args.sizes:
+            work_dir = tempfile.mkdtemp(prefix="hot_paths_bench_")
+            try:
+                os.chdir(work_dir)
+                os.makedirs(data_utils.DATA_DIR)
+                size_results = bench_size(size, args.calls, args.per_row_cap, args.seed)
+            finally:
+                os.chdir(original_dir)
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+            for result in size_results:
+                print(f"{result['benchmark']:<28} {size:>9} {result['median_s'] * 1000:>12.3f} ms"
+                      f" {result['throughput_per_s'] or 0:>14,.0f} /s")
+            results.extend(size_results)
+    finally:
+        data_utils.st = original_st
+        data_utils.get_retrain_worker().stop()
+
+    report = {
+        "created_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+def compare(args):
+    with open(args.baseline, "r") as f:
+        baseline = {(r["benchmark"], r["size"]): r for r in json.load(f)["results"]}
+    with open(args.current, "r") as f:
+        current = json.load(f)["results"]
+
+    regressions = 0
+    print(f"{'benchmark':<28} {'size':>9} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for result in current:
+        key = (result["benchmark"], result["size"])
+        if key not in baseline:
+            continue
+        before = baseline[key]["median_s"]
+        after = result["median_s"]
+        change = (after - before) / before if before > 0 else 0.0
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{key[0]:<28} {key[1]:>9} {before * 1000:>12.3f} {after * 1000:>12.3f} {change:>+8.1%}{flag}")
+
+    print(f"{regressions} regression(s) above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks and write a JSON report")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    run_parser.add_argument("--calls", type=int, default=200,
+                            help="Calls per benchmark for the per-request paths")
+    run_parser.add_argument("--per-row-cap", type=int, default=100000,
+                            help="Largest sample for the per-row scoring benchmarks")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--output", default="benchmark_results.json")
+
+    compare_parser = commands.add_parser("compare", help="Compare two reports and flag regressions")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.2,
+                                help="Relative median slowdown that counts as a regression")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+    else:
+        sys.exit(compare(args))
+
+if __name__ == "__main__":
+    main()
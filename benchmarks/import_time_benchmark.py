@@ -0,0 +1,110 @@
+"""Measure the cold-start import time of each Streamlit page.
+
+Each page's top-level imports are read with ast and run in a fresh
+interpreter under `python -X importtime`, so the numbers are what a new
+worker pays before the page's own code starts. The page body is not
+executed. Run from the repository root:
+
+    python -m benchmarks.import_time_benchmark --repeat 5
+    python -m benchmarks.import_time_benchmark --json import_times.json
+"""
+import os
+import re
+import ast
+import sys
+import glob
+import json
+import argparse
+import statistics
+import subprocess
+
+# Heavy dependencies worth calling out when a page pulls them in
+WATCHED_MODULES = ["streamlit", "pandas", "numpy", "pyarrow", "altair", "joblib", "sklearn", "openai"]
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+def page_files(root="."):
+    """Return app.py followed by the pages in sidebar order"""
+    return [os.path.join(root, "app.py")] + sorted(glob.glob(os.path.join(root, "pages", "*.py")))
+
+def top_level_imports(path):
+    """Return the source of a file's module-level import statements"""
+    with open(path, "r") as f:
+        source = f.read()
+    tree = ast.parse(source, filename=path)
+    return "\n".join(
+        ast.get_source_segment(source, node)
+        for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+    )
+
+def parse_importtime(output):
+    """Return (total_us, {module: cumulative_us}) from -X importtime output"""
+    total = 0
+    cumulative = {}
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative_us, indent, name = match.groups()
+        # Each module is reported once, where it was first imported
+        cumulative.setdefault(name, int(cumulative_us))
+        if len(indent) == 1:
+            total += int(cumulative_us)
+    return total, cumulative
+
+class ImportFailed(RuntimeError):
+    """A page's imports raised in the child interpreter"""
+
+def stderr_tail(stderr, lines=5):
+    """Return the last lines of a child's stderr, without the importtime report"""
+    kept = [line for line in stderr.strip().splitlines() if not line.startswith("import time:")]
+    return "\n".join(kept[-lines:])
+
+def measure(imports, root="."):
+    """Import `imports` in a fresh interpreter and return parse_importtime's result"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", imports],
+        cwd=root, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise ImportFailed(stderr_tail(result.stderr))
+    return parse_importtime(result.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per page; the median is reported")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'page':<28} {'import (ms)':>12}  heavy modules (ms)")
+    for path in page_files():
+        name = os.path.relpath(path)
+        imports = top_level_imports(path)
+        try:
+            runs = [measure(imports) for _ in range(args.repeat)]
+        except ImportFailed as e:
+            # Report the page and keep measuring the others
+            results[name] = {"error": str(e)}
+            reason = (str(e).splitlines() or ["no error output"])[-1]
+            print(f"{name:<28} {'failed':>12}  {reason}")
+            continue
+        total_ms = statistics.median(total for total, _ in runs) / 1000
+        heavy = {
+            module: statistics.median(modules.get(module, 0) for _, modules in runs) / 1000
+            for module in WATCHED_MODULES
+            if module in runs[0][1]
+        }
+
+        results[name] = {"import_ms": total_ms, "modules_ms": heavy}
+        summary = ", ".join(f"{module} {ms:.0f}" for module, ms in heavy.items())
+        print(f"{name:<28} {total_ms:>12.1f}  {summary}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 1 if any("error" in result for result in results.values()) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
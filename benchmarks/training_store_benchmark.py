@@ -0,0 +1,130 @@
+"""Compare train_ml_model's original DataFrame path against its current paths.
+
+A routine retrain solves the fit from the saved regression statistics
+(RegressionStats.to_sklearn) without reading the dataset. The columnar store
+is only read when the statistics are rebuilt from scratch (stats_from_store),
+so that is timed separately. "store fit" is the earlier path that fitted
+sklearn on the memory-mapped store, kept for comparison. Run from the
+repository root:
+
+    python -m benchmarks.training_store_benchmark --sizes 10000 100000 1000000
+"""
+import os
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import StandardScaler
+from utils import training_store
+from utils.feature_encoder import FeatureEncoder
+from utils.online_trainer import RegressionStats, stats_from_store
+
+PLATFORMS = ["Instagram", "Facebook", "Twitter", "Snapchat", "YouTube", None]
+
+def make_responses(count, seed=0):
+    """Generate synthetic questionnaire responses in the dataset's format"""
+    rng = random.Random(seed)
+    responses = []
+    for _ in range(count):
+        responses.append({
+            "mood": rng.randint(1, 5),
+            "sleep": rng.randint(1, 5),
+            "stress": rng.randint(1, 5),
+            "anxiety": rng.random() < 0.3,
+            "platform": rng.choice(PLATFORMS),
+            "date": "2025-04-21 06:09:24"
+        })
+    return responses
+
+def legacy_train(dataset_file):
+    """The original train_ml_model: load the JSON document, build a DataFrame and walk it with iterrows()"""
+    with open(dataset_file, "r") as f:
+        dataset = json.load(f)
+
+    df = pd.DataFrame(dataset["responses"])
+    features = []
+    target = []
+    for _, row in df.iterrows():
+        feature_dict = {
+            "mood": row.get("mood", 3),
+            "sleep": row.get("sleep", 3),
+            "stress": row.get("stress", 3),
+            "anxiety": 1 if row.get("anxiety", False) else 0
+        }
+        if "platform" in row:
+            platform = row["platform"].lower() if row["platform"] else "none"
+            feature_dict["platform_" + platform] = 1
+        features.append(feature_dict)
+
+        stress = 6 - row.get("stress", 3)
+        anxiety = 0 if row.get("anxiety", False) else 1
+        wellbeing_score = (row.get("mood", 3) * 0.4) + (row.get("sleep", 3) * 0.3) + (stress * 0.2) + (anxiety * 0.1)
+        target.append(round((wellbeing_score / 5) * 100))
+
+    X = pd.get_dummies(pd.DataFrame(features).fillna(0), drop_first=True)
+    model = LinearRegression().fit(StandardScaler().fit_transform(X), np.array(target))
+    return model
+
+def store_train(store_dir):
+    """The earlier columnar path: memory-map the store and fit sklearn on the feature matrix"""
+    columns, meta = training_store.load_columns(store_dir)
+    X = FeatureEncoder().fit_vocabulary(meta).encode_columns(columns, meta["platforms"])
+    y = training_store.wellbeing_targets(columns)
+    model = LinearRegression().fit(StandardScaler().fit_transform(X), y)
+    return model
+
+def stats_rebuild(store_dir, stats_file):
+    """Recompute the regression statistics from the whole store, as the first training does"""
+    stats_from_store(store_dir).save(stats_file)
+
+def stats_train(stats_file):
+    """What train_ml_model does on every retrain: load the statistics and solve the fit"""
+    return RegressionStats.load(stats_file).to_sklearn()
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--skip-legacy-above", type=int, default=None,
+                        help="Skip the slow legacy path for sizes above this")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="training_store_bench_")
+    try:
+        print(f"{'rows':>10} {'legacy (s)':>12} {'store fit (s)':>14} {'stats rebuild (s)':>18} "
+              f"{'retrain (s)':>12} {'speedup':>9}")
+        for size in args.sizes:
+            responses = make_responses(size)
+            dataset_file = os.path.join(work_dir, "ml_dataset.json")
+            with open(dataset_file, "w") as f:
+                json.dump({"responses": responses}, f)
+            store_dir = os.path.join(work_dir, "training_store")
+            training_store.rebuild(responses, store_dir)
+            del responses
+
+            stats_file = os.path.join(work_dir, "regression_stats.npz")
+            store_time = timed(store_train, store_dir)
+            rebuild_time = timed(stats_rebuild, store_dir, stats_file)
+            retrain_time = timed(stats_train, stats_file)
+            times = f"{store_time:>14.3f} {rebuild_time:>18.3f} {retrain_time:>12.4f}"
+            if args.skip_legacy_above is not None and size > args.skip_legacy_above:
+                print(f"{size:>10} {'skipped':>12} {times} {'-':>9}")
+                continue
+
+            # Speedup of a routine retrain over the original path
+            legacy_time = timed(legacy_train, dataset_file)
+            print(f"{size:>10} {legacy_time:>12.3f} {times} {legacy_time / retrain_time:>8.0f}x")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
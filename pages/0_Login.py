@@ -1,11 +1,8 @@
 import streamlit as st
-import json
-import os
 import hashlib
 import re
-import pandas as pd
-import datetime
-from utils.data_utils import initialize_session_state
+from utils.data_utils import initialize_session_state, bump_history_version
+from utils.storage_utils import get_user, create_user, load_mood_data, HISTORY_LOAD_LIMIT
 
 # Page configuration
 st.set_page_config(
@@ -17,30 +14,6 @@ st.set_page_config(
 # Initialize session state
 initialize_session_state()
 
-# Set up data directory if it doesn't exist
-DATA_DIR = "data"
-USER_DATA_FILE = os.path.join(DATA_DIR, "users.json")
-
-if not os.path.exists(DATA_DIR):
-    os.makedirs(DATA_DIR)
-
-if not os.path.exists(USER_DATA_FILE):
-    with open(USER_DATA_FILE, "w") as f:
-        json.dump({}, f)
-
-def load_users():
-    """Load user data from JSON file"""
-    try:
-        with open(USER_DATA_FILE, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        return {}
-
-def save_users(users):
-    """Save user data to JSON file"""
-    with open(USER_DATA_FILE, "w") as f:
-        json.dump(users, f)
-
 def hash_password(password):
     """Create a secure hash of the password"""
     return hashlib.sha256(password.encode()).hexdigest()
@@ -107,23 +80,17 @@ def login_page():
         if not login_email or not login_password:
             st.error("Please enter both email and password")
         else:
-            users = load_users()
+            user = get_user(login_email)
             
-            if login_email in users and users[login_email]["password"] == hash_password(login_password):
+            if user is not None and user["password"] == hash_password(login_password):
                 st.session_state["authenticated"] = True
                 st.session_state["user_email"] = login_email
-                st.session_state["user_name"] = users[login_email]["name"]
-                st.session_state["user_id"] = users[login_email]["id"]
+                st.session_state["user_name"] = user["name"]
+                st.session_state["user_id"] = user["id"]
                 
                 # Load user mood data if exists
-                user_data_file = os.path.join(DATA_DIR, f"user_{users[login_email]['id']}.json")
-                if os.path.exists(user_data_file):
-                    try:
-                        with open(user_data_file, "r") as f:
-                            user_data = json.load(f)
-                            st.session_state["mood_data"] = user_data.get("mood_data", [])
-                    except (json.JSONDecodeError, FileNotFoundError):
-                        st.session_state["mood_data"] = []
+                st.session_state["mood_data"] = load_mood_data(user["id"], limit=HISTORY_LOAD_LIMIT)
+                bump_history_version()
                 
                 st.success("Login successful!")
                 st.switch_page("app.py")
@@ -218,28 +185,12 @@ def signup_page():
             if not password_valid:
                 st.error(message)
             else:
-                users = load_users()
+                user = create_user(signup_email, signup_name, hash_password(signup_password))
                 
-                if signup_email in users:
+                if user is None:
                     st.error("Email already exists. Please use a different email or login.")
                 else:
-                    # Generate a unique user ID
-                    user_id = str(len(users) + 1).zfill(6)
-                    
-                    # Add the new user
-                    users[signup_email] = {
-                        "id": user_id,
-                        "name": signup_name,
-                        "password": hash_password(signup_password),
-                        "created_at": str(datetime.datetime.now())
-                    }
-                    
-                    save_users(users)
-                    
-                    # Create user data file
-                    user_data_file = os.path.join(DATA_DIR, f"user_{user_id}.json")
-                    with open(user_data_file, "w") as f:
-                        json.dump({"mood_data": []}, f)
+                    user_id = user["id"]
                     
                     st.success(f"Account created successfully for {signup_name}!")
                     
@@ -249,6 +200,7 @@ def signup_page():
                     st.session_state["user_name"] = signup_name
                     st.session_state["user_id"] = user_id
                     st.session_state["mood_data"] = []
+                    bump_history_version()
                     
                     # Redirect to main app
                     st.info("Redirecting to your dashboard...")
@@ -1,6 +1,10 @@
+import time
 import streamlit as st
+from concurrent.futures import wait
 from utils.data_utils import initialize_session_state
-from utils.suggestions_generator import generate_wellness_suggestions
+from utils.suggestions_generator import generate_wellness_suggestions, daily_seed
+from utils.suggestion_service import (llm_enabled, start_suggestion_job, get_precomputed_suggestions,
+                                      SUGGESTION_DEADLINE, SUGGESTION_LATE_WAIT)
 from utils.ui_utils import display_wellbeing_score
 
 # Page configuration
@@ -17,6 +21,8 @@ initialize_session_state()
 if not st.session_state.get("authenticated", False):
     st.switch_page("pages/0_Login.py")
 
+PENDING_MESSAGE = "✨ More personalized suggestions are on the way..."
+
 def main():
     st.markdown("<h1 style='text-align: center;'>AI-Based Suggestions</h1>", unsafe_allow_html=True)
     
@@ -109,29 +115,45 @@ def main():
     st.markdown("---")
     st.subheader("Personalized Suggestions For You")
     
-    # Generate or retrieve suggestions
-    if "ai_suggestions" not in st.session_state or not st.session_state["ai_suggestions"]:
-        with st.spinner("Generating personalized suggestions..."):
-            platform = latest_entry.get("platform", None)
-            suggestions = generate_wellness_suggestions(latest_entry, platform)
-            st.session_state["ai_suggestions"] = suggestions
-    else:
-        suggestions = st.session_state["ai_suggestions"]
-    
-    # Display suggestions in cards
-    if len(suggestions) > 0:
-        # Distribute suggestions evenly in columns
-        cols = st.columns(min(3, len(suggestions)))
-        for i, suggestion in enumerate(suggestions):
-            with cols[i % len(cols)]:
-                st.markdown(f"""
-                <div style="background-color: #f0f2f6; border-radius: 10px; padding: 15px; margin-bottom: 10px; height: 100%;">
-                    <h3>{suggestion.get('emoji', '✨')} {suggestion.get('title', 'Suggestion')}</h3>
-                    <p>{suggestion.get('description', '')}</p>
-                </div>
-                """, unsafe_allow_html=True)
-    else:
-        st.info("No suggestions available. Try completing a new assessment.")
+    # Rule-based suggestions are shown at once; the model's replace them when they arrive
+    entry_key = latest_entry.get("date")
+    suggestion_round = st.session_state.get("suggestion_round", 0)
+    job = st.session_state.get("suggestion_job")
+    if job is not None and (job["entry"] != entry_key or job["round"] != suggestion_round):
+        # Started for an older check-in or before a refresh
+        st.session_state.pop("suggestion_job", None)
+        job = None
+    
+    # Precomputed suggestions need no model request; "Get New Suggestions" asks the model again
+    precomputed = None
+    if not st.session_state["ai_suggestions"] and suggestion_round == 0:
+        precomputed = get_precomputed_suggestions(latest_entry)
+    if precomputed:
+        st.session_state["ai_suggestions"] = precomputed
+        st.session_state.pop("suggestion_job", None)
+        job = None
+    elif not st.session_state["ai_suggestions"]:
+        platform = latest_entry.get("platform", None)
+        # Seeded per user, day and refresh so reruns show the same suggestions
+        seed = f"{daily_seed(st.session_state.get('user_id'))}:{suggestion_round}"
+        st.session_state["ai_suggestions"] = generate_wellness_suggestions(latest_entry, platform, seed=seed)
+        if llm_enabled():
+            # The questionnaire usually prefetched this request when the check-in was saved
+            if job is None:
+                job = start_suggestion_job(latest_entry, suggestion_round)
+                st.session_state["suggestion_job"] = job
+            # A fast, cached or prefetched response is shown straight away
+            wait([job["future"]], timeout=SUGGESTION_DEADLINE)
+    
+    if job is not None and job["future"].done():
+        take_llm_suggestions(job)
+        job = None
+    
+    status_area = st.empty()
+    if job is not None:
+        status_area.caption(PENDING_MESSAGE)
+    suggestions_area = st.empty()
+    render_suggestions(suggestions_area, st.session_state["ai_suggestions"])
     
     # Bottom section: Motivation
     st.markdown("---")
@@ -150,6 +172,7 @@ def main():
         if st.button("Get New Suggestions", key="refresh_suggestions"):
             # Clear existing suggestions to generate new ones
             st.session_state["ai_suggestions"] = []
+            st.session_state["suggestion_round"] = st.session_state.get("suggestion_round", 0) + 1
             st.rerun()
     
     with col2:
@@ -161,6 +184,47 @@ def main():
             st.session_state["current_step"] = 1
             st.session_state["current_responses"] = {}
             st.switch_page("pages/1_Questionnaire.py")
+    
+    # The page is fully rendered; wait a little longer for a slow model response.
+    # Streamlit only notices button clicks at st calls, so wait in short slices.
+    if job is not None:
+        give_up = time.monotonic() + SUGGESTION_LATE_WAIT
+        while not job["future"].done() and time.monotonic() < give_up:
+            status_area.caption(PENDING_MESSAGE)
+            wait([job["future"]], timeout=0.5)
+        if job["future"].done():
+            take_llm_suggestions(job)
+            status_area.empty()
+            render_suggestions(suggestions_area, st.session_state["ai_suggestions"])
+
+def take_llm_suggestions(job):
+    """Replace the shown suggestions with a finished model request's, unless it failed"""
+    st.session_state.pop("suggestion_job", None)
+    try:
+        suggestions = job["future"].result()
+    except Exception as e:
+        print(f"Error generating AI suggestions, keeping rule-based ones: {e}")
+        return
+    if suggestions:
+        st.session_state["ai_suggestions"] = suggestions
+
+def render_suggestions(area, suggestions):
+    """Draw the suggestion cards into an st.empty() placeholder, replacing what it held"""
+    with area.container():
+        # Display suggestions in cards
+        if len(suggestions) > 0:
+            # Distribute suggestions evenly in columns
+            cols = st.columns(min(3, len(suggestions)))
+            for i, suggestion in enumerate(suggestions):
+                with cols[i % len(cols)]:
+                    st.markdown(f"""
+                    <div style="background-color: #f0f2f6; border-radius: 10px; padding: 15px; margin-bottom: 10px; height: 100%;">
+                        <h3>{suggestion.get('emoji', '✨')} {suggestion.get('title', 'Suggestion')}</h3>
+                        <p>{suggestion.get('description', '')}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+        else:
+            st.info("No suggestions available. Try completing a new assessment.")
 
 if __name__ == "__main__":
     main()
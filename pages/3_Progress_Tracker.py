@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
 import altair as alt
-from utils.data_utils import initialize_session_state, get_mood_data_as_df, calculate_wellbeing_score
+from utils.data_utils import initialize_session_state, get_scored_mood_data_df, get_derived_history
 
 # Page configuration
 st.set_page_config(
@@ -17,6 +17,74 @@ initialize_session_state()
 if not st.session_state.get("authenticated", False):
     st.switch_page("pages/0_Login.py")
 
+def build_progress_charts(df):
+    """Build the progress charts for a scored mood DataFrame"""
+    charts = {}
+    
+    # Wellbeing score chart
+    charts["wellbeing"] = alt.Chart(df).mark_line(point=True).encode(
+        x=alt.X('date:T', title='Date'),
+        y=alt.Y('wellbeing_score:Q', title='Wellbeing Score', scale=alt.Scale(domain=[0, 100])),
+        tooltip=['date:T', 'wellbeing_score:Q']
+    ).properties(
+        title='Wellbeing Score Trend',
+        height=300
+    ).interactive()
+    
+    # Mood and sleep chart
+    if 'mood' in df.columns and 'sleep' in df.columns:
+        mood_sleep_df = df[['date', 'mood', 'sleep']].copy()
+        # Reshape for Altair
+        mood_sleep_df = pd.melt(mood_sleep_df, id_vars=['date'], value_vars=['mood', 'sleep'])
+        
+        charts["mood_sleep"] = alt.Chart(mood_sleep_df).mark_line(point=True).encode(
+            x=alt.X('date:T', title='Date'),
+            y=alt.Y('value:Q', title='Rating (1-5)'),
+            color=alt.Color('variable:N', title='Metric', 
+                            scale=alt.Scale(domain=['mood', 'sleep'], 
+                                            range=['#6C5CE7', '#00b894'])),
+            tooltip=['date:T', 'variable:N', 'value:Q']
+        ).properties(
+            title='Mood & Sleep Quality',
+            height=300
+        ).interactive()
+    
+    # Stress and anxiety chart
+    if 'stress' in df.columns and 'anxiety' in df.columns:
+        stress_anxiety_df = df[['date', 'stress']].copy()
+        # Convert boolean anxiety to numeric
+        stress_anxiety_df['anxiety_numeric'] = df['anxiety'].apply(lambda x: 1 if x else 0)
+        stress_anxiety_df = pd.melt(stress_anxiety_df, id_vars=['date'], 
+                                 value_vars=['stress', 'anxiety_numeric'])
+        
+        # Rename for better labels
+        stress_anxiety_df['variable'] = stress_anxiety_df['variable'].replace({
+            'stress': 'Stress Level', 
+            'anxiety_numeric': 'Anxiety Present'
+        })
+        
+        charts["stress"] = alt.Chart(stress_anxiety_df[stress_anxiety_df['variable'] == 'Stress Level']).mark_line(point=True).encode(
+            x=alt.X('date:T', title='Date'),
+            y=alt.Y('value:Q', title='Rating (1-5)'),
+            color=alt.value('#e74c3c'),
+            tooltip=['date:T', 'value:Q']
+        ).properties(
+            title='Stress Level Trend',
+            height=300
+        ).interactive()
+        
+        charts["anxiety"] = alt.Chart(stress_anxiety_df[stress_anxiety_df['variable'] == 'Anxiety Present']).mark_bar().encode(
+            x=alt.X('date:T', title='Date'),
+            y=alt.Y('value:Q', title='Anxiety (0=No, 1=Yes)'),
+            color=alt.value('#f39c12'),
+            tooltip=['date:T', 'value:Q']
+        ).properties(
+            title='Anxiety Occurrences',
+            height=150
+        ).interactive()
+    
+    return charts
+
 def main():
     st.markdown("<h1 style='text-align: center;'>Progress Tracker</h1>", unsafe_allow_html=True)
     st.write("Here's your mental wellness journey over time")
@@ -28,32 +96,21 @@ def main():
             st.switch_page("pages/1_Questionnaire.py")
         return
     
-    # Get mood data as DataFrame
-    df = get_mood_data_as_df()
-    
-    # Calculate wellbeing scores for each entry
-    if not df.empty:
-        df['wellbeing_score'] = df.apply(calculate_wellbeing_score, axis=1)
+    # Get mood data as DataFrame, with a wellbeing score for each entry
+    df = get_scored_mood_data_df()
     
     # Top section: Charts
     st.subheader("📊 Your Progress Over Time")
     
     if len(df) >= 2:
+        # Built once per history change, not on every widget interaction
+        charts = get_derived_history("progress_charts", lambda: build_progress_charts(df))
+        
         # Multiple data points: show line chart
         tab1, tab2, tab3 = st.tabs(["Wellbeing Score", "Mood & Sleep", "Stress & Anxiety"])
         
         with tab1:
-            # Wellbeing score chart
-            wellbeing_chart = alt.Chart(df).mark_line(point=True).encode(
-                x=alt.X('date:T', title='Date'),
-                y=alt.Y('wellbeing_score:Q', title='Wellbeing Score', scale=alt.Scale(domain=[0, 100])),
-                tooltip=['date:T', 'wellbeing_score:Q']
-            ).properties(
-                title='Wellbeing Score Trend',
-                height=300
-            ).interactive()
-            
-            st.altair_chart(wellbeing_chart, use_container_width=True)
+            st.altair_chart(charts["wellbeing"], use_container_width=True)
             
             # Calculate improvement
             first_score = df.iloc[0]['wellbeing_score']
@@ -69,65 +126,15 @@ def main():
                 st.info("Your wellbeing score has remained stable.")
             
         with tab2:
-            # Mood and sleep chart
-            if 'mood' in df.columns and 'sleep' in df.columns:
-                mood_sleep_df = df[['date', 'mood', 'sleep']].copy()
-                # Reshape for Altair
-                mood_sleep_df = pd.melt(mood_sleep_df, id_vars=['date'], value_vars=['mood', 'sleep'])
-                
-                mood_sleep_chart = alt.Chart(mood_sleep_df).mark_line(point=True).encode(
-                    x=alt.X('date:T', title='Date'),
-                    y=alt.Y('value:Q', title='Rating (1-5)'),
-                    color=alt.Color('variable:N', title='Metric', 
-                                    scale=alt.Scale(domain=['mood', 'sleep'], 
-                                                    range=['#6C5CE7', '#00b894'])),
-                    tooltip=['date:T', 'variable:N', 'value:Q']
-                ).properties(
-                    title='Mood & Sleep Quality',
-                    height=300
-                ).interactive()
-                
-                st.altair_chart(mood_sleep_chart, use_container_width=True)
+            if "mood_sleep" in charts:
+                st.altair_chart(charts["mood_sleep"], use_container_width=True)
             else:
                 st.info("Mood and sleep data not available for all entries.")
             
         with tab3:
-            # Stress and anxiety chart
-            if 'stress' in df.columns and 'anxiety' in df.columns:
-                # Convert boolean anxiety to numeric
-                df['anxiety_numeric'] = df['anxiety'].apply(lambda x: 1 if x else 0)
-                stress_anxiety_df = df[['date', 'stress', 'anxiety_numeric']].copy()
-                stress_anxiety_df = pd.melt(stress_anxiety_df, id_vars=['date'], 
-                                         value_vars=['stress', 'anxiety_numeric'])
-                
-                # Rename for better labels
-                stress_anxiety_df['variable'] = stress_anxiety_df['variable'].replace({
-                    'stress': 'Stress Level', 
-                    'anxiety_numeric': 'Anxiety Present'
-                })
-                
-                stress_chart = alt.Chart(stress_anxiety_df[stress_anxiety_df['variable'] == 'Stress Level']).mark_line(point=True).encode(
-                    x=alt.X('date:T', title='Date'),
-                    y=alt.Y('value:Q', title='Rating (1-5)'),
-                    color=alt.value('#e74c3c'),
-                    tooltip=['date:T', 'value:Q']
-                ).properties(
-                    title='Stress Level Trend',
-                    height=300
-                ).interactive()
-                
-                anxiety_chart = alt.Chart(stress_anxiety_df[stress_anxiety_df['variable'] == 'Anxiety Present']).mark_bar().encode(
-                    x=alt.X('date:T', title='Date'),
-                    y=alt.Y('value:Q', title='Anxiety (0=No, 1=Yes)'),
-                    color=alt.value('#f39c12'),
-                    tooltip=['date:T', 'value:Q']
-                ).properties(
-                    title='Anxiety Occurrences',
-                    height=150
-                ).interactive()
-                
-                st.altair_chart(stress_chart, use_container_width=True)
-                st.altair_chart(anxiety_chart, use_container_width=True)
+            if "stress" in charts:
+                st.altair_chart(charts["stress"], use_container_width=True)
+                st.altair_chart(charts["anxiety"], use_container_width=True)
             else:
                 st.info("Stress and anxiety data not available for all entries.")
     
@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
 import altair as alt
-from utils.data_utils import initialize_session_state, get_mood_data_as_df
+from utils.data_utils import initialize_session_state, get_scored_mood_data_df, get_derived_history
 from utils.ui_utils import display_wellbeing_score
 
 # Page configuration
@@ -31,8 +31,8 @@ def main():
     # Top section: Timeline
     st.subheader("Ready for a quick reassessment? 👀")
     
-    # Get mood data
-    df = get_mood_data_as_df()
+    # Get mood data, with a wellbeing score for each entry
+    df = get_scored_mood_data_df()
     
     if not df.empty:
         # Create a timeline of previous evaluations
@@ -40,7 +40,9 @@ def main():
         
         # Format the date column for display
         if 'date' in df.columns:
-            df['formatted_date'] = pd.to_datetime(df['date']).dt.strftime('%b %d, %Y')
+            df['formatted_date'] = get_derived_history(
+                "formatted_dates", lambda: pd.to_datetime(df['date']).dt.strftime('%b %d, %Y')
+            )
         
         # Create a horizontal timeline
         dates = df['formatted_date'].tolist() if 'formatted_date' in df.columns else []
@@ -146,7 +148,7 @@ def main():
         with col1:
             st.markdown(f"### First Assessment")
             st.caption(first_data.get('formatted_date', 'Unknown date'))
-            display_wellbeing_score(first_data)
+            display_wellbeing_score(first_data, first_data['wellbeing_score'])
             
             # Display metrics
             if 'mood' in first_data:
@@ -166,7 +168,7 @@ def main():
         with col2:
             st.markdown(f"### Current Assessment")
             st.caption(second_data.get('formatted_date', 'Unknown date'))
-            display_wellbeing_score(second_data)
+            display_wellbeing_score(second_data, second_data['wellbeing_score'])
             
             # Display metrics with delta values
             if 'mood' in second_data and 'mood' in first_data:
@@ -0,0 +1,107 @@
+import streamlit as st
+import os
+import pandas as pd
+from utils.data_utils import initialize_session_state, get_model_cache_stats
+from utils.file_utils import get_lock_metrics
+from utils.openai_utils import get_suggestion_cache_stats
+from utils.metrics import get_metrics, reset_metrics, prometheus_text, write_prometheus_file, METRICS_FILE
+
+# Page configuration
+st.set_page_config(
+    page_title="Metrics | Mental Wellness Tracker",
+    page_icon="🌱",
+    layout="wide"
+)
+
+# Initialize session state
+initialize_session_state()
+
+# Comma-separated emails of the accounts allowed to see this page
+ADMIN_EMAILS = {email.strip().lower() for email in os.environ.get("ADMIN_EMAILS", "").split(",") if email.strip()}
+
+# Check if user is authenticated
+if not st.session_state.get("authenticated", False):
+    st.switch_page("pages/0_Login.py")
+
+if (st.session_state.get("user_email") or "").lower() not in ADMIN_EMAILS:
+    st.error("This page is only available to administrators.")
+    st.stop()
+
+def main():
+    st.markdown("<h1 style='text-align: center;'>Performance Metrics</h1>", unsafe_allow_html=True)
+    st.caption("Timings recorded by this server process since it started or since the last reset.")
+
+    # Function latencies
+    st.subheader("⏱️ Function Latency")
+    metrics = get_metrics()
+    rows = [
+        {
+            "Function": name,
+            "Calls": summary["count"],
+            "Mean (ms)": summary["mean_seconds"] * 1000,
+            "p50 (ms)": summary["p50_seconds"] * 1000,
+            "p95 (ms)": summary["p95_seconds"] * 1000,
+            "p99 (ms)": summary["p99_seconds"] * 1000,
+            "Max (ms)": summary["max_seconds"] * 1000,
+            "Total (s)": summary["total_seconds"]
+        }
+        for name, summary in metrics.items()
+        if summary["count"]
+    ]
+    if rows:
+        df = pd.DataFrame(rows).sort_values("Total (s)", ascending=False)
+        st.dataframe(df, use_container_width=True)
+    else:
+        st.info("No instrumented calls have been recorded yet.")
+
+    # File lock contention
+    st.subheader("🔒 File Lock Waits")
+    lock_metrics = get_lock_metrics()
+    if lock_metrics:
+        st.dataframe(pd.DataFrame([
+            {
+                "Lock": label,
+                "Acquired": values["acquired"],
+                "Timeouts": values["timeouts"],
+                "Avg wait (ms)": values["avg_wait"] * 1000,
+                "Max wait (ms)": values["max_wait"] * 1000
+            }
+            for label, values in lock_metrics.items()
+        ]), use_container_width=True)
+    else:
+        st.info("No file locks have been taken yet.")
+
+    # Model cache
+    st.subheader("🧠 Model Cache")
+    cache_stats = get_model_cache_stats()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Model loads", cache_stats["load_count"])
+    col2.metric("Load errors", cache_stats["load_errors"])
+    col3.metric("Avg load time", f"{cache_stats['avg_load_seconds'] * 1000:.1f} ms")
+
+    # OpenAI response cache
+    st.subheader("💬 Suggestion Cache")
+    suggestion_stats = get_suggestion_cache_stats()
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Hit rate", f"{suggestion_stats['hit_rate']:.0%}")
+    col2.metric("Memory / disk hits", f"{suggestion_stats['memory_hits']} / {suggestion_stats['disk_hits']}")
+    col3.metric("Misses", suggestion_stats["misses"])
+    col4.metric("Evictions", suggestion_stats["evictions"])
+
+    # Export and reset
+    st.markdown("---")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.download_button("Download Prometheus metrics", prometheus_text(),
+                           file_name="metrics.prom", mime="text/plain", use_container_width=True)
+    with col2:
+        if st.button(f"Write {METRICS_FILE} now", use_container_width=True):
+            write_prometheus_file()
+            st.success(f"Wrote {METRICS_FILE}")
+    with col3:
+        if st.button("Reset metrics", use_container_width=True):
+            reset_metrics()
+            st.rerun()
+
+if __name__ == "__main__":
+    main()
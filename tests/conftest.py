@@ -0,0 +1,8 @@
+import pytest
+
+@pytest.fixture
+def work_dir(tmp_path, monkeypatch):
+    """Run from an empty directory, so the modules' relative data/ paths point into it"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    return tmp_path
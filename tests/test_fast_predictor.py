@@ -0,0 +1,73 @@
+import random
+
+import joblib
+import numpy as np
+
+from utils import data_utils
+from utils.fast_predictor import LinearBundle
+from utils.feature_encoder import FeatureEncoder
+
+PLATFORMS = ["Instagram", "Facebook", "TikTok"]
+TIMES = ["Less than 30 minutes", "30 minutes to 1 hour", "1-2 hours", "2-3 hours", "More than 3 hours"]
+
+def random_response(rng, platforms=PLATFORMS):
+    row = {
+        "mood": rng.randint(1, 5),
+        "sleep": rng.randint(1, 5),
+        "stress": rng.randint(1, 5),
+        "anxiety": rng.random() < 0.3
+    }
+    if rng.random() < 0.7:
+        row["platform"] = rng.choice(platforms)
+        if rng.random() < 0.8:
+            row["platform_time"] = rng.choice(TIMES)
+        if rng.random() < 0.5:
+            row["content_impact"] = rng.choice(["Positive", "Neutral", "Negative"])
+    return row
+
+def unrounded_predictions(artifact, records):
+    model, scaler, feature_names = artifact
+    return model.predict(scaler.transform(FeatureEncoder(feature_names).transform(records)))
+
+def test_bundle_predictions_equal_the_joblib_model(work_dir):
+    rng = random.Random(0)
+    for _ in range(200):
+        data_utils.save_to_ml_dataset(random_response(rng))
+    assert data_utils.train_ml_model()
+
+    artifact = joblib.load(data_utils.MODEL_FILE)
+    bundle = LinearBundle.load(data_utils.MODEL_BUNDLE_FILE)
+    # Include platforms the model never saw; they must contribute nothing on both paths
+    records = [random_response(rng, PLATFORMS + ["YouTube"]) for _ in range(500)]
+    records += [{}, {"mood": 5}, {"platform": None}, {"platform": "Snapchat", "platform_time": "unknown"}]
+
+    expected = unrounded_predictions(artifact, records)
+    for record, value in zip(records, expected):
+        bundle_score = bundle.predict(record)
+        assert abs(bundle_score - min(100, max(0, value))) <= 0.5 + 1e-9
+        # Away from rounding ties the two paths agree exactly
+        if abs(value % 1 - 0.5) > 1e-6:
+            assert bundle_score == data_utils.predict_ml_scores([record])[0]
+
+def test_bundle_round_trips_through_its_file(tmp_path):
+    bundle = LinearBundle(["mood", "sleep", "platform_tiktok"], [10.0, -2.5, 3.25], 1.5)
+    path = str(tmp_path / "bundle.json")
+
+    bundle.save(path)
+    loaded = LinearBundle.load(path)
+
+    assert loaded.to_dict() == bundle.to_dict()
+    assert loaded.predict({"mood": 4, "sleep": 2, "platform": "TikTok"}) == round(1.5 + 40 - 5 + 3.25)
+
+def test_from_artifact_folds_the_scaler_into_weights():
+    X = np.array([[1.0, 2.0], [3.0, 5.0], [5.0, 1.0], [2.0, 4.0]])
+    y = np.array([10.0, 30.0, 40.0, 25.0])
+    from sklearn.linear_model import LinearRegression
+    from sklearn.preprocessing import StandardScaler
+    scaler = StandardScaler().fit(X)
+    model = LinearRegression().fit(scaler.transform(X), y)
+
+    bundle = LinearBundle.from_artifact(model, scaler, ["mood", "sleep"])
+
+    raw = [bundle.bias + bundle.weights["mood"] * a + bundle.weights["sleep"] * b for a, b in X]
+    np.testing.assert_allclose(raw, model.predict(scaler.transform(X)))
@@ -0,0 +1,61 @@
+import json
+
+from utils import data_utils
+
+def response(i):
+    return {"mood": i % 5 + 1, "sleep": 3, "stress": 2, "anxiety": False, "platform": "Instagram"}
+
+def write_legacy_dataset(count):
+    with open(data_utils.ML_DATASET_FILE, "w") as f:
+        json.dump({"responses": [response(i) for i in range(count)]}, f)
+
+def test_converting_again_keeps_check_ins_saved_after_the_first_conversion(work_dir):
+    write_legacy_dataset(3)
+    assert data_utils.convert_ml_dataset_to_jsonl() == 3
+
+    data_utils.save_to_ml_dataset(response(3))
+    data_utils.save_to_ml_dataset(response(4))
+
+    assert data_utils.convert_ml_dataset_to_jsonl() == 0
+    assert list(data_utils.iter_ml_dataset()) == [response(i) for i in range(5)]
+
+def test_first_save_converts_the_legacy_dataset(work_dir):
+    write_legacy_dataset(2)
+
+    data_utils.save_to_ml_dataset(response(2))
+
+    assert list(data_utils.iter_ml_dataset()) == [response(i) for i in range(3)]
+
+def test_first_save_moves_a_corrupt_legacy_dataset_aside(work_dir):
+    with open(data_utils.ML_DATASET_FILE, "w") as f:
+        f.write('{"responses": [{"mood": 3')
+
+    data_utils.save_to_ml_dataset(response(0))
+
+    assert list(data_utils.iter_ml_dataset()) == [response(0)]
+    assert (work_dir / "data" / "ml_dataset.json.corrupt").exists()
+
+def test_check_ins_saved_while_training_builds_its_copies_are_kept(work_dir, monkeypatch):
+    from utils import file_utils, training_store
+    from utils.online_trainer import load_regression_stats
+
+    for i in range(10):
+        data_utils.save_to_ml_dataset(response(i))
+
+    # A check-in arriving mid-build must not wait for the build to finish
+    monkeypatch.setattr(file_utils, "LOCK_TIMEOUT", 0.5)
+    rebuild = training_store.rebuild
+
+    def rebuild_while_saving(responses, store_dir):
+        data_utils.save_to_ml_dataset(response(10))
+        data_utils.save_to_ml_dataset(response(11))
+        rebuild(responses, store_dir)
+
+    monkeypatch.setattr(training_store, "rebuild", rebuild_while_saving)
+
+    assert data_utils.train_ml_model()
+    columns, _ = training_store.load_columns()
+    assert len(columns["mood"]) == 12
+    assert load_regression_stats().n == 12
+    assert len(list(data_utils.iter_ml_dataset())) == 12
+    assert not [name for name in (work_dir / "data").iterdir() if name.name.endswith(".tmp")]
@@ -0,0 +1,110 @@
+import random
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import StandardScaler
+
+from utils import training_store
+from utils.feature_encoder import FeatureEncoder, empty_vocabulary, responses_to_columns
+from utils.online_trainer import RegressionStats, stats_from_responses
+
+BASE = ["mood", "sleep", "stress", "anxiety"]
+PLATFORMS = ["platform_instagram", "platform_tiktok", "platform_youtube"]
+
+def sklearn_fit(X, y):
+    scaler = StandardScaler()
+    model = LinearRegression().fit(scaler.fit_transform(X), y)
+    return model, scaler
+
+def assert_matches_sklearn(stats, X, y, feature_names):
+    """Compare the statistics' fit with sklearn's fit of X, whose columns are feature_names"""
+    expected_model, expected_scaler = sklearn_fit(X, y)
+    model, scaler, names = stats.to_sklearn()
+    order = [names.index(name) for name in feature_names]
+
+    np.testing.assert_allclose(scaler.mean_[order], expected_scaler.mean_, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(scaler.scale_[order], expected_scaler.scale_, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(model.coef_[order], expected_model.coef_, rtol=1e-6, atol=1e-8)
+    assert model.intercept_ == pytest.approx(expected_model.intercept_, rel=1e-9)
+
+def random_data(rng, rows, with_platforms):
+    X = np.column_stack([
+        rng.integers(1, 6, rows),
+        rng.integers(1, 6, rows),
+        rng.integers(1, 6, rows),
+        rng.integers(0, 2, rows)
+    ]).astype(np.float64)
+    names = list(BASE)
+    if with_platforms:
+        # One-hot platforms sum to one, so the standardized features are collinear
+        X = np.column_stack([X, np.eye(len(PLATFORMS))[rng.integers(0, len(PLATFORMS), rows)]])
+        names += PLATFORMS
+    y = X @ rng.normal(size=X.shape[1]) + rng.normal(scale=0.5, size=rows)
+    return X, y, names
+
+@pytest.mark.parametrize("with_platforms", [False, True])
+def test_fit_matches_sklearn(with_platforms):
+    rng = np.random.default_rng(0)
+    X, y, names = random_data(rng, 500, with_platforms)
+
+    stats = RegressionStats().update(X, y, names)
+
+    assert stats.n == 500
+    assert_matches_sklearn(stats, X, y, names)
+
+@pytest.mark.parametrize("with_platforms", [False, True])
+def test_incremental_updates_and_merged_shards_match_one_fit(with_platforms):
+    rng = np.random.default_rng(1)
+    X, y, names = random_data(rng, 600, with_platforms)
+
+    first = RegressionStats()
+    for start in range(0, 300, 50):
+        first.update(X[start:start + 50], y[start:start + 50], names)
+    second = RegressionStats()
+    for start in range(300, 600, 1):
+        second.update(X[start:start + 1], y[start:start + 1], names)
+
+    assert_matches_sklearn(first.merge(second), X, y, names)
+
+def test_merge_adds_features_missing_from_earlier_shards():
+    rng = np.random.default_rng(2)
+    X, y, names = random_data(rng, 400, with_platforms=True)
+    # The first shard never saw TikTok; its rows count as zero for that feature
+    X[:200, names.index("platform_tiktok")] = 0
+    first_names = [name for name in names if name != "platform_tiktok"]
+    first = RegressionStats().update(X[:200, [names.index(name) for name in first_names]], y[:200], first_names)
+    second = RegressionStats().update(X[200:], y[200:], names)
+
+    assert_matches_sklearn(first.merge(second), X, y, names)
+
+def test_stats_from_responses_match_sklearn_on_encoded_responses():
+    rng = random.Random(3)
+    responses = []
+    for _ in range(300):
+        row = {
+            "mood": rng.randint(1, 5),
+            "sleep": rng.randint(1, 5),
+            "stress": rng.randint(1, 5),
+            "anxiety": rng.random() < 0.3
+        }
+        if rng.random() < 0.7:
+            row["platform"] = rng.choice(["Instagram", "TikTok", "YouTube"])
+            row["platform_time"] = rng.choice(["Less than 30 minutes", "1-2 hours", "More than 3 hours"])
+        responses.append(row)
+
+    encoder = FeatureEncoder()
+    X = encoder.fit_transform(responses)
+    y = training_store.wellbeing_targets(responses_to_columns(responses, empty_vocabulary()))
+
+    assert_matches_sklearn(stats_from_responses(responses), X, y, encoder.feature_names)
+
+def test_save_and_load_round_trip(tmp_path):
+    rng = np.random.default_rng(4)
+    X, y, names = random_data(rng, 100, with_platforms=True)
+    stats = RegressionStats().update(X, y, names)
+    path = str(tmp_path / "regression_stats.npz")
+
+    stats.save(path)
+
+    assert_matches_sklearn(RegressionStats.load(path), X, y, names)
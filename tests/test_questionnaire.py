@@ -0,0 +1,158 @@
+import pytest
+
+from utils.questionnaire import get_questionnaire, get_registry, map_responses_to_metrics
+
+# The per-platform option -> metric maps from before the registry, plus TikTok
+BASELINE_METRICS = [
+    ("Instagram", "instagram_feeling", "mood", {
+        "Energized and positive": 5,
+        "Neutral": 3,
+        "Slightly distracted": 2,
+        "Emotionally drained or overstimulated": 1
+    }),
+    ("Instagram", "instagram_boundaries", "stress", {
+        "I already take breaks regularly": 1,
+        "I've considered it but haven't started": 3,
+        "It's hard to step away": 4,
+        "I'd like help creating healthy boundaries": 3
+    }),
+    ("Instagram", "instagram_self_image", "anxiety", {
+        "Not really": False,
+        "Sometimes I feel inspired, other times unsure": False,
+        "Yes, I've reflected more on how I view myself": False,
+        "Yes, and I'm looking to understand this better": True
+    }),
+    ("Facebook", "facebook_feeling", "mood", {
+        "Connected and positive": 5,
+        "Neutral": 3,
+        "Slightly distracted or overwhelmed": 2,
+        "Anxious or left out": 1
+    }),
+    ("Facebook", "facebook_emotional", "stress", {
+        "Not at all": 1,
+        "Slightly": 2,
+        "Often": 4,
+        "Strongly": 5
+    }),
+    ("Facebook", "facebook_comparison", "anxiety", {
+        "Not at all": False,
+        "Occasionally": False,
+        "Frequently": True,
+        "Almost always": True
+    }),
+    ("Twitter", "twitter_feeling", "mood", {
+        "Informed and curious": 5,
+        "Neutral or unaffected": 3,
+        "A bit overwhelmed or reactive": 2,
+        "Emotionally unsettled": 1
+    }),
+    ("Twitter", "twitter_arguments", "stress", {
+        "Not at all": 1,
+        "Occasionally": 2,
+        "Yes, they sometimes affect me": 4,
+        "Yes, quite significantly": 5
+    }),
+    ("Twitter", "twitter_pressure", "anxiety", {
+        "No pressure at all": False,
+        "Mild pressure": False,
+        "Quite often": True,
+        "Constantly": True
+    }),
+    ("Snapchat", "snapchat_emotional", "mood", {
+        "I feel happy and connected": 5,
+        "Neutral": 3,
+        "Mixed emotions": 2,
+        "Emotionally drained sometimes": 1
+    }),
+    ("Snapchat", "snapchat_streaks", "stress", {
+        "Unaffected": 1,
+        "Slightly concerned": 2,
+        "Stressed or anxious": 4,
+        "Upset or emotional": 5
+    }),
+    ("Snapchat", "snapchat_fomo", "anxiety", {
+        "Never": False,
+        "Rarely": False,
+        "Sometimes": True,
+        "Often": True
+    }),
+    ("YouTube", "youtube_feelings", "mood", {
+        "Informed or inspired": 5,
+        "Entertained and relaxed": 4,
+        "Sometimes distracted": 2,
+        "Often like I've wasted time": 1
+    }),
+    ("YouTube", "youtube_balance", "stress", {
+        "Very well - it's just one of many activities": 1,
+        "Fairly well": 2,
+        "Could be better": 3,
+        "It often takes priority over other things": 5
+    }),
+    ("YouTube", "youtube_sleep", "anxiety", {
+        "Never": False,
+        "Rarely": False,
+        "Sometimes": True,
+        "Often": True
+    }),
+    ("TikTok", "tiktok_feeling", "mood", {
+        "Entertained and upbeat": 5,
+        "Neutral": 3,
+        "A bit restless or scattered": 2,
+        "Drained or low": 1
+    }),
+    ("TikTok", "tiktok_scrolling", "stress", {
+        "Rarely": 1,
+        "Sometimes": 2,
+        "Often": 4,
+        "Almost every time": 5
+    }),
+    ("TikTok", "tiktok_comparison", "anxiety", {
+        "Never": False,
+        "Occasionally": False,
+        "Frequently": True,
+        "Almost always": True
+    })
+]
+
+DEFAULTS = {"mood": 3, "stress": 3, "anxiety": False}
+
+CASE_IDS = [question_id for _, question_id, _, _ in BASELINE_METRICS]
+
+@pytest.mark.parametrize("platform, question_id, metric, expected", BASELINE_METRICS, ids=CASE_IDS)
+def test_each_option_maps_to_its_baseline_metric(platform, question_id, metric, expected):
+    for option, value in expected.items():
+        responses = map_responses_to_metrics(platform, {question_id: option})
+        assert responses[metric] == value
+        assert type(responses[metric]) is type(value)
+
+@pytest.mark.parametrize("platform, question_id, metric, expected", BASELINE_METRICS, ids=CASE_IDS)
+def test_question_offers_exactly_the_baseline_options(platform, question_id, metric, expected):
+    question = next(q for q in get_questionnaire(platform).questions if q["id"] == question_id)
+    assert question["options"] == list(expected)
+
+@pytest.mark.parametrize("platform, question_id, metric, expected", BASELINE_METRICS, ids=CASE_IDS)
+def test_unknown_answer_maps_to_the_default(platform, question_id, metric, expected):
+    responses = map_responses_to_metrics(platform, {question_id: "Something else"})
+    assert responses[metric] == DEFAULTS[metric]
+
+def test_every_platform_maps_mood_stress_and_anxiety_once():
+    mapped = {}
+    for platform, question_id, metric, _ in BASELINE_METRICS:
+        mapped.setdefault(platform, []).append(metric)
+    assert set(get_registry()) == set(mapped)
+    for platform, questionnaire in get_registry().items():
+        assert sorted(metric for _, metric, _, _ in questionnaire.metric_tables) == sorted(mapped[platform])
+
+def test_full_submission_maps_all_metrics_and_keeps_answers():
+    responses = {
+        "tiktok_feeling": "Drained or low",
+        "tiktok_scrolling": "Often",
+        "tiktok_comparison": "Frequently",
+        "tiktok_focus": "Slightly"
+    }
+    assert map_responses_to_metrics("TikTok", dict(responses)) == dict(responses, mood=1, stress=4, anxiety=True)
+
+def test_unanswered_questions_and_unknown_platforms_leave_metrics_unset():
+    assert map_responses_to_metrics("Instagram", {}) == {}
+    assert map_responses_to_metrics("MySpace", {"myspace_feeling": "Neutral"}) == {"myspace_feeling": "Neutral"}
+    assert map_responses_to_metrics(None, {"mood": 4}) == {"mood": 4}
@@ -0,0 +1,40 @@
+import pytest
+
+from utils.retrain_worker import MIN_TRAINING_ROWS, RetrainWorker
+
+class FakeHolder:
+    def __init__(self, artifact=None):
+        self.artifact = artifact
+
+    def get(self):
+        return self.artifact
+
+def make_worker(tmp_path, rows, artifact=None):
+    dataset = lambda: iter([{"mood": 3}] * rows)
+    return RetrainWorker(lambda: True, FakeHolder(artifact), str(tmp_path / "meta.json"),
+                         store_dir=str(tmp_path / "store"), dataset=dataset)
+
+@pytest.mark.parametrize("rows", [0, MIN_TRAINING_ROWS - 1])
+def test_no_training_without_enough_rows_for_a_first_model(tmp_path, rows):
+    assert make_worker(tmp_path, rows).retrain_reason() is None
+    assert make_worker(tmp_path, rows, artifact=object()).retrain_reason() is None
+
+def test_first_model_once_the_dataset_has_enough_rows(tmp_path):
+    assert make_worker(tmp_path, MIN_TRAINING_ROWS).retrain_reason() == "initial"
+
+def test_existing_model_without_a_store_builds_the_store(tmp_path):
+    assert make_worker(tmp_path, 100, artifact=object()).retrain_reason() == "store missing"
+
+def test_dataset_is_read_only_as_far_as_needed(tmp_path):
+    read = []
+
+    def dataset():
+        for i in range(1000):
+            read.append(i)
+            yield {"mood": 3}
+
+    worker = RetrainWorker(lambda: True, FakeHolder(), str(tmp_path / "meta.json"),
+                           store_dir=str(tmp_path / "store"), dataset=dataset)
+
+    assert worker.retrain_reason() == "initial"
+    assert len(read) == MIN_TRAINING_ROWS
@@ -0,0 +1,154 @@
+import os
+import json
+import random
+import threading
+
+import pytest
+
+from utils import storage_utils
+
+LEGACY_USERS = 300
+SESSIONS = 240
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point the JSON backend at an empty data directory"""
+    monkeypatch.setattr(storage_utils, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(storage_utils, "USER_DATA_FILE", str(tmp_path / "users.json"))
+    monkeypatch.setattr(storage_utils, "USER_DIRECTORY", str(tmp_path / "users"))
+    monkeypatch.setattr(storage_utils, "USER_ID_COUNTER_FILE", str(tmp_path / "users" / "next_id"))
+    monkeypatch.setattr(storage_utils, "STORAGE_BACKEND", "json")
+    return tmp_path
+
+def write_legacy_users(data_dir, count):
+    users = {
+        f"user{i}@example.com": {
+            "id": str(i).zfill(6),
+            "name": f"User {i}",
+            "password": "hash",
+            "created_at": "2024-01-01 00:00:00"
+        }
+        for i in range(1, count + 1)
+    }
+    with open(data_dir / "users.json", "w") as f:
+        json.dump(users, f)
+    return users
+
+def test_concurrent_first_logins_import_every_legacy_user(data_dir):
+    users = write_legacy_users(data_dir, LEGACY_USERS)
+    emails = list(users)
+    rng = random.Random(0)
+    lookups = [rng.choice(emails) for _ in range(SESSIONS)]
+
+    start = threading.Barrier(SESSIONS)
+    errors = []
+    missing = []
+
+    def login(email):
+        start.wait()
+        try:
+            if storage_utils.get_user(email) is None:
+                missing.append(email)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=login, args=(email,)) for email in lookups]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert missing == []
+    imported = {user["email"] for user in storage_utils.iter_json_users()}
+    assert imported == set(users)
+    # No staging directories are left behind
+    assert sorted(name for name in os.listdir(data_dir) if name.startswith("users")) == [
+        "users", "users.json", "users.lock"
+    ]
+
+def test_signup_after_import_continues_legacy_ids(data_dir):
+    write_legacy_users(data_dir, 3)
+
+    user = storage_utils.create_user("new@example.com", "New", "hash")
+
+    assert user["id"] == "000004"
+    assert storage_utils.get_user("new@example.com")["id"] == "000004"
+    assert storage_utils.create_user("new@example.com", "Again", "hash") is None
+
+def entry(i):
+    return {"date": f"2024-01-01 00:00:{i:02d}", "mood": i % 5 + 1, "note": "x" * 40}
+
+def read_segment_seqs(data_dir, user_id):
+    with open(data_dir / f"user_{user_id}.jsonl") as f:
+        return [json.loads(line)["seq"] for line in f]
+
+def test_appended_entries_read_back_in_order(data_dir):
+    for i in range(20):
+        storage_utils.append_mood_entry("000001", entry(i))
+
+    assert storage_utils.load_mood_data("000001") == [entry(i) for i in range(20)]
+    assert storage_utils.load_mood_data("000001", limit=5) == [entry(i) for i in range(15, 20)]
+    assert read_segment_seqs(data_dir, "000001") == list(range(1, 21))
+
+def test_appends_continue_the_sequence_of_a_legacy_history(data_dir):
+    legacy = [entry(i) for i in range(3)]
+    with open(data_dir / "user_000001.json", "w") as f:
+        json.dump({"mood_data": legacy}, f)
+
+    storage_utils.append_mood_entry("000001", entry(3))
+
+    assert storage_utils.load_mood_data("000001") == [entry(i) for i in range(4)]
+    assert read_segment_seqs(data_dir, "000001") == [4]
+
+@pytest.mark.parametrize("count", [1, 7, 40, 41, 120])
+def test_tail_read_across_block_boundaries(data_dir, count):
+    for i in range(60):
+        storage_utils.append_mood_entry("000001", entry(i))
+
+    # Blocks smaller than a record, so lines are split between reads
+    records = storage_utils._read_segment_tail("000001", count, block_size=37)
+
+    assert [record["seq"] for record in records] == list(range(max(1, 61 - count), 61))
+    assert [record["entry"] for record in records] == [entry(i) for i in range(max(0, 60 - count), 60)]
+
+def test_tail_read_skips_a_torn_final_line(data_dir):
+    for i in range(5):
+        storage_utils.append_mood_entry("000001", entry(i))
+    with open(data_dir / "user_000001.jsonl", "a") as f:
+        f.write('{"seq": 6, "entry": {"mo')
+
+    assert storage_utils.load_mood_data("000001", limit=2) == [entry(3), entry(4)]
+    storage_utils.append_mood_entry("000001", entry(5))
+    assert storage_utils.load_mood_data("000001") == [entry(i) for i in range(6)]
+
+def test_compaction_keeps_the_newest_entries_in_the_segment(data_dir, monkeypatch):
+    monkeypatch.setattr(storage_utils, "HISTORY_COMPACT_BYTES", 4096)
+    monkeypatch.setattr(storage_utils, "HISTORY_SEGMENT_KEEP", 10)
+
+    for i in range(100):
+        storage_utils.append_mood_entry("000001", entry(i))
+
+    with open(data_dir / "user_000001.json") as f:
+        base = json.load(f)
+    seqs = read_segment_seqs(data_dir, "000001")
+    # Compaction ran, folding the oldest entries into the base file
+    assert base["seq"] == len(base["mood_data"]) > 0
+    assert 10 <= len(seqs) < 100
+    # The segment continues exactly where the base ends and keeps counting up
+    assert seqs == list(range(base["seq"] + 1, 101))
+    assert base["mood_data"] + [entry(i - 1) for i in seqs] == [entry(i) for i in range(100)]
+    assert storage_utils.load_mood_data("000001") == [entry(i) for i in range(100)]
+    assert storage_utils.load_mood_data("000001", limit=10) == [entry(i) for i in range(90, 100)]
+
+def test_explicit_compaction_keeps_the_last_entries(data_dir, monkeypatch):
+    monkeypatch.setattr(storage_utils, "HISTORY_SEGMENT_KEEP", 10)
+    for i in range(25):
+        storage_utils.append_mood_entry("000001", entry(i))
+
+    storage_utils.compact_mood_history("000001")
+
+    assert read_segment_seqs(data_dir, "000001") == list(range(16, 26))
+    assert storage_utils.load_mood_data("000001") == [entry(i) for i in range(25)]
+    storage_utils.append_mood_entry("000001", entry(25))
+    assert read_segment_seqs(data_dir, "000001")[-1] == 26
@@ -0,0 +1,62 @@
+import datetime
+
+import pytest
+
+from utils.suggestions_generator import condition_mask, daily_seed, generate_wellness_suggestions
+
+SEED = "000042:2024-05-01"
+
+# Titles the per-platform generators picked before the compiled catalog, with
+# the global random state seeded as random.Random(f"{SEED}:{platform}") is
+PINNED = [
+    ({"mood": 3, "sleep": 3, "stress": 3, "anxiety": False}, None,
+     ["Bedtime Boundary", "Mindful Notifications", "Nature Connection"]),
+    ({"mood": 2, "sleep": 4, "stress": 5, "anxiety": True}, "Facebook",
+     ["Evening Boundary", "Groups Focus", "Notification Detox", "Weekly Digital Sabbath"]),
+    ({"mood": 4, "sleep": 1, "stress": 2, "anxiety": False}, "YouTube",
+     ["Schedule Viewing", "Evening Screen Break", "Disable Autoplay", "Set Time Limits"]),
+    ({"mood": 1, "sleep": 2, "stress": 4, "anxiety": True}, "Instagram",
+     ["Set Time Boundaries", "Post Authentically", "Curate Your Feed", "Mindful Scrolling", "Engagement Detox"]),
+    # No catalog entry, so the general suggestions are used
+    ({"mood": 5, "sleep": 5, "stress": 1, "anxiety": False}, "TikTok",
+     ["Morning Mindfulness", "Nature Connection", "Mindful Notifications"])
+]
+
+@pytest.mark.parametrize("mood_data, platform, titles", PINNED, ids=[str(case[1]) for case in PINNED])
+def test_seeded_suggestions_are_pinned(mood_data, platform, titles):
+    suggestions = generate_wellness_suggestions(mood_data, platform, seed=SEED)
+
+    assert [s["title"] for s in suggestions] == titles
+    assert all(set(s) == {"title", "emoji", "description"} for s in suggestions)
+
+def test_returned_suggestions_are_copies():
+    mood_data, platform, titles = PINNED[0]
+    generate_wellness_suggestions(mood_data, platform, seed=SEED)[0]["title"] = "Changed"
+
+    assert [s["title"] for s in generate_wellness_suggestions(mood_data, platform, seed=SEED)] == titles
+
+def test_condition_mask():
+    assert condition_mask({}) == 0
+    assert condition_mask({"mood": 2, "stress": 4, "sleep": 2, "anxiety": True}) == 0b1111
+    assert condition_mask({"mood": 3, "stress": 3, "sleep": 3, "anxiety": False}) == 0
+    assert condition_mask({"stress": 5}) == 0b0010
+
+def test_daily_seed_is_stable_within_a_day():
+    day = datetime.date(2024, 5, 1)
+
+    assert daily_seed("000042", day) == daily_seed("000042", day) == "000042:2024-05-01"
+    assert daily_seed("000042") == daily_seed("000042", datetime.date.today())
+
+def test_daily_seed_changes_with_the_day_and_the_user():
+    day = datetime.date(2024, 5, 1)
+
+    assert daily_seed("000042", day) != daily_seed("000042", day + datetime.timedelta(days=1))
+    assert daily_seed("000042", day) != daily_seed("000043", day)
+
+def test_same_daily_seed_gives_the_same_suggestions_on_every_rerun():
+    mood_data = {"mood": 2, "sleep": 2, "stress": 4, "anxiety": True}
+    seed = daily_seed("000042", datetime.date(2024, 5, 1))
+
+    runs = [[s["title"] for s in generate_wellness_suggestions(mood_data, "Facebook", seed=seed)] for _ in range(5)]
+
+    assert all(run == runs[0] for run in runs)
@@ -0,0 +1,64 @@
+import random
+
+import pandas as pd
+import pytest
+
+from utils.data_utils import calculate_wellbeing_score, calculate_wellbeing_scores
+
+def random_rows(seed, count=300):
+    """Check-ins with metrics missing at random and anxiety in the shapes old data uses"""
+    rng = random.Random(seed)
+    anxiety_values = [True, False, "Yes", "No", "", None, 1, 0]
+    rows = []
+    for _ in range(count):
+        row = {"mood": rng.randint(1, 5)}
+        for name in ("sleep", "stress"):
+            if rng.random() < 0.8:
+                row[name] = rng.randint(1, 5)
+        if rng.random() < 0.8:
+            row["anxiety"] = rng.choice(anxiety_values)
+        rows.append(row)
+    return rows
+
+def assert_matches_per_row(rows):
+    df = pd.DataFrame(rows)
+    scores = calculate_wellbeing_scores(df)
+
+    assert list(scores.index) == list(df.index)
+    # Per row both on the frame's rows (NaN for missing values) and on the original dicts
+    assert scores.tolist() == [calculate_wellbeing_score(row) for _, row in df.iterrows()]
+    assert scores.tolist() == [calculate_wellbeing_score(row) for row in rows]
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_per_row_score_with_missing_metrics(seed):
+    assert_matches_per_row(random_rows(seed))
+
+@pytest.mark.parametrize("missing", ["sleep", "stress", "anxiety"])
+def test_matches_per_row_score_without_a_metric_column(missing):
+    rows = random_rows(10)
+    for row in rows:
+        row.pop(missing, None)
+    assert_matches_per_row(rows)
+
+@pytest.mark.parametrize("anxiety", [[True, False, True], ["Yes", "No", ""], [1, 0, None]])
+def test_matches_per_row_score_for_each_anxiety_type(anxiety):
+    rows = [{"mood": 4, "sleep": 2, "stress": 5, "anxiety": value} for value in anxiety]
+    assert_matches_per_row(rows)
+
+def test_matches_per_row_score_for_string_metrics():
+    rows = [{"mood": "4", "sleep": 3, "stress": 2}, {"mood": 2, "sleep": "5", "stress": 1, "anxiety": True}]
+    assert_matches_per_row(rows)
+
+def test_ml_scores_take_precedence_and_missing_ones_count_as_zero():
+    rows = [
+        {"mood": 5, "sleep": 5, "stress": 1, "ml_wellbeing_score": 72.9},
+        {"mood": 1, "sleep": 1, "stress": 5},
+        {"mood": 3, "sleep": 3, "stress": 3, "ml_wellbeing_score": 40}
+    ]
+    df = pd.DataFrame(rows)
+
+    assert calculate_wellbeing_scores(df).tolist() == [72, 0, 40]
+    assert calculate_wellbeing_scores(df).tolist() == [calculate_wellbeing_score(row) for _, row in df.iterrows()]
+
+def test_empty_frame():
+    assert calculate_wellbeing_scores(pd.DataFrame()).tolist() == []
@@ -0,0 +1,238 @@
+"""Generate a synthetic user population for load testing.
+
+Check-ins are drawn from the questionnaire registry the app uses, so they
+carry the same answers and derived mood/stress/anxiety metrics as real
+submissions, for every platform with a question bank. Output
+uses the app's original file layout (users.json, user_<id>.json and
+ml_dataset.json), which the app imports into its current stores on first
+use. Run from the repository root:
+
+    python -m tools.generate_population --users 10000 --checkins 100 --output-dir /tmp/loadtest/data
+
+Users are split across worker processes that each write their own user
+files and a slice of the dataset, which is then concatenated.
+"""
+import os
+import sys
+import json
+import math
+import time
+import bisect
+import random
+import shutil
+import hashlib
+import argparse
+import datetime
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from assets.questionnaires import general_questions
+from utils.questionnaire import get_registry
+
+# Name used for check-ins that go through the general questionnaire (no platform)
+GENERAL = "general"
+
+def parse_weights(text):
+    """Parse "a=1,b=2" into {"a": 1.0, "b": 2.0}, or "1,2,3" into [1.0, 2.0, 3.0]"""
+    if "=" in text:
+        return {key.strip(): float(value) for key, value in (item.split("=") for item in text.split(","))}
+    return [float(value) for value in text.split(",")]
+
+def hash_password(password):
+    return hashlib.sha256(password.encode()).hexdigest()
+
+class CheckinGenerator:
+    """Draw questionnaire submissions from the configured distributions"""
+
+    def __init__(self, config):
+        self.config = config
+        platforms = get_registry()
+
+        skew = config["option_skew"]
+        self.platform_banks = {}
+        for platform, questionnaire in platforms.items():
+            bank = []
+            for question in questionnaire.questions:
+                # Options are listed from most to least healthy, so a positive skew favours the top ones
+                weights = [math.exp(-skew * i) for i in range(len(question["options"]))]
+                bank.append((question["id"], question["options"], _cumulative(weights)))
+            self.platform_banks[platform] = (bank, questionnaire.map_responses)
+
+        self.general = {question["id"]: question for question in general_questions}
+        mood_values = sorted(option["value"] for option in self.general["mood"]["options"])
+        self.mood_values = mood_values
+        self.mood_weights = _cumulative(config["mood_weights"] or [1.0] * len(mood_values))
+        self.sleep_range = range(self.general["sleep"]["min"], self.general["sleep"]["max"] + 1)
+        self.sleep_weights = _cumulative(config["sleep_weights"] or [1.0] * len(self.sleep_range))
+        self.stress_range = range(self.general["stress"]["min"], self.general["stress"]["max"] + 1)
+        self.stress_weights = _cumulative(config["stress_weights"] or [1.0] * len(self.stress_range))
+
+        platform_weights = config["platform_weights"] or {}
+        self.platform_names = [GENERAL] + list(platforms)
+        self.platform_cumulative = _cumulative([platform_weights.get(name, 1.0) for name in self.platform_names])
+
+    def pick_platform(self, rng):
+        return _pick(rng, self.platform_names, self.platform_cumulative)
+
+    def checkin(self, rng, platform):
+        """Return one submitted response, as save_user_data receives it"""
+        if platform == GENERAL:
+            return {
+                "mood": _pick(rng, self.mood_values, self.mood_weights),
+                "sleep": _pick(rng, self.sleep_range, self.sleep_weights),
+                "stress": _pick(rng, self.stress_range, self.stress_weights),
+                "anxiety": rng.random() < self.config["anxiety_rate"],
+                "notes": ""
+            }
+
+        bank, mapper = self.platform_banks[platform]
+        responses = {
+            question_id: _pick(rng, options, weights)
+            for question_id, options, weights in bank
+        }
+        responses["platform"] = platform
+        mapper(responses)
+        return responses
+
+def _pick(rng, values, cumulative):
+    # random.choices() without its per-call argument handling, which dominates generation time
+    return values[bisect.bisect(cumulative, rng.random() * cumulative[-1], 0, len(cumulative) - 1)]
+
+def _cumulative(weights):
+    total = 0.0
+    cumulative = []
+    for weight in weights:
+        total += weight
+        cumulative.append(total)
+    return cumulative
+
+# Built once per worker process by _init_worker
+_generator = None
+
+def _init_worker(config):
+    global _generator
+    _generator = CheckinGenerator(config)
+
+def _generate_users(config, start, stop, part_file):
+    """Write user files for users [start, stop) and their dataset slice; return their users.json records"""
+    generator = _generator
+    end = datetime.datetime.fromisoformat(config["end_date"])
+    password = hash_password(config["password"])
+    checkins = config["checkins"]
+
+    users = {}
+    with open(part_file, "w") as part:
+        first = True
+        for index in range(start, stop):
+            # Seeded per user, so the output doesn't depend on how users are split across workers
+            rng = random.Random(f"{config['seed']}:{index}")
+            user_id = str(index + 1).zfill(6)
+            email = f"user{user_id}@example.com"
+            users[email] = {
+                "id": user_id,
+                "name": f"User {user_id}",
+                "password": password,
+                "created_at": str(end - datetime.timedelta(days=checkins))
+            }
+
+            # Most users stick to one platform, with the occasional other check-in
+            home_platform = generator.pick_platform(rng)
+            entries = []
+            for day in range(checkins):
+                if rng.random() < config["platform_stickiness"]:
+                    platform = home_platform
+                else:
+                    platform = generator.pick_platform(rng)
+                response = generator.checkin(rng, platform)
+                date = end - datetime.timedelta(days=checkins - 1 - day) + datetime.timedelta(seconds=rng.randrange(86400))
+                response["date"] = date.strftime("%Y-%m-%d %H:%M:%S")
+                entries.append(json.dumps(response))
+
+            # Serialize each response once and reuse it for both files
+            with open(os.path.join(config["output_dir"], f"user_{user_id}.json"), "w") as f:
+                f.write('{"mood_data": [' + ", ".join(entries) + '], "seq": ' + str(len(entries)) + "}")
+            if entries:
+                part.write(("" if first else ", ") + ", ".join(entries))
+                first = False
+    return users
+
+def generate(config):
+    """Generate the population described by config; return (users, check-ins)"""
+    output_dir = config["output_dir"]
+    existing = [name for name in ("users.json", "users", "ml_dataset.json", "ml_dataset.jsonl")
+                if os.path.exists(os.path.join(output_dir, name))]
+    if existing:
+        raise FileExistsError(f"{output_dir} already has {', '.join(existing)}; generate into an empty directory")
+    os.makedirs(output_dir, exist_ok=True)
+
+    workers = config["workers"]
+    total_users = config["users"]
+    batch = max(1, math.ceil(total_users / (workers * 4)))
+    ranges = [(start, min(start + batch, total_users)) for start in range(0, total_users, batch)]
+
+    part_dir = tempfile.mkdtemp(prefix="population_", dir=output_dir)
+    try:
+        part_files = [os.path.join(part_dir, f"part_{i:05d}.json") for i in range(len(ranges))]
+        users = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config,)) as executor:
+            futures = [
+                executor.submit(_generate_users, config, start, stop, part_file)
+                for (start, stop), part_file in zip(ranges, part_files)
+            ]
+            for future in futures:
+                users.update(future.result())
+
+        with open(os.path.join(output_dir, "users.json"), "w") as f:
+            json.dump(users, f)
+
+        # Stitch the slices into the single {"responses": [...]} document
+        with open(os.path.join(output_dir, "ml_dataset.json"), "w") as out:
+            out.write('{"responses": [')
+            first = True
+            for part_file in part_files:
+                if os.path.getsize(part_file) == 0:
+                    continue
+                if not first:
+                    out.write(", ")
+                with open(part_file, "r") as part:
+                    shutil.copyfileobj(part, out)
+                first = False
+            out.write("]}")
+    finally:
+        shutil.rmtree(part_dir, ignore_errors=True)
+
+    return len(users), len(users) * config["checkins"]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, required=True)
+    parser.add_argument("--checkins", type=int, default=30, help="Check-ins per user, one per day")
+    parser.add_argument("--output-dir", default="data")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--end-date", default=datetime.date.today().isoformat(),
+                        help="Day of the last check-in (YYYY-MM-DD)")
+    parser.add_argument("--password", default="password", help="Password for every generated account")
+    parser.add_argument("--platform-weights", type=parse_weights, default=None,
+                        help='e.g. "general=3,Instagram=2,YouTube=1"; unlisted choices weigh 1')
+    parser.add_argument("--platform-stickiness", type=float, default=0.8,
+                        help="Chance a check-in uses the user's usual platform")
+    parser.add_argument("--option-skew", type=float, default=0.0,
+                        help="Skew of platform answers towards the first (healthiest) options; 0 is uniform")
+    parser.add_argument("--mood-weights", type=parse_weights, default=None, help="Weights for moods 1-5")
+    parser.add_argument("--sleep-weights", type=parse_weights, default=None, help="Weights for sleep 1-5")
+    parser.add_argument("--stress-weights", type=parse_weights, default=None, help="Weights for stress 1-5")
+    parser.add_argument("--anxiety-rate", type=float, default=0.3)
+    args = parser.parse_args()
+
+    config = vars(args)
+    start = time.perf_counter()
+    try:
+        users, checkins = generate(config)
+    except FileExistsError as e:
+        sys.exit(str(e))
+    elapsed = time.perf_counter() - start
+    print(f"Generated {users} users and {checkins} check-ins in {elapsed:.1f}s "
+          f"({checkins / elapsed:,.0f} check-ins/sec) into {args.output_dir}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Local stand-in for the OpenAI chat completions API.
+
+Answers POST /v1/chat/completions like the real API, after a latency drawn
+from a configurable distribution, and fails or returns malformed JSON at
+configurable rates. Suggestions are built from the rule-based catalog for
+the state described in the prompt, so the app renders them normally. Run
+from the repository root and point the app at it:
+
+    python -m tools.mock_openai_server --port 8089 --latency lognormal --latency-ms 1500 --error-rate 0.05
+    OPENAI_BASE_URL=http://127.0.0.1:8089/v1 OPENAI_API_KEY=mock streamlit run app.py
+
+GET /stats returns the request counters as JSON.
+"""
+import re
+import json
+import math
+import time
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+LATENCY_DISTRIBUTIONS = ["fixed", "uniform", "exponential", "lognormal"]
+
+_STATE_PATTERNS = {
+    "mood": re.compile(r"Mood: (\d+)/5"),
+    "sleep": re.compile(r"Sleep Quality: (\d+)/5"),
+    "stress": re.compile(r"Stress Level: (\d+)/5")
+}
+_ANXIETY_PATTERN = re.compile(r"Feeling Anxious: (Yes|No)")
+_PLATFORM_PATTERN = re.compile(r"while using (.+?)\.")
+
+def add_server_arguments(parser):
+    """Add the mock's behaviour options to an argument parser"""
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default="lognormal",
+                        help="Distribution of response latency")
+    parser.add_argument("--latency-ms", type=float, default=1500,
+                        help="Fixed latency, uniform/exponential mean, or lognormal median")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Spread of the lognormal latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with an error")
+    parser.add_argument("--error-status", type=int, nargs="+", default=[500, 503],
+                        help="HTTP statuses errors are drawn from, e.g. 429 500 503")
+    parser.add_argument("--malformed-rate", type=float, default=0.0,
+                        help="Share of requests whose message content isn't valid JSON")
+    parser.add_argument("--seed", type=int, default=None)
+
+class MockBehaviour:
+    """Draws each request's latency and outcome from the configured rates"""
+
+    def __init__(self, args):
+        self.args = args
+        self._rng = random.Random(args.seed)
+        self._lock = threading.Lock()
+        self.counts = {"requests": 0, "ok": 0, "errors": 0, "malformed": 0}
+
+    def _latency_seconds(self, rng):
+        args = self.args
+        mean = args.latency_ms / 1000
+        if args.latency == "fixed":
+            return mean
+        if args.latency == "uniform":
+            return rng.uniform(0, 2 * mean)
+        if args.latency == "exponential":
+            return rng.expovariate(1 / mean) if mean > 0 else 0.0
+        return mean * math.exp(rng.gauss(0, args.latency_sigma))
+
+    def draw(self):
+        """Return (latency in seconds, outcome) for one request"""
+        with self._lock:
+            rng = self._rng
+            latency = self._latency_seconds(rng)
+            roll = rng.random()
+            if roll < self.args.error_rate:
+                outcome = rng.choice(self.args.error_status)
+                self.counts["errors"] += 1
+            elif roll < self.args.error_rate + self.args.malformed_rate:
+                outcome = "malformed"
+                self.counts["malformed"] += 1
+            else:
+                outcome = "ok"
+                self.counts["ok"] += 1
+            self.counts["requests"] += 1
+        return latency, outcome
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counts)
+
+def suggestions_for_prompt(prompt):
+    """Rule-based suggestions for the state the app's prompt describes"""
+    from utils.suggestions_generator import generate_wellness_suggestions
+    mood_data = {}
+    for name, pattern in _STATE_PATTERNS.items():
+        match = pattern.search(prompt)
+        if match:
+            mood_data[name] = int(match.group(1))
+    match = _ANXIETY_PATTERN.search(prompt)
+    mood_data["anxiety"] = bool(match and match.group(1) == "Yes")
+    match = _PLATFORM_PATTERN.search(prompt)
+    return generate_wellness_suggestions(mood_data, match.group(1) if match else None)
+
+def completion(model, content):
+    """A chat.completion response body around the given message content"""
+    return {
+        "id": f"chatcmpl-mock{random.getrandbits(48):012x}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop"
+        }],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+    }
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    behaviour = None
+    protocol_version = "HTTP/1.1"
+
+    def _send_json(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/stats"):
+            self._send_json(200, self.behaviour.stats())
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": {"message": "Request body is not JSON", "type": "invalid_request_error"}})
+            return
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+            return
+
+        latency, outcome = self.behaviour.draw()
+        time.sleep(latency)
+        model = request.get("model", "mock")
+        if outcome == "ok":
+            prompt = "\n".join(m.get("content", "") for m in request.get("messages", []) if m.get("role") == "user")
+            content = json.dumps({"suggestions": suggestions_for_prompt(prompt)})
+            self._send_json(200, completion(model, content))
+        elif outcome == "malformed":
+            # Cut off mid-object, like a truncated model answer
+            self._send_json(200, completion(model, '{"suggestions": [{"title": "Take a Brea'))
+        else:
+            self._send_json(outcome, {"error": {"message": f"Mock error {outcome}", "type": "server_error"}})
+
+    def log_message(self, format, *args):
+        pass
+
+def make_server(args, host="127.0.0.1", port=8089):
+    """Return a ThreadingHTTPServer serving the mock; call serve_forever() to run it"""
+    handler = type("Handler", (MockOpenAIHandler,), {"behaviour": MockBehaviour(args)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    server = make_server(args, args.host, args.port)
+    print(f"Mock OpenAI API on http://{args.host}:{server.server_port}/v1 "
+          f"({args.latency} {args.latency_ms:.0f} ms, {args.error_rate:.0%} errors, "
+          f"{args.malformed_rate:.0%} malformed)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
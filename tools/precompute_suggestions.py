@@ -0,0 +1,133 @@
+"""Precompute suggestions for every discrete check-in state.
+
+Suggestions depend only on mood, sleep and stress (1-5), anxiety and the
+platform, so the whole state space is small enough to generate ahead of
+time. The suggestions page then serves any state from the table with one
+lookup and no network call. Run from the repository root:
+
+    python -m tools.precompute_suggestions --source llm --concurrency 8
+    python -m tools.precompute_suggestions --source llm --refresh --max-age-days 30
+
+--source rules fills the table from the rule-based generator instead, e.g.
+to try the table without an API key. For a local stand-in for the API, see
+the OPENAI_BASE_URL setting. --refresh keeps fresh entries and regenerates
+only missing ones, entries older than --max-age-days, and entries from
+another source. Model entries are tagged with a hash of the prompt, so
+changing the prompt or model makes them stale too.
+"""
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from utils.suggestion_table import SuggestionTable, SUGGESTION_TABLE_FILE, table_platforms, iter_states
+
+def _mood_data(state):
+    mood, sleep, stress, anxiety, _ = state
+    return {"mood": mood, "sleep": sleep, "stress": stress, "anxiety": anxiety}
+
+def make_generator(source, read_cache):
+    """Return a function generating the suggestions for one state"""
+    if source == "llm":
+        from utils.openai_utils import fetch_llm_suggestions
+
+        def generate(state):
+            return fetch_llm_suggestions(_mood_data(state), state[4], read_cache=read_cache)
+    else:
+        from utils.suggestions_generator import generate_wellness_suggestions
+
+        def generate(state):
+            # Seeded by state so rebuilding gives the same table
+            return generate_wellness_suggestions(_mood_data(state), state[4], seed=f"precompute:{state}")
+    return generate
+
+def load_table(path, platforms):
+    """Load the existing table, moving its entries over if the platforms changed"""
+    try:
+        table = SuggestionTable.load(path)
+    except FileNotFoundError:
+        return SuggestionTable(platforms)
+    if table.platforms == platforms:
+        return table
+
+    migrated = SuggestionTable(platforms)
+    for state in iter_states(platforms):
+        entry = table.get_entry(state)
+        if entry is not None:
+            migrated.set_entry(state, [table.pool[i] for i in entry[0]], entry[1], entry[2])
+    return migrated
+
+def stale_states(table, source_tag, max_age_seconds):
+    """Return the states a refresh has to regenerate"""
+    oldest = time.time() - max_age_seconds if max_age_seconds else None
+    stale = []
+    for state in iter_states(table.platforms):
+        entry = table.get_entry(state)
+        if entry is None or entry[2] != source_tag or (oldest is not None and entry[1] < oldest):
+            stale.append(state)
+    return stale
+
+def precompute(args):
+    platforms = table_platforms()
+    source_tag = args.source
+    if args.source == "llm":
+        if not os.environ.get("OPENAI_API_KEY"):
+            sys.exit("OPENAI_API_KEY is not set; use --source rules to build the table without the API")
+        from utils.openai_utils import prompt_fingerprint
+        source_tag = f"llm:{prompt_fingerprint()[:16]}"
+
+    if args.refresh:
+        table = load_table(args.output, platforms)
+        states = stale_states(table, source_tag, args.max_age_days * 86400)
+    else:
+        table = SuggestionTable(platforms)
+        states = list(iter_states(platforms))
+    total = len(table.entries)
+    print(f"Generating {len(states)} of {total} states from {args.source} "
+          f"with concurrency {args.concurrency}")
+
+    # A refresh must not be answered from cached responses it is meant to replace
+    generate = make_generator(args.source, read_cache=not args.refresh)
+    start = time.perf_counter()
+    done = failed = 0
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        futures = {executor.submit(generate, state): state for state in states}
+        for future in as_completed(futures):
+            state = futures[future]
+            try:
+                suggestions = future.result()
+            except Exception as e:
+                # Keep whatever the table had; the next refresh retries it
+                failed += 1
+                print(f"Failed {state}: {e}", file=sys.stderr)
+                continue
+            table.set_entry(state, suggestions, int(time.time()), source_tag)
+            done += 1
+            if done % args.checkpoint == 0:
+                table.save(args.output)
+                print(f"{done}/{len(states)} states, {failed} failed")
+
+    table.compact()
+    table.save(args.output)
+    elapsed = time.perf_counter() - start
+    filled = sum(entry is not None for entry in table.entries)
+    print(f"Generated {done} states ({failed} failed) in {elapsed:.1f}s; "
+          f"{filled}/{total} states filled, {len(table.pool)} distinct suggestions in {args.output}")
+    return 1 if failed else 0
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", choices=["llm", "rules"], default="llm")
+    parser.add_argument("--concurrency", type=int, default=4, help="Requests in flight at once")
+    parser.add_argument("--output", default=SUGGESTION_TABLE_FILE)
+    parser.add_argument("--refresh", action="store_true", help="Only regenerate missing or stale entries")
+    parser.add_argument("--max-age-days", type=float, default=30,
+                        help="With --refresh, regenerate entries older than this; 0 keeps entries of any age")
+    parser.add_argument("--checkpoint", type=int, default=100, help="Save the table every this many states")
+    args = parser.parse_args()
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    sys.exit(precompute(args))
+
+if __name__ == "__main__":
+    main()
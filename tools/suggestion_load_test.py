@@ -0,0 +1,210 @@
+"""Load test the model suggestion path against an OpenAI-compatible server.
+
+Each simulated visit to the suggestions page does what the page does:
+submit the model request to the suggestion pool, wait up to the deadline,
+fall back to rule-based suggestions if it hasn't answered, and keep
+waiting up to the late wait for the model's answer. Reports latency
+percentiles and how often visitors saw the fallback. Run from the
+repository root, either against a running server or a mock started in
+process:
+
+    python -m tools.suggestion_load_test --serve --latency lognormal --latency-ms 1500 --error-rate 0.05 \\
+        --requests 500 --concurrency 20
+    python -m tools.suggestion_load_test --base-url http://127.0.0.1:8089/v1 --requests 200
+
+The response cache starts empty and is bypassed unless --cache is given,
+so every visit reaches the server.
+"""
+import os
+import sys
+import json
+import time
+import logging
+import random
+import shutil
+import argparse
+import tempfile
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
+from tools.mock_openai_server import add_server_arguments, make_server
+
+def percentile(ordered, q):
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))]
+
+def latency_summary(values):
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "p50_s": percentile(ordered, 0.50),
+        "p95_s": percentile(ordered, 0.95),
+        "p99_s": percentile(ordered, 0.99),
+        "max_s": ordered[-1] if ordered else None
+    }
+
+def failure_reason(error):
+    """Short label for why a model request failed"""
+    import openai
+    from utils.openai_utils import SuggestionFormatError
+    if isinstance(error, json.JSONDecodeError):
+        return "malformed_json"
+    if isinstance(error, SuggestionFormatError):
+        return "wrong_format"
+    if isinstance(error, openai.APITimeoutError):
+        return "timeout"
+    if isinstance(error, openai.APIStatusError):
+        return f"http_{error.status_code}"
+    if isinstance(error, openai.APIConnectionError):
+        return "connection"
+    return type(error).__name__
+
+def random_state(rng, platforms):
+    mood_data = {
+        "mood": rng.randint(1, 5),
+        "sleep": rng.randint(1, 5),
+        "stress": rng.randint(1, 5),
+        "anxiety": rng.random() < 0.3
+    }
+    return mood_data, rng.choice(platforms)
+
+def visit(mood_data, platform, args):
+    """Simulate one suggestions page visit; return its result record"""
+    from utils.suggestion_service import submit_llm_suggestions
+    from utils.suggestions_generator import generate_wellness_suggestions
+
+    start = time.perf_counter()
+    finished = {}
+    future = submit_llm_suggestions(mood_data, platform, read_cache=args.cache)
+    future.add_done_callback(lambda f: finished.setdefault("at", time.perf_counter()))
+
+    wait([future], timeout=args.deadline)
+    result = {"on_time": future.done()}
+    if not future.done() or future.exception() is not None:
+        # The page shows rule-based suggestions at this point
+        generate_wellness_suggestions(mood_data, platform)
+    result["time_to_content_s"] = time.perf_counter() - start
+
+    wait([future], timeout=max(0.0, args.deadline + args.late_wait - (time.perf_counter() - start)))
+    if not future.done():
+        result["outcome"] = "no_answer"
+        return result
+    error = future.exception()
+    result["llm_latency_s"] = finished.get("at", time.perf_counter()) - start
+    if error is not None:
+        result["outcome"] = failure_reason(error)
+    else:
+        result["outcome"] = "llm_on_time" if result["on_time"] else "llm_late"
+    return result
+
+def run(args):
+    from utils.questionnaire import get_registry
+    platforms = [None] + list(get_registry())
+    rng = random.Random(args.seed)
+    states = [random_state(rng, platforms) for _ in range(args.requests)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as visitors:
+        results = list(visitors.map(lambda state: visit(state[0], state[1], args), states))
+    elapsed = time.perf_counter() - start
+
+    outcomes = Counter(result["outcome"] for result in results)
+    fell_back = sum(1 for result in results if result["outcome"] != "llm_on_time")
+    never_llm = sum(1 for result in results if result["outcome"] not in ("llm_on_time", "llm_late"))
+    return {
+        "requests": len(results),
+        "concurrency": args.concurrency,
+        "workers": args.workers,
+        "deadline_s": args.deadline,
+        "late_wait_s": args.late_wait,
+        "elapsed_s": elapsed,
+        "throughput_per_s": len(results) / elapsed if elapsed > 0 else None,
+        "time_to_content": latency_summary([r["time_to_content_s"] for r in results]),
+        "llm_latency": latency_summary([r["llm_latency_s"] for r in results if "llm_latency_s" in r]),
+        "outcomes": dict(outcomes),
+        # Visits that first showed rule-based suggestions, and those that never got the model's
+        "fallback_rate": fell_back / len(results) if results else 0.0,
+        "final_fallback_rate": never_llm / len(results) if results else 0.0
+    }
+
+def print_report(report):
+    def ms(value):
+        return "-" if value is None else f"{value * 1000:.0f}"
+
+    print(f"{report['requests']} visits at concurrency {report['concurrency']} ({report['workers']} model workers) "
+          f"in {report['elapsed_s']:.1f}s, {report['throughput_per_s']:.1f}/s")
+    print(f"{'':<18} {'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for name in ("time_to_content", "llm_latency"):
+        summary = report[name]
+        print(f"{name:<18} {summary['count']:>6} {ms(summary['p50_s']):>8} {ms(summary['p95_s']):>8} "
+              f"{ms(summary['p99_s']):>8} {ms(summary['max_s']):>8}")
+    print("outcomes: " + ", ".join(f"{name}={count}" for name, count in sorted(report["outcomes"].items())))
+    print(f"fallback rate {report['fallback_rate']:.1%} shown first, {report['final_fallback_rate']:.1%} never replaced")
+    if "server" in report:
+        print("server: " + ", ".join(f"{name}={count}" for name, count in report["server"].items()))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="Simulated page visits")
+    parser.add_argument("--concurrency", type=int, default=10, help="Visits in progress at once")
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("SUGGESTION_WORKERS", "4")),
+                        help="Model requests in flight at once, as SUGGESTION_WORKERS in the app")
+    parser.add_argument("--deadline", type=float, default=float(os.environ.get("SUGGESTION_DEADLINE", "2")))
+    parser.add_argument("--late-wait", type=float, default=float(os.environ.get("SUGGESTION_LATE_WAIT", "15")))
+    parser.add_argument("--timeout", type=float, default=30, help="Client request timeout, as OPENAI_TIMEOUT")
+    parser.add_argument("--max-retries", type=int, default=2, help="Client retries, as OPENAI_MAX_RETRIES")
+    parser.add_argument("--cache", action="store_true", help="Answer repeat states from the response cache")
+    parser.add_argument("--base-url", default=os.environ.get("OPENAI_BASE_URL"),
+                        help="OpenAI-compatible API to test against")
+    parser.add_argument("--serve", action="store_true", help="Start the mock server in this process")
+    parser.add_argument("--real-key", action="store_true",
+                        help="Send the OPENAI_API_KEY from the environment instead of a dummy key")
+    parser.add_argument("--json", help="Also write the report to this file")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    if args.real_key and not os.environ.get("OPENAI_API_KEY"):
+        sys.exit("--real-key needs OPENAI_API_KEY to be set")
+
+    server = None
+    if args.serve:
+        server = make_server(args, port=0)
+        threading.Thread(target=server.serve_forever, name="mock-openai", daemon=True).start()
+        args.base_url = f"http://127.0.0.1:{server.server_port}/v1"
+    if not args.base_url:
+        sys.exit("Pass --base-url or --serve; the load test doesn't run against the real API by default")
+
+    # The client and the suggestion pool read these when first imported
+    os.environ["OPENAI_BASE_URL"] = args.base_url
+    # Never send an exported real key to the test server unless asked to
+    if not args.real_key:
+        os.environ["OPENAI_API_KEY"] = "mock"
+    os.environ["OPENAI_TIMEOUT"] = str(args.timeout)
+    os.environ["OPENAI_MAX_RETRIES"] = str(args.max_retries)
+    os.environ["SUGGESTION_WORKERS"] = str(args.workers)
+    # Keep the load test's responses out of the app's cache directory
+    cache_dir = tempfile.mkdtemp(prefix="suggestion_load_test_")
+    os.environ["OPENAI_CACHE_DIR"] = cache_dir
+    # One log line per request drowns out the report
+    for name in ("httpx", "openai"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    try:
+        report = run(args)
+        if server is not None:
+            report["server"] = server.RequestHandlerClass.behaviour.stats()
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    report["base_url"] = args.base_url
+
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,49 @@
 import streamlit as st
-import pandas as pd
 import datetime
 import random
+import math
 import os
 import json
-import joblib
-import numpy as np
+import shutil
+import tempfile
+import threading
 from assets.quotes import motivational_quotes
+from utils.storage_utils import append_mood_entry
+from utils.file_utils import file_lock, atomic_write_text, atomic_write_json
+from utils.model_cache import ModelHolder
+from utils.metrics import timed, start_metrics_exporter
+
+# Every page imports this module, so pandas, NumPy, joblib and sklearn (and the
+# utils modules built on them) are imported inside the functions that use them.
+# Pages that only need the session helpers then start without loading them.
 
 # Set up data directory
 DATA_DIR = "data"
 if not os.path.exists(DATA_DIR):
     os.makedirs(DATA_DIR)
 
+# Trained wellbeing model, shared by every session in this process
+MODEL_FILE = os.path.join(DATA_DIR, "wellbeing_model.pkl")
+MODEL_META_FILE = os.path.join(DATA_DIR, "wellbeing_model.json")
+model_holder = ModelHolder(MODEL_FILE)
+# Folded coefficients of the same model, for scoring single check-ins without sklearn
+MODEL_BUNDLE_FILE = os.path.join(DATA_DIR, "wellbeing_model_coef.json")
+
+def _load_bundle(path):
+    from utils.fast_predictor import LinearBundle
+    return LinearBundle.load(path)
+
+bundle_holder = ModelHolder(MODEL_BUNDLE_FILE, loader=_load_bundle)
+
+# Background retraining worker, started on first use
+_retrain_worker = None
+_retrain_worker_lock = threading.Lock()
+
+# Legacy single-document dataset and its append-only replacement
+ML_DATASET_FILE = os.path.join(DATA_DIR, "ml_dataset.json")
+ML_DATASET_LOG_FILE = os.path.join(DATA_DIR, "ml_dataset.jsonl")
+
+@timed()
 def initialize_session_state():
     """Initialize session state variables if they don't exist"""
     if "user_name" not in st.session_state:
@@ -41,7 +72,14 @@ def initialize_session_state():
     
     if "user_email" not in st.session_state:
         st.session_state["user_email"] = None
+    
+    if "history_version" not in st.session_state:
+        st.session_state["history_version"] = 0
+    
+    # Every page calls this, so it also starts the process's metrics file exporter
+    start_metrics_exporter()
 
+@timed()
 def save_user_data(responses):
     """Save user response data to session state and data file"""
     # Add timestamp
@@ -54,54 +92,149 @@ def save_user_data(responses):
     
     # Save to session state
     st.session_state["mood_data"].append(responses)
+    bump_history_version()
     
     # Save to user's data file if authenticated
     if st.session_state.get("authenticated") and st.session_state.get("user_id"):
-        user_data_file = os.path.join(DATA_DIR, f"user_{st.session_state['user_id']}.json")
         try:
-            if os.path.exists(user_data_file):
-                with open(user_data_file, "r") as f:
-                    user_data = json.load(f)
-            else:
-                user_data = {}
-            
-            user_data["mood_data"] = st.session_state["mood_data"]
-            
-            with open(user_data_file, "w") as f:
-                json.dump(user_data, f)
+            append_mood_entry(st.session_state["user_id"], responses)
         except Exception as e:
             st.error(f"Error saving user data: {e}")
     
     # Save to common dataset for ML training
-    save_to_ml_dataset(responses)
+    try:
+        save_to_ml_dataset(responses)
+    except TimeoutError as e:
+        st.error(f"Error saving to ML dataset: {e}")
+    get_retrain_worker().notify()
     
     # Reset current responses and step
     st.session_state["current_responses"] = {}
     st.session_state["current_step"] = 1
 
+@timed()
 def save_to_ml_dataset(responses):
-    """Append response data to a common dataset for ML training"""
-    ml_dataset_file = os.path.join(DATA_DIR, "ml_dataset.json")
+    """Append response data to the line-delimited dataset log for ML training"""
+    from utils import training_store
+    from utils.online_trainer import update_regression_stats
     
     try:
-        if os.path.exists(ml_dataset_file):
-            with open(ml_dataset_file, "r") as f:
-                try:
-                    dataset = json.load(f)
-                except json.JSONDecodeError:
-                    dataset = {"responses": []}
-        else:
-            dataset = {"responses": []}
-        
-        dataset["responses"].append(responses)
-        
-        with open(ml_dataset_file, "w") as f:
-            json.dump(dataset, f)
+        with file_lock(ML_DATASET_LOG_FILE, label="ml_dataset"):
+            # Carry over responses collected before the log existed
+            if not os.path.exists(ML_DATASET_LOG_FILE) and os.path.exists(ML_DATASET_FILE):
+                _convert_ml_dataset_locked()
+            
+            # One record per line, so each submit only writes its own response
+            with open(ML_DATASET_LOG_FILE, "a") as f:
+                f.write(json.dumps(responses) + "\n")
+            
+            # Keep the columnar training copy and regression statistics in step with the log
+            if training_store.exists():
+                training_store.append_responses([responses])
+            update_regression_stats([responses])
+    except TimeoutError:
+        # The response would silently go missing from the dataset; let the caller report it
+        raise
     except Exception as e:
         print(f"Error saving to ML dataset: {e}")
 
-def get_mood_data_as_df():
-    """Convert mood data to pandas DataFrame for visualization"""
+def _iter_ml_log(start=0, stop=None):
+    """Yield the responses logged between two byte offsets of the dataset log"""
+    try:
+        f = open(ML_DATASET_LOG_FILE, "rb")
+    except FileNotFoundError:
+        return
+    
+    with f:
+        f.seek(start)
+        position = start
+        for line in f:
+            position += len(line)
+            if stop is not None and position > stop:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # Skip a partially written line left by an interrupted submit
+                continue
+
+def iter_ml_dataset():
+    """Yield ML training responses one at a time, oldest first"""
+    if os.path.exists(ML_DATASET_LOG_FILE):
+        yield from _iter_ml_log()
+    elif os.path.exists(ML_DATASET_FILE):
+        # Fall back to the legacy single-document layout
+        with open(ML_DATASET_FILE, "r") as f:
+            try:
+                dataset = json.load(f)
+            except json.JSONDecodeError:
+                dataset = {"responses": []}
+        for responses in dataset.get("responses", []):
+            yield responses
+
+@timed()
+def convert_ml_dataset_to_jsonl():
+    """Convert the legacy {"responses": [...]} dataset file to the JSONL log.
+    
+    Returns the number of responses written. The legacy file is left in
+    place so the conversion can be checked before it is removed. Once the
+    log exists it is the live dataset, so converting again does nothing
+    and returns 0 rather than overwriting newer check-ins.
+    """
+    with file_lock(ML_DATASET_LOG_FILE, label="ml_dataset"):
+        return _convert_ml_dataset_locked()
+
+def _convert_ml_dataset_locked():
+    if not os.path.exists(ML_DATASET_FILE) or os.path.exists(ML_DATASET_LOG_FILE):
+        return 0
+    
+    try:
+        with open(ML_DATASET_FILE, "r") as f:
+            dataset = json.load(f)
+    except json.JSONDecodeError as e:
+        # Start the log empty, as the old single-file writer did, but keep the
+        # damaged file for manual recovery and so the conversion isn't retried
+        os.replace(ML_DATASET_FILE, ML_DATASET_FILE + ".corrupt")
+        print(f"Moved unreadable {ML_DATASET_FILE} aside to {ML_DATASET_FILE}.corrupt: {e}")
+        dataset = {"responses": []}
+
+    # Replace atomically so a crash never leaves a half-converted log
+    responses = dataset.get("responses", [])
+    atomic_write_text(ML_DATASET_LOG_FILE, "".join(json.dumps(r) + "\n" for r in responses))
+    
+    return len(responses)
+
+def bump_history_version():
+    """Mark the session's mood history as changed, invalidating data derived from it"""
+    st.session_state["history_version"] = st.session_state.get("history_version", 0) + 1
+
+def get_derived_history(name, build):
+    """Return build()'s result for the current mood history, cached in the session.
+    
+    Cached values are dropped whenever the history version changes, so reruns
+    triggered by unrelated widgets reuse them. As a safety net the mood_data
+    list's identity and length are part of the key too. Callers get the cached
+    object itself and must not modify it.
+    """
+    mood_data = st.session_state.get("mood_data", [])
+    key = (st.session_state.get("history_version", 0), id(mood_data), len(mood_data))
+    
+    cache = st.session_state.get("history_cache")
+    if cache is None or cache["key"] != key:
+        cache = {"key": key, "items": {}}
+        st.session_state["history_cache"] = cache
+    
+    items = cache["items"]
+    if name not in items:
+        items[name] = build()
+    return items[name]
+
+def _build_mood_data_df():
+    import pandas as pd
+    
     if not st.session_state.get("mood_data", []):
         return pd.DataFrame()
     
@@ -115,11 +248,29 @@ def get_mood_data_as_df():
     
     return df
 
+@timed()
+def get_mood_data_as_df():
+    """Convert mood data to pandas DataFrame for visualization"""
+    # A shallow copy, so callers can add columns without touching the cached frame
+    return get_derived_history("mood_df", _build_mood_data_df).copy(deep=False)
+
+def _build_scored_mood_data_df():
+    df = get_mood_data_as_df()
+    if not df.empty:
+        df['wellbeing_score'] = calculate_wellbeing_scores(df)
+    return df
+
+@timed()
+def get_scored_mood_data_df():
+    """Return the mood data DataFrame with a wellbeing_score column for every entry"""
+    return get_derived_history("scored_mood_df", _build_scored_mood_data_df).copy(deep=False)
+
 def get_random_quote():
     """Return a random motivational quote"""
     quote_entry = random.choice(motivational_quotes)
     return quote_entry["quote"], quote_entry["author"]
 
+@timed()
 def calculate_wellbeing_score(data):
     """Calculate an overall wellbeing score based on mood data"""
     # Check if data is a pandas Series or DataFrame
@@ -133,7 +284,7 @@ def calculate_wellbeing_score(data):
     if "ml_wellbeing_score" in data:
         ml_score = data["ml_wellbeing_score"]
         # Handle NaN or None values
-        if ml_score is None or (isinstance(ml_score, float) and pd.isna(ml_score)):
+        if ml_score is None or (isinstance(ml_score, float) and math.isnan(ml_score)):
             ml_score = 0
         try:
             return int(ml_score)
@@ -143,20 +294,20 @@ def calculate_wellbeing_score(data):
     try:
         # Extract relevant metrics (with NaN handling)
         mood = data.get('mood', 3)
-        if mood is None or (isinstance(mood, float) and pd.isna(mood)):
+        if mood is None or (isinstance(mood, float) and math.isnan(mood)):
             mood = 3
         
         sleep = data.get('sleep', 3)
-        if sleep is None or (isinstance(sleep, float) and pd.isna(sleep)):
+        if sleep is None or (isinstance(sleep, float) and math.isnan(sleep)):
             sleep = 3
         
         stress = data.get('stress', 3)
-        if stress is None or (isinstance(stress, float) and pd.isna(stress)):
+        if stress is None or (isinstance(stress, float) and math.isnan(stress)):
             stress = 3
         stress = 6 - stress  # Invert stress so higher is better
         
         anxiety = data.get('anxiety', False)
-        if anxiety is None or (isinstance(anxiety, float) and pd.isna(anxiety)):
+        if anxiety is None or (isinstance(anxiety, float) and math.isnan(anxiety)):
             anxiety = False
         anxiety = 0 if anxiety else 1  # 0 if anxious, 1 if not
         
@@ -169,178 +320,196 @@ def calculate_wellbeing_score(data):
         print(f"Error calculating wellbeing score: {e}")
         return 0
 
+def _metric_column(df, name, default):
+    """Return a metric column as floats with missing values set to default, or None if it isn't numeric"""
+    import numpy as np
+    from pandas.api.types import is_numeric_dtype
+
+    if name not in df.columns:
+        return np.full(len(df), float(default))
+    column = df[name]
+    if not is_numeric_dtype(column):
+        return None
+    values = column.to_numpy(dtype=float, na_value=np.nan)
+    return np.where(np.isnan(values), float(default), values)
+
+@timed()
+def calculate_wellbeing_scores(df):
+    """Calculate calculate_wellbeing_score for every row of a mood DataFrame at once.
+
+    Returns an integer Series aligned with the frame's index. Frames with
+    non-numeric metric columns, which the per-row function handles value by
+    value, fall back to applying it row by row.
+    """
+    import numpy as np
+    import pandas as pd
+    from pandas.api.types import is_numeric_dtype
+
+    if df.empty:
+        return pd.Series([], index=df.index, dtype=int)
+
+    # Use ML score if available: missing scores count as 0, others are truncated like int()
+    if "ml_wellbeing_score" in df.columns:
+        column = df["ml_wellbeing_score"]
+        if is_numeric_dtype(column):
+            ml_scores = column.to_numpy(dtype=float, na_value=np.nan)
+            ml_scores = np.where(np.isnan(ml_scores), 0.0, ml_scores)
+            if np.isfinite(ml_scores).all():
+                return pd.Series(np.trunc(ml_scores).astype(int), index=df.index)
+        return df.apply(calculate_wellbeing_score, axis=1)
+
+    mood = _metric_column(df, "mood", 3)
+    sleep = _metric_column(df, "sleep", 3)
+    stress = _metric_column(df, "stress", 3)
+    if mood is None or sleep is None or stress is None:
+        return df.apply(calculate_wellbeing_score, axis=1)
+    stress = 6 - stress  # Invert stress so higher is better
+
+    # 0 if anxious, 1 if not; missing answers count as not anxious
+    if "anxiety" not in df.columns:
+        anxiety = np.ones(len(df))
+    else:
+        anxious = df["anxiety"].map(lambda value: bool(value) and not (isinstance(value, float) and math.isnan(value)))
+        anxiety = np.where(anxious.to_numpy(dtype=bool), 0.0, 1.0)
+
+    # Same weights and operation order as calculate_wellbeing_score, so rounding matches exactly
+    wellbeing_score = (mood * 0.4) + (sleep * 0.3) + (stress * 0.2) + (anxiety * 0.1)
+
+    # Convert to 0-100 scale; np.rint rounds half to even like round()
+    return pd.Series(np.rint((wellbeing_score / 5) * 100).astype(int), index=df.index)
+
+def _ensure_training_copies():
+    """Return the regression statistics, building them and the training store if either is missing.
+    
+    Both are normally kept up to date by save_to_ml_dataset. Building them
+    reads the whole log, so it runs outside the dataset lock and check-ins
+    keep being saved meanwhile; the responses appended during the build are
+    replayed under the lock before the new copies replace the old ones.
+    """
+    from utils import training_store
+    from utils.online_trainer import (load_regression_stats, save_regression_stats,
+                                      stats_from_store, stats_from_responses)
+    
+    with file_lock(ML_DATASET_LOG_FILE, label="ml_dataset"):
+        stats = load_regression_stats()
+        if stats is not None and training_store.exists():
+            return stats
+        if not os.path.exists(ML_DATASET_LOG_FILE):
+            _convert_ml_dataset_locked()
+        snapshot = os.path.getsize(ML_DATASET_LOG_FILE) if os.path.exists(ML_DATASET_LOG_FILE) else 0
+    
+    build_dir = tempfile.mkdtemp(dir=DATA_DIR, prefix="training_store.", suffix=".tmp")
+    try:
+        store_dir = os.path.join(build_dir, "store")
+        training_store.rebuild(_iter_ml_log(stop=snapshot), store_dir)
+        stats = stats_from_store(store_dir)
+        
+        with file_lock(ML_DATASET_LOG_FILE, label="ml_dataset"):
+            tail = list(_iter_ml_log(start=snapshot))
+            if tail:
+                training_store.append_responses(tail, store_dir)
+                stats.merge(stats_from_responses(tail))
+            training_store.install(store_dir)
+            save_regression_stats(stats)
+    finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
+    return stats
+
+@timed()
 def train_ml_model():
     """Train a machine learning model on the collected data"""
-    ml_dataset_file = os.path.join(DATA_DIR, "ml_dataset.json")
-    model_file = os.path.join(DATA_DIR, "wellbeing_model.pkl")
+    import joblib
+    from utils.fast_predictor import LinearBundle
+    
+    model_file = MODEL_FILE
     
-    if not os.path.exists(ml_dataset_file):
+    if not os.path.exists(ML_DATASET_LOG_FILE) and not os.path.exists(ML_DATASET_FILE):
         return False
     
     try:
-        with open(ml_dataset_file, "r") as f:
-            dataset = json.load(f)
+        stats = _ensure_training_copies()
         
-        if len(dataset["responses"]) < 5:  # Need at least 5 data points
+        rows = stats.n
+        if rows < 5:  # Need at least 5 data points
             return False
         
-        # Convert to DataFrame
-        df = pd.DataFrame(dataset["responses"])
-        
-        # Extract features
-        features = []
-        target = []
-        
-        for _, row in df.iterrows():
-            # Basic features
-            feature_dict = {
-                "mood": row.get("mood", 3),
-                "sleep": row.get("sleep", 3),
-                "stress": row.get("stress", 3),
-                "anxiety": 1 if row.get("anxiety", False) else 0
-            }
-            
-            # Add platform-specific features if available
-            if "platform" in row:
-                platform = row["platform"].lower() if row["platform"] else "none"
-                feature_dict["platform_" + platform] = 1
-                
-                # Add time spent on platform if available
-                if "platform_time" in row:
-                    time_mapping = {
-                        "Less than 30 minutes": 1,
-                        "30 minutes to 1 hour": 2,
-                        "1-2 hours": 3,
-                        "2-3 hours": 4,
-                        "More than 3 hours": 5
-                    }
-                    feature_dict["platform_time"] = time_mapping.get(row["platform_time"], 3)
-                
-                # Add content impact if available
-                if "content_impact" in row:
-                    impact_mapping = {
-                        "Positive": 1,
-                        "Neutral": 0,
-                        "Negative": -1
-                    }
-                    feature_dict["content_impact"] = impact_mapping.get(row["content_impact"], 0)
-            
-            features.append(feature_dict)
-            
-            # Calculate traditional wellbeing score as target
-            mood = row.get("mood", 3)
-            sleep = row.get("sleep", 3)
-            stress = 6 - row.get("stress", 3)  # Invert stress so higher is better
-            anxiety = 0 if row.get("anxiety", False) else 1  # 0 if anxious, 1 if not
-            
-            wellbeing_score = (mood * 0.4) + (sleep * 0.3) + (stress * 0.2) + (anxiety * 0.1)
-            target.append(round((wellbeing_score / 5) * 100))
-        
-        # Convert to DataFrame for scikit-learn
-        X = pd.DataFrame(features).fillna(0)
-        y = np.array(target)
-        
-        # Handle categorical variables
-        X = pd.get_dummies(X, drop_first=True)
-        
-        # Train a simple model (Linear Regression)
-        from sklearn.linear_model import LinearRegression
-        from sklearn.preprocessing import StandardScaler
-        
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
-        
-        model = LinearRegression()
-        model.fit(X_scaled, y)
+        # Solve the StandardScaler + LinearRegression fit exactly from the
+        # running statistics, without re-reading the dataset
+        model, scaler, feature_names = stats.to_sklearn()
         
         # Save model and scaler
-        joblib.dump((model, scaler, list(X.columns)), model_file)
+        # Dump next to the artifact and rename, so concurrent predictions never load a partial file
+        tmp_file = f"{model_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        joblib.dump((model, scaler, feature_names), tmp_file)
+        os.replace(tmp_file, model_file)
+        model_holder.invalidate()
+        
+        # Export the compact coefficient bundle used by predict_ml_score
+        LinearBundle.from_artifact(model, scaler, feature_names).save(MODEL_BUNDLE_FILE)
+        bundle_holder.invalidate()
+        
+        # Record how many rows the model has seen, for the retraining triggers
+        atomic_write_json(MODEL_META_FILE, {
+            "rows": rows,
+            "trained_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        })
         
         return True
     except Exception as e:
         print(f"Error training ML model: {e}")
         return False
 
+def get_retrain_worker():
+    """Return this process's background retraining worker, starting it if needed"""
+    global _retrain_worker
+    if _retrain_worker is None:
+        with _retrain_worker_lock:
+            if _retrain_worker is None:
+                from utils.retrain_worker import RetrainWorker
+                worker = RetrainWorker(train_ml_model, model_holder, MODEL_META_FILE, dataset=iter_ml_dataset)
+                worker.start()
+                _retrain_worker = worker
+    return _retrain_worker
+
+@timed()
 def predict_ml_score(data):
     """Predict wellbeing score using the trained ML model"""
-    model_file = os.path.join(DATA_DIR, "wellbeing_model.pkl")
+    try:
+        # A single check-in is just a dot product over the folded coefficients
+        bundle = bundle_holder.get()
+        if bundle is not None:
+            return bundle.predict(data)
+    except Exception as e:
+        print(f"Error loading model bundle: {e}")
     
-    if not os.path.exists(model_file):
-        # Try to train the model first
-        if train_ml_model():
-            # If training succeeded, the model file should exist now
-            if not os.path.exists(model_file):
-                return None
-        else:
-            return None
+    # Models trained before bundles existed go through the sklearn path
+    return predict_ml_scores([data])[0]
+
+@timed()
+def predict_ml_scores(records):
+    """Predict wellbeing scores for a batch of responses in one matrix operation.
     
+    Returns a list with one 0-100 score per record, or Nones if no model is available.
+    """
     try:
-        # Load model
-        model, scaler, feature_names = joblib.load(model_file)
-        
-        # Extract features from data
-        feature_dict = {
-            "mood": data.get("mood", 3),
-            "sleep": data.get("sleep", 3),
-            "stress": data.get("stress", 3),
-            "anxiety": 1 if data.get("anxiety", False) else 0
-        }
-        
-        # Add platform-specific features if available
-        if "platform" in data:
-            platform = data["platform"].lower() if data["platform"] else "none"
-            feature_dict["platform_" + platform] = 1
-            
-            # Add time spent on platform if available
-            if "platform_time" in data:
-                time_mapping = {
-                    "Less than 30 minutes": 1,
-                    "30 minutes to 1 hour": 2,
-                    "1-2 hours": 3,
-                    "2-3 hours": 4,
-                    "More than 3 hours": 5
-                }
-                feature_dict["platform_time"] = time_mapping.get(data["platform_time"], 3)
-            
-            # Add content impact if available
-            if "content_impact" in data:
-                impact_mapping = {
-                    "Positive": 1,
-                    "Neutral": 0,
-                    "Negative": -1
-                }
-                feature_dict["content_impact"] = impact_mapping.get(data["content_impact"], 0)
-        
-        # Convert to DataFrame
-        X = pd.DataFrame([feature_dict]).fillna(0)
-        
-        # Handle categorical variables and match the training columns
-        X = pd.get_dummies(X, drop_first=True)
-        
-        # Ensure all columns from training are present
-        for col in feature_names:
-            if col not in X.columns:
-                X[col] = 0
-        
-        # Keep only the columns used during training
-        X = X[feature_names]
-        
-        # Scale features
-        X_scaled = scaler.transform(X)
-        
-        # Predict
-        prediction = model.predict(X_scaled)[0]
-        
-        # Ensure prediction is in 0-100 range
-        prediction = max(0, min(100, prediction))
-        
-        return round(prediction)
+        # Reuse the model loaded by this process unless the artifact changed
+        artifact = model_holder.get()
+        if artifact is None:
+            # Training happens in the background; score once a model exists
+            get_retrain_worker().notify()
+            return [None] * len(records)
+        
+        from utils.scoring import score_records
+        return score_records(artifact, records)
     except Exception as e:
         print(f"Error predicting ML score: {e}")
-        return None
+        return [None] * len(records)
 
+@timed()
 def export_user_data_csv():
     """Export user's mood data to CSV file"""
+    import pandas as pd
+    
     if not st.session_state.get("authenticated") or not st.session_state.get("user_id"):
         return None
     
@@ -366,4 +535,8 @@ def export_user_data_csv():
         return filepath
     except Exception as e:
         st.error(f"Error exporting data: {e}")
-        return None
\ No newline at end of file
+        return None
+
+def get_model_cache_stats():
+    """Return load-count and load-latency counters for the shared model cache"""
+    return model_holder.stats()
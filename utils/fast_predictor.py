@@ -0,0 +1,56 @@
+import json
+from utils.feature_encoder import record_features
+from utils.file_utils import atomic_write_json
+
+class LinearBundle:
+    """Compact linear model for scoring single check-ins without sklearn or pandas.
+
+    StandardScaler followed by LinearRegression is a single linear function,
+    so the scaler's mean and scale are folded into one weight per feature plus
+    a bias. Scoring is then a short dot product over the features present in the
+    response.
+    """
+
+    def __init__(self, feature_names, weights, bias):
+        self.feature_names = list(feature_names)
+        self.weights = dict(zip(self.feature_names, weights))
+        self.bias = bias
+
+    @classmethod
+    def from_artifact(cls, model, scaler, feature_names):
+        """Fold a fitted scaler and linear model into a bundle"""
+        coef = [float(c) for c in model.coef_]
+        mean = [float(m) for m in scaler.mean_]
+        scale = [float(s) for s in scaler.scale_]
+        weights = [c / s for c, s in zip(coef, scale)]
+        bias = float(model.intercept_) - sum(w * m for w, m in zip(weights, mean))
+        return cls(feature_names, weights, bias)
+
+    def to_dict(self):
+        return {
+            "feature_names": self.feature_names,
+            "weights": [self.weights[name] for name in self.feature_names],
+            "bias": self.bias
+        }
+
+    def save(self, path):
+        atomic_write_json(path, self.to_dict())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r") as f:
+            data = json.load(f)
+        return cls(data["feature_names"], data["weights"], data["bias"])
+
+    def predict(self, data):
+        """Return the 0-100 wellbeing score for one response dict"""
+        weights = self.weights
+        prediction = self.bias
+        for name, value in record_features(data).items():
+            # Features the model never saw during training contribute nothing
+            prediction += weights.get(name, 0.0) * value
+
+        # Ensure prediction is in 0-100 range
+        prediction = max(0, min(100, prediction))
+
+        return round(prediction)
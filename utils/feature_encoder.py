@@ -0,0 +1,162 @@
+import numpy as np
+
+# Raw per-response columns shared by the training store and the encoder
+COLUMN_DTYPES = {
+    "mood": np.float32,
+    "sleep": np.float32,
+    "stress": np.float32,
+    "anxiety": np.int8,
+    # Index into the platform vocabulary, -1 when the response has no platform
+    "platform": np.int16,
+    # 0 when the response has no platform_time / content_impact answer
+    "platform_time": np.int8,
+    "content_impact": np.int8,
+}
+
+BASE_FEATURES = ["mood", "sleep", "stress", "anxiety"]
+
+TIME_MAPPING = {
+    "Less than 30 minutes": 1,
+    "30 minutes to 1 hour": 2,
+    "1-2 hours": 3,
+    "2-3 hours": 4,
+    "More than 3 hours": 5
+}
+
+IMPACT_MAPPING = {
+    "Positive": 1,
+    "Neutral": 0,
+    "Negative": -1
+}
+
+def empty_vocabulary():
+    """Return a vocabulary with no platforms and no optional columns seen"""
+    return {"platforms": [], "has_platform_time": False, "has_content_impact": False}
+
+def _number(value, default):
+    if value is None or isinstance(value, bool):
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+def _platform_name(row):
+    return row["platform"].lower() if row["platform"] else "none"
+
+def record_features(row):
+    """Return the features present in one response as a {name: value} dict, in plain Python"""
+    features = {
+        "mood": _number(row.get("mood", 3), 3),
+        "sleep": _number(row.get("sleep", 3), 3),
+        "stress": _number(row.get("stress", 3), 3),
+        "anxiety": 1 if row.get("anxiety", False) else 0
+    }
+
+    if "platform" in row:
+        features["platform_" + _platform_name(row)] = 1
+        if "platform_time" in row:
+            features["platform_time"] = TIME_MAPPING.get(row["platform_time"], 3)
+        if "content_impact" in row:
+            features["content_impact"] = IMPACT_MAPPING.get(row["content_impact"], 0)
+
+    return features
+
+def responses_to_columns(responses, vocabulary):
+    """Convert response dicts to raw column arrays, extending the vocabulary in place"""
+    platforms = vocabulary["platforms"]
+    platform_index = {name: i for i, name in enumerate(platforms)}
+
+    for row in responses:
+        if "platform" in row:
+            name = _platform_name(row)
+            if name not in platform_index:
+                platform_index[name] = len(platforms)
+                platforms.append(name)
+
+    with_platform = [row for row in responses if "platform" in row]
+    if any("platform_time" in row for row in with_platform):
+        vocabulary["has_platform_time"] = True
+    if any("content_impact" in row for row in with_platform):
+        vocabulary["has_content_impact"] = True
+
+    count = len(responses)
+    return {
+        "mood": np.fromiter((_number(row.get("mood", 3), 3) for row in responses), np.float32, count),
+        "sleep": np.fromiter((_number(row.get("sleep", 3), 3) for row in responses), np.float32, count),
+        "stress": np.fromiter((_number(row.get("stress", 3), 3) for row in responses), np.float32, count),
+        "anxiety": np.fromiter((1 if row.get("anxiety", False) else 0 for row in responses), np.int8, count),
+        "platform": np.fromiter(
+            (platform_index[_platform_name(row)] if "platform" in row else -1 for row in responses),
+            np.int16, count
+        ),
+        "platform_time": np.fromiter(
+            (TIME_MAPPING.get(row["platform_time"], 3) if "platform" in row and "platform_time" in row else 0
+             for row in responses),
+            np.int8, count
+        ),
+        "content_impact": np.fromiter(
+            (IMPACT_MAPPING.get(row["content_impact"], 0) if "platform" in row and "content_impact" in row else 0
+             for row in responses),
+            np.int8, count
+        ),
+    }
+
+class FeatureEncoder:
+    """Turn questionnaire responses into the model's feature matrix.
+
+    The fitted state is just the ordered list of feature names (base metrics,
+    one column per platform seen, then the optional platform answers), which
+    is saved with the model. Training and inference both encode through this
+    class, so they always agree on the columns.
+    """
+
+    def __init__(self, feature_names=None):
+        self.feature_names = list(feature_names) if feature_names is not None else None
+
+    @staticmethod
+    def names_for_vocabulary(vocabulary):
+        """Return the feature names implied by a column vocabulary"""
+        names = list(BASE_FEATURES)
+        names.extend("platform_" + platform for platform in vocabulary["platforms"])
+        if vocabulary["has_platform_time"]:
+            names.append("platform_time")
+        if vocabulary["has_content_impact"]:
+            names.append("content_impact")
+        return names
+
+    def fit_vocabulary(self, vocabulary):
+        """Fit the feature names from an existing vocabulary, e.g. the training store's"""
+        self.feature_names = self.names_for_vocabulary(vocabulary)
+        return self
+
+    def fit(self, responses):
+        """Fit the feature names from a batch of response dicts"""
+        vocabulary = empty_vocabulary()
+        responses_to_columns(responses, vocabulary)
+        return self.fit_vocabulary(vocabulary)
+
+    def encode_columns(self, columns, platforms):
+        """Encode raw column arrays, whose platform codes index `platforms`, to a float matrix"""
+        platform_codes = {"platform_" + name: code for code, name in enumerate(platforms)}
+        X = np.zeros((len(columns["mood"]), len(self.feature_names)), dtype=np.float64)
+        for j, name in enumerate(self.feature_names):
+            if name in columns:
+                X[:, j] = columns[name]
+            elif name in platform_codes:
+                X[:, j] = columns["platform"] == platform_codes[name]
+            # Platforms never seen by this batch stay all zero
+        return X
+
+    def transform(self, responses):
+        """Encode a batch of response dicts to a float matrix in a single pass"""
+        vocabulary = empty_vocabulary()
+        columns = responses_to_columns(responses, vocabulary)
+        return self.encode_columns(columns, vocabulary["platforms"])
+
+    def fit_transform(self, responses):
+        """Fit the feature names and encode the same batch"""
+        vocabulary = empty_vocabulary()
+        columns = responses_to_columns(responses, vocabulary)
+        self.fit_vocabulary(vocabulary)
+        return self.encode_columns(columns, vocabulary["platforms"])
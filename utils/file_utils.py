@@ -0,0 +1,153 @@
+import os
+import json
+import time
+import tempfile
+import threading
+import contextlib
+
+try:
+    import fcntl
+except ImportError:  # Windows has no flock, fall back to in-process locks
+    fcntl = None
+
+# Seconds to wait for a file lock before giving up
+LOCK_TIMEOUT = float(os.environ.get("LOCK_TIMEOUT", "10"))
+LOCK_POLL_INTERVAL = 0.005
+
+# The umask can only be read by setting it, which isn't thread-safe, so read it once at import
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+_metrics_guard = threading.Lock()
+_lock_metrics = {}
+
+_thread_locks_guard = threading.Lock()
+_thread_locks = {}
+
+def _record_lock_wait(label, wait, timed_out=False):
+    with _metrics_guard:
+        metrics = _lock_metrics.setdefault(label, {
+            "acquired": 0,
+            "timeouts": 0,
+            "total_wait": 0.0,
+            "max_wait": 0.0
+        })
+        if timed_out:
+            metrics["timeouts"] += 1
+        else:
+            metrics["acquired"] += 1
+        metrics["total_wait"] += wait
+        metrics["max_wait"] = max(metrics["max_wait"], wait)
+
+def get_lock_metrics():
+    """Return lock wait statistics per label, in seconds"""
+    with _metrics_guard:
+        snapshot = {}
+        for label, metrics in _lock_metrics.items():
+            attempts = metrics["acquired"] + metrics["timeouts"]
+            snapshot[label] = dict(metrics, avg_wait=metrics["total_wait"] / attempts if attempts else 0.0)
+        return snapshot
+
+def reset_lock_metrics():
+    """Clear all recorded lock wait statistics"""
+    with _metrics_guard:
+        _lock_metrics.clear()
+
+def _thread_lock_for(path):
+    with _thread_locks_guard:
+        return _thread_locks.setdefault(os.path.abspath(path), threading.Lock())
+
+@contextlib.contextmanager
+def file_lock(path, timeout=None, label=None):
+    """Hold an exclusive advisory lock on a file for the duration of the block.
+
+    The lock lives in a sidecar "<path>.lock" file, so each data file is locked
+    independently and sessions writing different files never wait on each other.
+    Raises TimeoutError if the lock can't be acquired within the timeout.
+    """
+    timeout = LOCK_TIMEOUT if timeout is None else timeout
+    label = label or os.path.basename(path)
+    start = time.perf_counter()
+
+    if fcntl is None:
+        lock = _thread_lock_for(path)
+        if not lock.acquire(timeout=timeout):
+            _record_lock_wait(label, time.perf_counter() - start, timed_out=True)
+            raise TimeoutError(f"Timed out waiting for lock on {path}")
+        _record_lock_wait(label, time.perf_counter() - start)
+        try:
+            yield
+        finally:
+            lock.release()
+        return
+
+    fd = os.open(path + ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.perf_counter() - start >= timeout:
+                    _record_lock_wait(label, time.perf_counter() - start, timed_out=True)
+                    raise TimeoutError(f"Timed out waiting for lock on {path}")
+                time.sleep(LOCK_POLL_INTERVAL)
+
+        _record_lock_wait(label, time.perf_counter() - start)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+def default_mode(directory=False):
+    """Return the permissions open() or os.makedirs() would give a new file or directory"""
+    return (0o777 if directory else 0o666) & ~_UMASK
+
+def _set_temp_mode(fd, path):
+    # mkstemp creates files as 0600; give the replacement the target's mode,
+    # or a new file's usual mode, so other readers keep access after the rename
+    if not hasattr(os, "fchmod"):  # Windows has no POSIX modes to keep
+        return
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = default_mode()
+    os.fchmod(fd, mode)
+
+def atomic_write_text(path, text):
+    """Replace a file's contents so readers see either the old or the new version"""
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            _set_temp_mode(f.fileno(), path)
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+def atomic_write_json(path, data):
+    """Serialize data to JSON and atomically replace the file with it"""
+    atomic_write_text(path, json.dumps(data))
+
+def atomic_create_json(path, data):
+    """Atomically create a JSON file, failing with FileExistsError if it already exists"""
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            _set_temp_mode(f.fileno(), path)
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        # link() refuses to overwrite, so the complete file appears only if the name is free
+        os.link(tmp_path, path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
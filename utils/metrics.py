@@ -0,0 +1,210 @@
+import os
+import time
+import bisect
+import threading
+import functools
+from utils.file_utils import atomic_write_text
+
+# Set METRICS_ENABLED=0 to leave functions undecorated
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "1") != "0"
+# Prometheus text file rewritten by the exporter thread, e.g. for node_exporter's textfile collector
+METRICS_FILE = os.environ.get("METRICS_FILE", os.path.join("data", "metrics.prom"))
+METRICS_EXPORT_INTERVAL = float(os.environ.get("METRICS_EXPORT_INTERVAL", "15"))
+
+METRIC_NAME = "wellness_function_duration_seconds"
+
+# Bucket upper bounds in nanoseconds: 1µs to about 95s, two buckets per doubling
+BUCKET_BOUNDS_NS = [round(1000 * 2 ** (i / 2)) for i in range(54)]
+# Recorded durations are buffered and folded into the buckets in batches of this size
+FOLD_BATCH = 1024
+
+_registry_guard = threading.Lock()
+_registry = {}
+
+_exporter = None
+_exporter_guard = threading.Lock()
+
+class Histogram:
+    """Call count and latency distribution for one instrumented function.
+
+    Latencies go into fixed log-spaced buckets and percentiles are estimated
+    from the buckets. Taking a lock on every call costs more than the rest of
+    the instrumentation, so record() only appends to a list, which is atomic
+    under the GIL, and the list is folded into the buckets under the lock once
+    it fills up or when the histogram is read.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self.pending = []
+        self.counts = [0] * (len(BUCKET_BOUNDS_NS) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, elapsed_ns):
+        pending = self.pending
+        pending.append(elapsed_ns)
+        if len(pending) >= FOLD_BATCH:
+            self.fold()
+
+    def fold(self):
+        """Move buffered durations into the buckets"""
+        with self._lock:
+            pending = self.pending
+            # Only this method removes items, and appends land after the first n,
+            # so durations recorded while folding stay buffered for the next fold
+            n = len(pending)
+            batch = pending[:n]
+            del pending[:n]
+
+            counts = self.counts
+            for elapsed_ns in batch:
+                counts[bisect.bisect_left(BUCKET_BOUNDS_NS, elapsed_ns)] += 1
+            if batch:
+                self.count += n
+                self.total_ns += sum(batch)
+                self.max_ns = max(self.max_ns, max(batch))
+
+    def _copy(self):
+        self.fold()
+        with self._lock:
+            return list(self.counts), self.count, self.total_ns, self.max_ns
+
+    @staticmethod
+    def _percentile(counts, count, max_ns, q):
+        """Estimate a percentile in seconds by interpolating within its bucket"""
+        if not count:
+            return 0.0
+        rank = q * count
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = BUCKET_BOUNDS_NS[index - 1] if index > 0 else 0
+                upper = BUCKET_BOUNDS_NS[index] if index < len(BUCKET_BOUNDS_NS) else max_ns
+                estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(estimate, max_ns) / 1e9
+            seen += bucket_count
+        return max_ns / 1e9
+
+    def summary(self):
+        counts, count, total_ns, max_ns = self._copy()
+        return {
+            "count": count,
+            "total_seconds": total_ns / 1e9,
+            "mean_seconds": total_ns / count / 1e9 if count else 0.0,
+            "max_seconds": max_ns / 1e9,
+            "p50_seconds": self._percentile(counts, count, max_ns, 0.50),
+            "p95_seconds": self._percentile(counts, count, max_ns, 0.95),
+            "p99_seconds": self._percentile(counts, count, max_ns, 0.99)
+        }
+
+def get_histogram(name):
+    """Return the registry's histogram for name, creating it on first use"""
+    histogram = _registry.get(name)
+    if histogram is None:
+        with _registry_guard:
+            histogram = _registry.setdefault(name, Histogram(name))
+    return histogram
+
+def timed(name=None):
+    """Decorator recording each call's duration under name (default: module.qualname)"""
+    def decorate(func):
+        if not METRICS_ENABLED:
+            return func
+        histogram = get_histogram(name or f"{func.__module__}.{func.__qualname__}")
+        clock = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                # Histogram.record() inlined, this runs on every call
+                pending = histogram.pending
+                pending.append(clock() - start)
+                if len(pending) >= FOLD_BATCH:
+                    histogram.fold()
+        return wrapper
+    return decorate
+
+class timer:
+    """Context manager recording the duration of a block under name"""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, name):
+        self._histogram = get_histogram(name) if METRICS_ENABLED else None
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._histogram is not None:
+            self._histogram.record(time.perf_counter_ns() - self._start)
+        return False
+
+def get_metrics():
+    """Return {name: summary} for every histogram, with latencies in seconds"""
+    with _registry_guard:
+        histograms = list(_registry.values())
+    return {histogram.name: histogram.summary() for histogram in sorted(histograms, key=lambda h: h.name)}
+
+def reset_metrics():
+    """Clear every recorded call, keeping the instrumented functions registered"""
+    with _registry_guard:
+        histograms = list(_registry.values())
+    for histogram in histograms:
+        with histogram._lock:
+            histogram.pending.clear()
+            histogram.counts = [0] * (len(BUCKET_BOUNDS_NS) + 1)
+            histogram.count = 0
+            histogram.total_ns = 0
+            histogram.max_ns = 0
+
+def prometheus_text():
+    """Render the registry in the Prometheus text exposition format"""
+    with _registry_guard:
+        histograms = sorted(_registry.values(), key=lambda h: h.name)
+
+    lines = [
+        f"# HELP {METRIC_NAME} Wall-clock time spent in instrumented functions.",
+        f"# TYPE {METRIC_NAME} histogram"
+    ]
+    bounds = [f"{bound / 1e9:.9g}" for bound in BUCKET_BOUNDS_NS] + ["+Inf"]
+    for histogram in histograms:
+        counts, count, total_ns, _ = histogram._copy()
+        label = histogram.name.replace("\\", "\\\\").replace('"', '\\"')
+        cumulative = 0
+        for bound, bucket_count in zip(bounds, counts):
+            cumulative += bucket_count
+            lines.append(f'{METRIC_NAME}_bucket{{function="{label}",le="{bound}"}} {cumulative}')
+        lines.append(f'{METRIC_NAME}_sum{{function="{label}"}} {total_ns / 1e9:.9g}')
+        lines.append(f'{METRIC_NAME}_count{{function="{label}"}} {count}')
+    return "\n".join(lines) + "\n"
+
+def write_prometheus_file(path=METRICS_FILE):
+    """Atomically replace path with the current registry, so scrapers never see a partial file"""
+    atomic_write_text(path, prometheus_text())
+
+def _export_loop():
+    while True:
+        time.sleep(METRICS_EXPORT_INTERVAL)
+        try:
+            write_prometheus_file()
+        except Exception as e:
+            print(f"Error writing metrics file: {e}")
+
+def start_metrics_exporter():
+    """Start this process's background thread that rewrites METRICS_FILE, if not running"""
+    global _exporter
+    if not METRICS_ENABLED or _exporter is not None:
+        return
+    with _exporter_guard:
+        if _exporter is None:
+            exporter = threading.Thread(target=_export_loop, name="metrics-exporter", daemon=True)
+            exporter.start()
+            _exporter = exporter
@@ -0,0 +1,80 @@
+import os
+import time
+import threading
+
+def _joblib_load(path):
+    import joblib
+    return joblib.load(path)
+
+class ModelHolder:
+    """Process-wide cache for the trained (model, scaler, feature_names) artifact.
+
+    Streamlit imports modules once per process, so a holder created at module
+    level is shared by every session. The artifact is reloaded only when the
+    file's mtime, size or inode changes, or when invalidate() bumps the version.
+    A different loader can be passed to cache other model files the same way.
+    """
+
+    def __init__(self, model_file, loader=_joblib_load):
+        self.model_file = model_file
+        self.loader = loader
+        self._lock = threading.Lock()
+        self._artifact = None
+        self._signature = None
+        self._version = 0
+        self.load_count = 0
+        self.load_errors = 0
+        self.total_load_seconds = 0.0
+        self.last_load_seconds = 0.0
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.model_file)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino, self._version)
+
+    def get(self):
+        """Return the cached artifact tuple, or None if no model has been trained"""
+        signature = self._file_signature()
+        if signature is None:
+            return None
+        if signature == self._signature:
+            return self._artifact
+
+        with self._lock:
+            # Another session may have reloaded while we waited
+            signature = self._file_signature()
+            if signature is None:
+                return None
+            if signature != self._signature:
+                start = time.perf_counter()
+                try:
+                    artifact = self.loader(self.model_file)
+                except Exception:
+                    self.load_errors += 1
+                    raise
+                elapsed = time.perf_counter() - start
+
+                self._artifact = artifact
+                self._signature = signature
+                self.load_count += 1
+                self.last_load_seconds = elapsed
+                self.total_load_seconds += elapsed
+            return self._artifact
+
+    def invalidate(self):
+        """Force the next get() to reload, e.g. after writing a new artifact"""
+        with self._lock:
+            self._version += 1
+
+    def stats(self):
+        """Return load counters so cache effectiveness can be checked"""
+        return {
+            "load_count": self.load_count,
+            "load_errors": self.load_errors,
+            "total_load_seconds": self.total_load_seconds,
+            "last_load_seconds": self.last_load_seconds,
+            "avg_load_seconds": self.total_load_seconds / self.load_count if self.load_count else 0.0,
+            "version": self._version
+        }
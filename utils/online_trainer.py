@@ -0,0 +1,208 @@
+import os
+import numpy as np
+from utils import training_store
+from utils.feature_encoder import FeatureEncoder, empty_vocabulary, responses_to_columns
+from utils.file_utils import file_lock
+
+REGRESSION_STATS_FILE = os.path.join("data", "regression_stats.npz")
+
+class RegressionStats:
+    """Sufficient statistics for a StandardScaler + LinearRegression model.
+
+    Keeps the row count, feature and target means, and the centered
+    cross-product matrices XᵀX and Xᵀy. These are enough to recover the
+    exact least-squares fit without revisiting the data. Batches are combined
+    with the pairwise update of Chan et al., which is numerically stable and
+    also merges statistics computed on separate shards. Adding a row costs
+    O(features²).
+    """
+
+    def __init__(self, feature_names=()):
+        k = len(feature_names)
+        self.feature_names = list(feature_names)
+        self.n = 0
+        self.mean_x = np.zeros(k)
+        self.mean_y = 0.0
+        self.cxx = np.zeros((k, k))
+        self.cxy = np.zeros(k)
+        self.cyy = 0.0
+
+    def _align(self, feature_names):
+        """Add any new features (zero for every row seen so far), return column positions"""
+        new_names = [name for name in feature_names if name not in self.feature_names]
+        if new_names:
+            k_old = len(self.feature_names)
+            k_new = k_old + len(new_names)
+            self.feature_names.extend(new_names)
+            self.mean_x = np.concatenate([self.mean_x, np.zeros(len(new_names))])
+            cxx = np.zeros((k_new, k_new))
+            cxx[:k_old, :k_old] = self.cxx
+            self.cxx = cxx
+            self.cxy = np.concatenate([self.cxy, np.zeros(len(new_names))])
+        positions = {name: i for i, name in enumerate(self.feature_names)}
+        return [positions[name] for name in feature_names]
+
+    def _combine(self, n_b, mean_x_b, mean_y_b, cxx_b, cxy_b, cyy_b):
+        n_a = self.n
+        n = n_a + n_b
+        if n_b == 0:
+            return
+        dx = mean_x_b - self.mean_x
+        dy = mean_y_b - self.mean_y
+        weight = n_a * n_b / n
+
+        self.cxx = self.cxx + cxx_b + np.outer(dx, dx) * weight
+        self.cxy = self.cxy + cxy_b + dx * dy * weight
+        self.cyy = self.cyy + cyy_b + dy * dy * weight
+        self.mean_x = self.mean_x + dx * (n_b / n)
+        self.mean_y = self.mean_y + dy * (n_b / n)
+        self.n = n
+
+    def update(self, X, y, feature_names):
+        """Add a batch of rows, given as a matrix whose columns are `feature_names`"""
+        X = np.asarray(X, dtype=np.float64).reshape(-1, len(feature_names))
+        y = np.asarray(y, dtype=np.float64).reshape(-1)
+        if len(y) == 0:
+            return self
+
+        # Scatter the batch into this object's column order, zero for absent features
+        positions = self._align(feature_names)
+        X_full = np.zeros((len(y), len(self.feature_names)))
+        X_full[:, positions] = X
+
+        mean_x = X_full.mean(axis=0)
+        mean_y = y.mean()
+        Xc = X_full - mean_x
+        yc = y - mean_y
+        self._combine(len(y), mean_x, mean_y, Xc.T @ Xc, Xc.T @ yc, float(yc @ yc))
+        return self
+
+    def merge(self, other):
+        """Fold in statistics computed on another shard of the dataset"""
+        positions = self._align(other.feature_names)
+        k = len(self.feature_names)
+        mean_x = np.zeros(k)
+        mean_x[positions] = other.mean_x
+        cxx = np.zeros((k, k))
+        cxx[np.ix_(positions, positions)] = other.cxx
+        cxy = np.zeros(k)
+        cxy[positions] = other.cxy
+        self._combine(other.n, mean_x, other.mean_y, cxx, cxy, other.cyy)
+        return self
+
+    def solve(self):
+        """Return (mean, var, scale, coef, intercept) for the current data.
+
+        Matches StandardScaler followed by LinearRegression: the coefficients
+        apply to standardized features and are the minimum-norm least-squares
+        solution when features are collinear.
+        """
+        var = np.diag(self.cxx) / self.n
+        scale = np.sqrt(var)
+        # Same rule as StandardScaler for constant features
+        scale[scale < 10 * np.finfo(np.float64).eps] = 1.0
+
+        standardized_cxx = self.cxx / np.outer(scale, scale)
+        standardized_cxy = self.cxy / scale
+        coef = np.linalg.lstsq(standardized_cxx, standardized_cxy, rcond=None)[0]
+        # Standardized features have zero mean, so the intercept is the target mean
+        return self.mean_x.copy(), var, scale, coef, self.mean_y
+
+    def to_sklearn(self):
+        """Build fitted (model, scaler, feature_names) objects from the statistics"""
+        from sklearn.linear_model import LinearRegression
+        from sklearn.preprocessing import StandardScaler
+
+        mean, var, scale, coef, intercept = self.solve()
+
+        scaler = StandardScaler()
+        scaler.mean_ = mean
+        scaler.var_ = var
+        scaler.scale_ = scale
+        scaler.n_samples_seen_ = self.n
+        scaler.n_features_in_ = len(self.feature_names)
+
+        model = LinearRegression()
+        model.coef_ = coef
+        model.intercept_ = intercept
+        model.n_features_in_ = len(self.feature_names)
+
+        return model, scaler, list(self.feature_names)
+
+    def save(self, path):
+        """Write the statistics to an .npz file"""
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(
+            tmp_path,
+            feature_names=np.array(self.feature_names, dtype=str),
+            n=self.n,
+            mean_x=self.mean_x,
+            mean_y=self.mean_y,
+            cxx=self.cxx,
+            cxy=self.cxy,
+            cyy=self.cyy
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Read statistics written by save()"""
+        with np.load(path) as data:
+            stats = cls([str(name) for name in data["feature_names"]])
+            stats.n = int(data["n"])
+            stats.mean_x = data["mean_x"]
+            stats.mean_y = float(data["mean_y"])
+            stats.cxx = data["cxx"]
+            stats.cxy = data["cxy"]
+            stats.cyy = float(data["cyy"])
+        return stats
+
+def stats_from_columns(columns, meta, start=0, stop=None):
+    """Compute statistics for rows [start:stop] of raw training columns"""
+    shard = {name: column[start:stop] for name, column in columns.items()}
+    encoder = FeatureEncoder().fit_vocabulary(meta)
+    X = encoder.encode_columns(shard, meta["platforms"])
+    y = training_store.wellbeing_targets(shard)
+    return RegressionStats().update(X, y, encoder.feature_names)
+
+def stats_from_store(store_dir=training_store.TRAINING_STORE_DIR, chunk_size=100000):
+    """Compute statistics over the training store one chunk at a time"""
+    columns, meta = training_store.load_columns(store_dir)
+    stats = RegressionStats()
+    for start in range(0, len(columns["mood"]), chunk_size):
+        stats.merge(stats_from_columns(columns, meta, start, start + chunk_size))
+    return stats
+
+def stats_from_responses(responses):
+    """Compute statistics for a batch of response dicts"""
+    vocabulary = empty_vocabulary()
+    columns = responses_to_columns(responses, vocabulary)
+    return stats_from_columns(columns, vocabulary)
+
+def load_regression_stats(path=REGRESSION_STATS_FILE):
+    """Return the saved statistics, or None if they haven't been built yet"""
+    if not os.path.exists(path):
+        return None
+    return RegressionStats.load(path)
+
+def update_regression_stats(responses, path=REGRESSION_STATS_FILE):
+    """Fold new responses into the saved statistics, if they exist"""
+    with file_lock(path, label="regression_stats"):
+        stats = load_regression_stats(path)
+        if stats is None:
+            return None
+        stats.merge(stats_from_responses(responses))
+        stats.save(path)
+        return stats
+
+def save_regression_stats(stats, path=REGRESSION_STATS_FILE):
+    """Replace the saved statistics with ones computed elsewhere"""
+    with file_lock(path, label="regression_stats"):
+        stats.save(path)
+
+def rebuild_regression_stats(store_dir=training_store.TRAINING_STORE_DIR, path=REGRESSION_STATS_FILE):
+    """Recompute the saved statistics from the whole training store"""
+    with file_lock(path, label="regression_stats"):
+        stats = stats_from_store(store_dir)
+        stats.save(path)
+        return stats
@@ -1,15 +1,145 @@
 import os
 import json
+import threading
 import streamlit as st
-from openai import OpenAI
+from utils.metrics import timed, timer
+from utils.response_cache import ResponseCache, cache_key
 
 # the newest OpenAI model is "gpt-4o" which was released May 13, 2024.
 # do not change this unless explicitly requested by the user
+OPENAI_MODEL = "gpt-4o"
 
 # Initialize OpenAI client
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
-openai = OpenAI(api_key=OPENAI_API_KEY)
+# Point at any OpenAI-compatible server, e.g. tools/mock_openai_server.py for load tests
+OPENAI_BASE_URL = os.environ.get("OPENAI_BASE_URL") or None
+# Seconds before a request to the API is abandoned, and retries after errors
+OPENAI_TIMEOUT = float(os.environ.get("OPENAI_TIMEOUT", "30"))
+OPENAI_MAX_RETRIES = int(os.environ.get("OPENAI_MAX_RETRIES", "2"))
 
+_client = None
+_client_guard = threading.Lock()
+
+# Suggestions depend only on the prompt, so responses are shared by every user with the same state
+OPENAI_CACHE_DIR = os.environ.get("OPENAI_CACHE_DIR", os.path.join("data", "openai_cache"))
+OPENAI_CACHE_TTL = float(os.environ.get("OPENAI_CACHE_TTL", str(7 * 24 * 3600)))
+OPENAI_CACHE_MEMORY_ENTRIES = int(os.environ.get("OPENAI_CACHE_MEMORY_ENTRIES", "1024"))
+OPENAI_CACHE_DISK_ENTRIES = int(os.environ.get("OPENAI_CACHE_DISK_ENTRIES", "10000"))
+suggestion_cache = ResponseCache(
+    OPENAI_CACHE_DIR,
+    ttl=OPENAI_CACHE_TTL,
+    max_memory_entries=OPENAI_CACHE_MEMORY_ENTRIES,
+    max_disk_entries=OPENAI_CACHE_DISK_ENTRIES
+)
+
+SYSTEM_MESSAGE = """
+        You are a mental wellness coach specialized in digital wellbeing. 
+        Provide 3-5 specific, actionable suggestions to improve the user's mental wellness based on their current state.
+        Each suggestion should have:
+        1. A short, catchy title
+        2. An appropriate emoji
+        3. A brief description (1-2 sentences max) with concrete advice
+        
+        Format your response as JSON with the following structure:
+        [
+            {
+                "title": "Suggestion title",
+                "emoji": "Relevant emoji", 
+                "description": "Brief description with actionable advice"
+            },
+            ...
+        ]
+        """
+
+def build_prompt_context(mood_data, platform=None):
+    """Describe the user's state for the prompt; only the fields below affect it"""
+    mood_score = mood_data.get('mood', 3)
+    sleep_quality = mood_data.get('sleep', 3)
+    stress_level = mood_data.get('stress', 3)
+    is_anxious = mood_data.get('anxiety', False)
+    
+    context = f"""
+        User's current mental state:
+        - Mood: {mood_score}/5 (higher is better)
+        - Sleep Quality: {sleep_quality}/5 (higher is better)
+        - Stress Level: {stress_level}/5 (lower is better)
+        - Feeling Anxious: {'Yes' if is_anxious else 'No'}
+        """
+    
+    if platform:
+        context += f"\nUser is particularly interested in improving their mental wellness while using {platform}."
+    return context
+
+class SuggestionFormatError(ValueError):
+    """The model answered with JSON that isn't a list of suggestions"""
+
+def prompt_fingerprint():
+    """Hash of everything besides the check-in that shapes the model's answer"""
+    return cache_key(OPENAI_MODEL, SYSTEM_MESSAGE)
+
+def get_openai_client():
+    """Return the shared OpenAI client, creating it on first use.
+
+    The client refuses to start without an API key, so it isn't created at
+    import: pages that only read the response cache work without one.
+    """
+    global _client
+    if _client is None:
+        with _client_guard:
+            if _client is None:
+                from openai import OpenAI
+                _client = OpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL,
+                                 timeout=OPENAI_TIMEOUT, max_retries=OPENAI_MAX_RETRIES)
+    return _client
+
+def get_suggestion_cache_stats():
+    """Return the OpenAI response cache's hit/miss counters"""
+    return suggestion_cache.stats()
+
+@timed()
+def fetch_llm_suggestions(mood_data, platform=None, read_cache=True):
+    """
+    Ask the model for suggestions, answering repeat prompts from the cache.
+    
+    With read_cache=False the model is always asked, e.g. to refresh stale
+    precomputed suggestions, and its answer still replaces the cached one.
+    Raises the client's errors, json.JSONDecodeError for a malformed
+    response and SuggestionFormatError for JSON of the wrong shape.
+    """
+    # Create a context message about the user's current state
+    context = build_prompt_context(mood_data, platform)
+    key = cache_key(OPENAI_MODEL, SYSTEM_MESSAGE, context)
+    if read_cache:
+        cached = suggestion_cache.get(key)
+        if cached is not None:
+            return cached
+    
+    # Time the API round trip on its own, apart from prompt building and parsing
+    with timer("openai.chat.completions.create"):
+        response = get_openai_client().chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": SYSTEM_MESSAGE},
+                {"role": "user", "content": context}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.7
+        )
+    
+    # Parse the JSON response
+    suggestions = json.loads(response.choices[0].message.content)
+    
+    # Check if it's properly formatted as a list of suggestions
+    if isinstance(suggestions, dict) and "suggestions" in suggestions:
+        suggestions = suggestions["suggestions"]
+    if not isinstance(suggestions, list):
+        raise SuggestionFormatError(f"Expected a list of suggestions, got {type(suggestions).__name__}")
+    
+    # Only well-formed responses are cached, fallbacks are retried next time
+    suggestion_cache.put(key, suggestions)
+    return suggestions
+
+@timed()
 def generate_wellness_suggestions(mood_data, platform=None):
     """
     Generate personalized mental wellness suggestions based on mood data.
@@ -41,80 +171,26 @@ def generate_wellness_suggestions(mood_data, platform=None):
         ]
     
     try:
-        # Create a context message about the user's current state
-        mood_score = mood_data.get('mood', 3)
-        sleep_quality = mood_data.get('sleep', 3)
-        stress_level = mood_data.get('stress', 3)
-        is_anxious = mood_data.get('anxiety', False)
-        
-        context = f"""
-        User's current mental state:
-        - Mood: {mood_score}/5 (higher is better)
-        - Sleep Quality: {sleep_quality}/5 (higher is better)
-        - Stress Level: {stress_level}/5 (lower is better)
-        - Feeling Anxious: {'Yes' if is_anxious else 'No'}
-        """
-        
-        if platform:
-            context += f"\nUser is particularly interested in improving their mental wellness while using {platform}."
-        
-        system_message = """
-        You are a mental wellness coach specialized in digital wellbeing. 
-        Provide 3-5 specific, actionable suggestions to improve the user's mental wellness based on their current state.
-        Each suggestion should have:
-        1. A short, catchy title
-        2. An appropriate emoji
-        3. A brief description (1-2 sentences max) with concrete advice
-        
-        Format your response as JSON with the following structure:
-        [
+        return fetch_llm_suggestions(mood_data, platform)
+    except SuggestionFormatError:
+        # Fallback to default suggestions
+        return [
             {
-                "title": "Suggestion title",
-                "emoji": "Relevant emoji", 
-                "description": "Brief description with actionable advice"
+                "title": "Digital Detox Time",
+                "emoji": "⏳", 
+                "description": "Set aside 30 minutes each day to completely disconnect from digital devices."
             },
-            ...
+            {
+                "title": "Mindful Scrolling",
+                "emoji": "🧘‍♀️", 
+                "description": "Before opening social media, take three deep breaths and set an intention for your time online."
+            },
+            {
+                "title": "Content Curation",
+                "emoji": "✂️", 
+                "description": "Unfollow or mute accounts that consistently make you feel inadequate or negative."
+            }
         ]
-        """
-        
-        response = openai.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": context}
-            ],
-            response_format={"type": "json_object"},
-            temperature=0.7
-        )
-        
-        # Parse the JSON response
-        suggestions = json.loads(response.choices[0].message.content)
-        
-        # Check if it's properly formatted as a list of suggestions
-        if isinstance(suggestions, dict) and "suggestions" in suggestions:
-            return suggestions["suggestions"]
-        elif isinstance(suggestions, list):
-            return suggestions
-        else:
-            # Fallback to default suggestions
-            return [
-                {
-                    "title": "Digital Detox Time",
-                    "emoji": "⏳", 
-                    "description": "Set aside 30 minutes each day to completely disconnect from digital devices."
-                },
-                {
-                    "title": "Mindful Scrolling",
-                    "emoji": "🧘‍♀️", 
-                    "description": "Before opening social media, take three deep breaths and set an intention for your time online."
-                },
-                {
-                    "title": "Content Curation",
-                    "emoji": "✂️", 
-                    "description": "Unfollow or mute accounts that consistently make you feel inadequate or negative."
-                }
-            ]
-            
     except Exception as e:
         st.error(f"Error generating suggestions: {str(e)}")
         # Return default suggestions
@@ -0,0 +1,64 @@
+import threading
+
+# Value a mapped metric takes when the chosen option has no score
+METRIC_DEFAULTS = {"mood": 3, "stress": 3, "anxiety": False}
+
+_registry = None
+_registry_guard = threading.Lock()
+
+class Questionnaire:
+    """One platform's question bank, compiled for answering and scoring.
+
+    Each question with a "metric" is turned into a lookup table from option
+    to value, so mapping a submission to mood/stress/anxiety is one dict
+    lookup per answered question.
+    """
+
+    def __init__(self, platform, definition):
+        self.platform = platform
+        self.emoji = definition.get("emoji", "")
+        self.questions = definition["questions"]
+        self.metric_tables = []
+
+        for question in self.questions:
+            metric = question.get("metric")
+            if metric is None:
+                continue
+            if metric not in METRIC_DEFAULTS:
+                raise ValueError(f"{platform} question {question['id']} maps to unknown metric {metric!r}")
+            scores = question.get("scores", {})
+            unknown = [option for option in scores if option not in question["options"]]
+            if unknown:
+                raise ValueError(f"{platform} question {question['id']} scores unknown options {unknown}")
+            self.metric_tables.append((question["id"], metric, dict(scores), METRIC_DEFAULTS[metric]))
+
+    def map_responses(self, responses):
+        """Set the standard metrics in responses from its answers, in place"""
+        for question_id, metric, table, default in self.metric_tables:
+            if question_id in responses:
+                responses[metric] = table.get(responses[question_id], default)
+        return responses
+
+def get_registry():
+    """Return {platform: Questionnaire}, compiled once per process"""
+    global _registry
+    if _registry is None:
+        with _registry_guard:
+            if _registry is None:
+                from assets.questionnaires import platform_questionnaires
+                _registry = {
+                    platform: Questionnaire(platform, definition)
+                    for platform, definition in platform_questionnaires.items()
+                }
+    return _registry
+
+def get_questionnaire(platform):
+    """Return the compiled questionnaire for platform, or None if there is none"""
+    return get_registry().get(platform)
+
+def map_responses_to_metrics(platform, responses):
+    """Convert a platform submission's answers to the standard mood metrics"""
+    questionnaire = get_questionnaire(platform)
+    if questionnaire is not None:
+        questionnaire.map_responses(responses)
+    return responses
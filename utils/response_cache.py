@@ -0,0 +1,154 @@
+import os
+import json
+import time
+import hashlib
+import threading
+import contextlib
+from collections import OrderedDict
+from utils.file_utils import atomic_write_json
+
+def cache_key(*parts):
+    """Stable key for JSON-serializable parts, e.g. (model, system prompt, context)"""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+class ResponseCache:
+    """Two-tier cache for JSON-serializable responses shared by every session.
+
+    An in-memory LRU tier answers repeat keys within the process, and a
+    directory of one JSON file per key keeps entries across restarts and
+    server processes. Entries expire ttl seconds after they were stored.
+    Each tier is capped at a number of entries; the disk tier evicts the
+    least recently used files, tracked through their mtime, once it grows
+    past its cap. Values are stored serialized, so callers can't change a
+    cached entry by mutating what get() returned.
+    """
+
+    def __init__(self, directory, ttl, max_memory_entries=1024, max_disk_entries=10000):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._disk_entries = None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.writes = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _remember(self, key, expires_at, text):
+        with self._lock:
+            self._memory[key] = (expires_at, text)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Return the cached value for key, or None on a miss"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, text = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return json.loads(text)
+                del self._memory[key]
+
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                record = json.load(f)
+            expires_at = record["created_at"] + self.ttl
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        if expires_at <= now:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            with self._lock:
+                self.expired += 1
+                self.misses += 1
+            return None
+
+        # Touch the file so disk eviction sees it as recently used
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        self._remember(key, expires_at, json.dumps(record["value"]))
+        with self._lock:
+            self.disk_hits += 1
+        return record["value"]
+
+    def put(self, key, value):
+        """Store value under key in both tiers"""
+        now = time.time()
+        text = json.dumps(value)
+        self._remember(key, now + self.ttl, text)
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        is_new = not os.path.exists(path)
+        atomic_write_json(path, {"created_at": now, "value": value})
+        with self._lock:
+            self.writes += 1
+            if self._disk_entries is not None and is_new:
+                self._disk_entries += 1
+            over_cap = self._disk_entries is None or self._disk_entries > self.max_disk_entries
+        if over_cap:
+            self._evict_disk()
+
+    def _evict_disk(self):
+        """Delete the least recently used files once there are more than max_disk_entries"""
+        files = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json"):
+                    with contextlib.suppress(FileNotFoundError):
+                        files.append((entry.stat().st_mtime, entry.path))
+
+        removed = 0
+        if len(files) > self.max_disk_entries:
+            # Evict down to 90% of the cap so a full cache doesn't rescan on every put
+            files.sort()
+            for _, path in files[:len(files) - self.max_disk_entries * 9 // 10]:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+                    removed += 1
+        with self._lock:
+            self.evictions += removed
+            self._disk_entries = len(files) - removed
+
+    def clear(self):
+        """Drop every entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            self._disk_entries = 0
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(os.path.join(self.directory, name))
+
+    def stats(self):
+        """Return hit/miss counters so cache effectiveness can be checked"""
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "writes": self.writes,
+                "memory_entries": len(self._memory),
+                "hit_rate": hits / lookups if lookups else 0.0
+            }
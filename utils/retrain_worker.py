@@ -0,0 +1,138 @@
+import os
+import json
+import time
+import itertools
+import threading
+import numpy as np
+from utils import training_store
+from utils.feature_encoder import FeatureEncoder
+
+# Retrain once this many responses have arrived since the last training run
+RETRAIN_MIN_NEW_ROWS = int(os.environ.get("RETRAIN_MIN_NEW_ROWS", "50"))
+# Retrain early if any feature's mean over the new rows moves this many
+# training standard deviations away from its training mean
+RETRAIN_DRIFT_THRESHOLD = float(os.environ.get("RETRAIN_DRIFT_THRESHOLD", "0.5"))
+# Fewer new rows than this are too noisy to judge drift on
+RETRAIN_DRIFT_MIN_ROWS = int(os.environ.get("RETRAIN_DRIFT_MIN_ROWS", "20"))
+# Seconds between checks when no new responses wake the worker
+RETRAIN_CHECK_INTERVAL = float(os.environ.get("RETRAIN_CHECK_INTERVAL", "60"))
+# The model needs at least this many responses to train
+MIN_TRAINING_ROWS = 5
+
+def load_training_meta(meta_file):
+    """Return the metadata recorded with the current model artifact"""
+    try:
+        with open(meta_file, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"rows": 0}
+
+def feature_drift(columns, meta, start, artifact):
+    """Return the largest standardized mean shift of rows [start:] against the training scaler"""
+    _, scaler, feature_names = artifact
+    new_columns = {name: column[start:] for name, column in columns.items()}
+    X_new = FeatureEncoder(feature_names).encode_columns(new_columns, meta["platforms"])
+    shift = np.abs(X_new.mean(axis=0) - scaler.mean_) / scaler.scale_
+    return float(shift.max()) if shift.size else 0.0
+
+class RetrainWorker(threading.Thread):
+    """Daemon thread that retrains the model off the request path.
+
+    Sessions call notify() after saving a response. The worker then checks
+    the training store and calls train_func when enough new rows have
+    accumulated, or when the new rows have drifted from the training data.
+    train_func writes the new artifact atomically, so predictions keep using
+    the previous model until the new one is in place. Until the store exists,
+    dataset, a callable yielding the logged responses, tells the worker
+    whether there is enough data to build it and train.
+    """
+
+    def __init__(self, train_func, model_holder, meta_file, store_dir=training_store.TRAINING_STORE_DIR,
+                 dataset=None):
+        super().__init__(name="retrain-worker", daemon=True)
+        self.train_func = train_func
+        self.model_holder = model_holder
+        self.meta_file = meta_file
+        self.store_dir = store_dir
+        self.dataset = dataset
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self.runs = 0
+        self.failures = 0
+        self.last_reason = None
+        self.last_duration = 0.0
+
+    def notify(self):
+        """Ask the worker to re-check its triggers soon"""
+        self._wake.set()
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
+
+    def _dataset_has_rows(self, count):
+        """Whether dataset() yields at least `count` responses, reading no further than that"""
+        if self.dataset is None:
+            return False
+        return sum(1 for _ in itertools.islice(self.dataset(), count)) >= count
+
+    def retrain_reason(self):
+        """Return why the model should be retrained now, or None"""
+        trained_rows = load_training_meta(self.meta_file).get("rows", 0)
+        artifact = self.model_holder.get()
+
+        if not training_store.exists(self.store_dir):
+            # Training builds the store from the dataset log. Deployments from
+            # before the store have a model but no store, and without one the
+            # triggers below could never fire, so build it for them too
+            if not self._dataset_has_rows(MIN_TRAINING_ROWS):
+                return None
+            return "initial" if artifact is None else "store missing"
+
+        columns, meta = training_store.load_columns(self.store_dir)
+        rows = len(columns["mood"])
+        if rows < MIN_TRAINING_ROWS:
+            return None
+        if artifact is None:
+            return "initial"
+
+        new_rows = rows - trained_rows
+        if new_rows >= RETRAIN_MIN_NEW_ROWS:
+            return f"{new_rows} new rows"
+        if new_rows >= RETRAIN_DRIFT_MIN_ROWS:
+            drift = feature_drift(columns, meta, trained_rows, artifact)
+            if drift > RETRAIN_DRIFT_THRESHOLD:
+                return f"feature drift {drift:.2f}"
+        return None
+
+    def run(self):
+        while not self._stopped.is_set():
+            self._wake.wait(RETRAIN_CHECK_INTERVAL)
+            self._wake.clear()
+            if self._stopped.is_set():
+                break
+
+            try:
+                reason = self.retrain_reason()
+                if reason is None:
+                    continue
+
+                start = time.perf_counter()
+                trained = self.train_func()
+                self.last_duration = time.perf_counter() - start
+                self.last_reason = reason
+                if trained:
+                    self.runs += 1
+                else:
+                    self.failures += 1
+            except Exception as e:
+                self.failures += 1
+                print(f"Error in retraining worker: {e}")
+
+    def stats(self):
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_reason": self.last_reason,
+            "last_duration_seconds": self.last_duration
+        }
@@ -0,0 +1,82 @@
+import os
+import sys
+import json
+import time
+import argparse
+import numpy as np
+from utils.feature_encoder import FeatureEncoder
+from utils.model_cache import ModelHolder
+
+def score_records(artifact, records):
+    """Score a batch of response dicts with a (model, scaler, feature_names) artifact.
+
+    The whole batch is encoded, scaled and predicted as one matrix. Returns
+    integer scores clipped to 0-100, in the same order as the records.
+    """
+    model, scaler, feature_names = artifact
+    if not records:
+        return []
+
+    X = FeatureEncoder(feature_names).transform(records)
+    predictions = model.predict(scaler.transform(X))
+
+    # Ensure predictions are in 0-100 range
+    return np.rint(np.clip(predictions, 0, 100)).astype(int).tolist()
+
+def _read_chunks(lines, chunk_size):
+    chunk = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            chunk.append(json.loads(line))
+        except json.JSONDecodeError:
+            chunk.append(None)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def score_jsonl(artifact, input_file, output_file, chunk_size=10000):
+    """Stream responses from a JSONL file and write one score per line.
+
+    Lines that aren't valid JSON objects get a null score. Returns
+    (records, seconds).
+    """
+    start = time.perf_counter()
+    count = 0
+    for chunk in _read_chunks(input_file, chunk_size):
+        valid = [i for i, record in enumerate(chunk) if isinstance(record, dict)]
+        scores = [None] * len(chunk)
+        for i, score in zip(valid, score_records(artifact, [chunk[i] for i in valid])):
+            scores[i] = score
+        output_file.write("".join(json.dumps(score) + "\n" for score in scores))
+        count += len(chunk)
+    return count, time.perf_counter() - start
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score a JSONL file of questionnaire responses")
+    parser.add_argument("input", help="JSONL file with one response per line, or - for stdin")
+    parser.add_argument("output", help="File to write one score per line to, or - for stdout")
+    parser.add_argument("--model", default=os.path.join("data", "wellbeing_model.pkl"))
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    artifact = ModelHolder(args.model).get()
+    if artifact is None:
+        sys.exit(f"No trained model at {args.model}")
+
+    input_file = sys.stdin if args.input == "-" else open(args.input, "r")
+    output_file = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        count, seconds = score_jsonl(artifact, input_file, output_file, args.chunk_size)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+    rate = count / seconds if seconds > 0 else float("inf")
+    print(f"Scored {count} records in {seconds:.2f}s ({rate:,.0f} records/sec)", file=sys.stderr)
@@ -0,0 +1,442 @@
+import os
+import json
+import shutil
+import hashlib
+import sqlite3
+import tempfile
+import datetime
+import threading
+import argparse
+from utils.file_utils import file_lock, atomic_write_text, atomic_write_json, atomic_create_json, default_mode
+
+# Set up data directory
+DATA_DIR = "data"
+if not os.path.exists(DATA_DIR):
+    os.makedirs(DATA_DIR)
+
+USER_DATA_FILE = os.path.join(DATA_DIR, "users.json")
+USER_DIRECTORY = os.path.join(DATA_DIR, "users")
+USER_ID_COUNTER_FILE = os.path.join(USER_DIRECTORY, "next_id")
+SQLITE_DB_FILE = os.path.join(DATA_DIR, "mental_wellness.db")
+
+# "json" keeps accounts and histories in flat files, "sqlite" uses the embedded database
+STORAGE_BACKEND = os.environ.get("STORAGE_BACKEND", "json").lower()
+
+# Number of recent check-ins loaded at login (0 loads the full history)
+HISTORY_LOAD_LIMIT = int(os.environ.get("HISTORY_LOAD_LIMIT", "0")) or None
+
+# Per-user history segments are compacted once they grow past this size,
+# keeping the most recent entries in the segment for fast recent reads
+HISTORY_COMPACT_BYTES = 256 * 1024
+HISTORY_SEGMENT_KEEP = 100
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    num INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    email TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    password TEXT NOT NULL,
+    created_at TEXT
+);
+CREATE TABLE IF NOT EXISTS checkins (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_checkins_user ON checkins (user_id, seq);
+"""
+
+def get_user(email):
+    """Return the account record for an email, or None if it doesn't exist"""
+    if STORAGE_BACKEND == "sqlite":
+        return _sqlite_get_user(email)
+    return _json_get_user(email)
+
+def create_user(email, name, password_hash):
+    """Create a new account and its empty history.
+
+    Returns the new account record, or None if the email is already registered.
+    """
+    if STORAGE_BACKEND == "sqlite":
+        return _sqlite_create_user(email, name, password_hash)
+    return _json_create_user(email, name, password_hash)
+
+def load_mood_data(user_id, limit=None):
+    """Return the check-ins saved for a user, oldest first.
+
+    With a limit, only the most recent `limit` check-ins are returned.
+    """
+    if STORAGE_BACKEND == "sqlite":
+        return _sqlite_load_mood_data(user_id, limit)
+    return _json_load_mood_data(user_id, limit)
+
+def append_mood_entry(user_id, entry):
+    """Persist a single new check-in for a user"""
+    if STORAGE_BACKEND == "sqlite":
+        _sqlite_append_mood_entry(user_id, entry)
+    else:
+        _json_append_mood_entry(user_id, entry)
+
+# JSON file backend
+#
+# Each account lives in its own file under data/users/, sharded by a hash of
+# the email, so login and signup only ever touch the one affected record.
+# The legacy users.json map is imported into this layout on first use.
+
+def _user_record_file(email):
+    digest = hashlib.sha256(email.encode()).hexdigest()
+    return os.path.join(USER_DIRECTORY, digest[:2], digest + ".json")
+
+def _user_data_file(user_id):
+    return os.path.join(DATA_DIR, f"user_{user_id}.json")
+
+def load_legacy_users():
+    """Load the legacy users.json map of email to account record"""
+    try:
+        with open(USER_DATA_FILE, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def ensure_user_directory():
+    """Create the sharded user directory, importing users.json the first time"""
+    if os.path.isdir(USER_DIRECTORY):
+        return
+
+    with file_lock(USER_DIRECTORY, label="user_import"):
+        # Another session may have finished the import while we waited
+        if os.path.isdir(USER_DIRECTORY):
+            return
+
+        # Build the directory next to its final location and rename it into place,
+        # so readers that don't take the lock see the finished import or none at all
+        tmp_directory = tempfile.mkdtemp(dir=DATA_DIR, prefix="users.", suffix=".tmp")
+        try:
+            next_id = 1
+            for email, user in load_legacy_users().items():
+                digest = hashlib.sha256(email.encode()).hexdigest()
+                shard = os.path.join(tmp_directory, digest[:2])
+                os.makedirs(shard, exist_ok=True)
+                with open(os.path.join(shard, digest + ".json"), "w") as f:
+                    json.dump(dict(user, email=email), f)
+                next_id = max(next_id, int(user["id"]) + 1)
+
+            with open(os.path.join(tmp_directory, "next_id"), "w") as f:
+                f.write(str(next_id))
+
+            # mkdtemp creates the directory as 0700
+            os.chmod(tmp_directory, default_mode(directory=True))
+            os.rename(tmp_directory, USER_DIRECTORY)
+        except BaseException:
+            shutil.rmtree(tmp_directory, ignore_errors=True)
+            raise
+
+def iter_json_users():
+    """Yield every account record stored in the user directory"""
+    ensure_user_directory()
+    for shard in sorted(os.listdir(USER_DIRECTORY)):
+        shard_dir = os.path.join(USER_DIRECTORY, shard)
+        if not os.path.isdir(shard_dir):
+            continue
+        for name in sorted(os.listdir(shard_dir)):
+            if name.endswith(".json"):
+                with open(os.path.join(shard_dir, name), "r") as f:
+                    yield json.load(f)
+
+def _allocate_user_id():
+    with file_lock(USER_ID_COUNTER_FILE, label="user_id_counter"):
+        with open(USER_ID_COUNTER_FILE, "r") as f:
+            next_id = int(f.read().strip() or 1)
+        atomic_write_text(USER_ID_COUNTER_FILE, str(next_id + 1))
+
+    return str(next_id).zfill(6)
+
+def _json_get_user(email):
+    ensure_user_directory()
+    try:
+        with open(_user_record_file(email), "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def _json_create_user(email, name, password_hash):
+    ensure_user_directory()
+    record_file = _user_record_file(email)
+    if os.path.exists(record_file):
+        return None
+
+    user = {
+        "id": _allocate_user_id(),
+        "email": email,
+        "name": name,
+        "password": password_hash,
+        "created_at": str(datetime.datetime.now())
+    }
+
+    os.makedirs(os.path.dirname(record_file), exist_ok=True)
+    try:
+        # Exclusive create, so two signups for the same email can't both succeed
+        atomic_create_json(record_file, user)
+    except FileExistsError:
+        return None
+
+    # Create user data file
+    atomic_write_json(_user_data_file(user["id"]), {"mood_data": [], "seq": 0})
+
+    return user
+
+# Check-in histories
+#
+# New check-ins are appended to user_<id>.jsonl, one {"seq", "entry"} record
+# per line, so a submit writes only its own entry. Once the segment grows past
+# HISTORY_COMPACT_BYTES, all but its last HISTORY_SEGMENT_KEEP entries are
+# folded into the user_<id>.json base file, whose "seq" field records the last
+# folded entry. Keeping a tail in the segment means recent entries can be read
+# without parsing the base at all.
+
+def _user_segment_file(user_id):
+    return os.path.join(DATA_DIR, f"user_{user_id}.jsonl")
+
+def _read_base_history(user_id):
+    try:
+        with open(_user_data_file(user_id), "r") as f:
+            user_data = json.load(f)
+    except FileNotFoundError:
+        user_data = {}
+    mood_data = user_data.get("mood_data", [])
+    # Legacy files predate sequence numbers and hold entries 1..len
+    return mood_data, user_data.get("seq", len(mood_data))
+
+def _parse_segment_lines(lines):
+    records = []
+    for line in lines:
+        try:
+            records.append(json.loads(line))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            # Skip a partially written line left by an interrupted submit
+            continue
+    return records
+
+def _read_segment(user_id):
+    try:
+        with open(_user_segment_file(user_id), "rb") as f:
+            return _parse_segment_lines(f.read().splitlines())
+    except FileNotFoundError:
+        return []
+
+def _read_segment_tail(user_id, count, block_size=8192):
+    """Parse the last `count` segment records by reading the file backwards"""
+    try:
+        f = open(_user_segment_file(user_id), "rb")
+    except FileNotFoundError:
+        return []
+
+    with f:
+        position = f.seek(0, os.SEEK_END)
+        data = b""
+        while position > 0 and data.count(b"\n") <= count:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+
+    lines = data.splitlines()
+    if position > 0:
+        # The first line may have been cut by the block boundary
+        lines = lines[1:]
+    return _parse_segment_lines(lines[-count:])
+
+def _json_load_mood_data(user_id, limit=None):
+    if limit:
+        tail = _read_segment_tail(user_id, limit)
+        if len(tail) >= limit:
+            return [record["entry"] for record in tail]
+
+    # Read the segment before the base: compaction replaces the base first, so
+    # this order can only see entries twice (filtered by seq), never miss them
+    segment = _read_segment(user_id)
+    try:
+        mood_data, base_seq = _read_base_history(user_id)
+    except json.JSONDecodeError:
+        return []
+
+    mood_data = mood_data + [record["entry"] for record in segment if record["seq"] > base_seq]
+    return mood_data[-limit:] if limit else mood_data
+
+def _json_append_mood_entry(user_id, entry):
+    segment_file = _user_segment_file(user_id)
+    with file_lock(_user_data_file(user_id), label="user_history"):
+        # A torn write can only affect the final line, so the last two lines
+        # always include the newest complete record if the segment has one
+        records = _read_segment_tail(user_id, 2) or _read_segment(user_id)
+        if records:
+            seq = records[-1]["seq"] + 1
+        else:
+            seq = _read_base_history(user_id)[1] + 1
+
+        with open(segment_file, "ab") as f:
+            # Terminate a torn line from an interrupted write before appending
+            if f.tell() > 0:
+                with open(segment_file, "rb") as check:
+                    check.seek(-1, os.SEEK_END)
+                    if check.read(1) != b"\n":
+                        f.write(b"\n")
+            f.write((json.dumps({"seq": seq, "entry": entry}) + "\n").encode())
+            segment_size = f.tell()
+
+        if segment_size > HISTORY_COMPACT_BYTES:
+            _compact_mood_history_locked(user_id)
+
+def compact_mood_history(user_id):
+    """Fold a user's history segment into the base file, keeping its most recent tail"""
+    with file_lock(_user_data_file(user_id), label="user_history"):
+        _compact_mood_history_locked(user_id)
+
+def _compact_mood_history_locked(user_id):
+    mood_data, base_seq = _read_base_history(user_id)
+    pending = [record for record in _read_segment(user_id) if record["seq"] > base_seq]
+    if len(pending) <= HISTORY_SEGMENT_KEEP:
+        return
+
+    folded = pending[:-HISTORY_SEGMENT_KEEP]
+    kept = pending[-HISTORY_SEGMENT_KEEP:]
+
+    # The base is the commit point: if we crash before the segment is rewritten,
+    # readers skip the already-folded records by their sequence numbers
+    atomic_write_json(_user_data_file(user_id), {
+        "mood_data": mood_data + [record["entry"] for record in folded],
+        "seq": folded[-1]["seq"]
+    })
+    atomic_write_text(_user_segment_file(user_id), "".join(json.dumps(record) + "\n" for record in kept))
+
+# SQLite backend
+
+# Streamlit runs each session on its own thread, and sqlite3 connections
+# can't be shared across threads, so keep one connection per thread
+_sqlite_local = threading.local()
+
+def get_sqlite_connection():
+    """Return this thread's connection to the SQLite database, creating the schema if needed"""
+    conn = getattr(_sqlite_local, "conn", None)
+    if conn is None:
+        # Autocommit mode: transactions are opened explicitly where needed
+        conn = sqlite3.connect(SQLITE_DB_FILE, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SQLITE_SCHEMA)
+        _sqlite_local.conn = conn
+    return conn
+
+def _sqlite_get_user(email):
+    row = get_sqlite_connection().execute(
+        "SELECT id, email, name, password, created_at FROM users WHERE email = ?",
+        (email,)
+    ).fetchone()
+    return dict(row) if row is not None else None
+
+def _sqlite_create_user(email, name, password_hash):
+    conn = get_sqlite_connection()
+    created_at = str(datetime.datetime.now())
+
+    # IMMEDIATE takes the write lock up front so two signups can't pick the same ID
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if conn.execute("SELECT 1 FROM users WHERE email = ?", (email,)).fetchone():
+            conn.execute("ROLLBACK")
+            return None
+
+        num = conn.execute("SELECT COALESCE(MAX(num), 0) + 1 FROM users").fetchone()[0]
+        user_id = str(num).zfill(6)
+        conn.execute(
+            "INSERT INTO users (num, id, email, name, password, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (num, user_id, email, name, password_hash, created_at)
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    return {
+        "id": user_id,
+        "email": email,
+        "name": name,
+        "password": password_hash,
+        "created_at": created_at
+    }
+
+def _sqlite_load_mood_data(user_id, limit=None):
+    conn = get_sqlite_connection()
+    if limit:
+        rows = conn.execute(
+            "SELECT data FROM checkins WHERE user_id = ? ORDER BY seq DESC LIMIT ?",
+            (user_id, limit)
+        ).fetchall()
+        rows.reverse()
+    else:
+        rows = conn.execute(
+            "SELECT data FROM checkins WHERE user_id = ? ORDER BY seq",
+            (user_id,)
+        ).fetchall()
+    return [json.loads(row["data"]) for row in rows]
+
+def _sqlite_append_mood_entry(user_id, entry):
+    get_sqlite_connection().execute(
+        "INSERT INTO checkins (user_id, date, data) VALUES (?, ?, ?)",
+        (user_id, entry.get("date"), json.dumps(entry))
+    )
+
+def migrate_json_to_sqlite():
+    """Import the JSON user directory and every user_<id>.json history into the SQLite database.
+
+    Users that already exist in the database are skipped, so the migration
+    can be re-run safely. Returns a (users, checkins) tuple of imported counts.
+    """
+    conn = get_sqlite_connection()
+    imported_users = 0
+    imported_checkins = 0
+
+    for user in iter_json_users():
+        email = user["email"]
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute("SELECT 1 FROM users WHERE email = ? OR id = ?", (email, user["id"])).fetchone():
+                conn.execute("ROLLBACK")
+                continue
+
+            conn.execute(
+                "INSERT INTO users (num, id, email, name, password, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (int(user["id"]), user["id"], email, user["name"], user["password"], user.get("created_at"))
+            )
+            mood_data = _json_load_mood_data(user["id"])
+            conn.executemany(
+                "INSERT INTO checkins (user_id, date, data) VALUES (?, ?, ?)",
+                [(user["id"], entry.get("date"), json.dumps(entry)) for entry in mood_data]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        imported_users += 1
+        imported_checkins += len(mood_data)
+
+    return imported_users, imported_checkins
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Storage maintenance for the Mental Wellness Tracker")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("migrate", help="Import the JSON user files into the SQLite database")
+    subparsers.add_parser("compact", help="Compact every JSON user history segment")
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        users, checkins = migrate_json_to_sqlite()
+        print(f"Imported {users} users and {checkins} check-ins into {SQLITE_DB_FILE}")
+    elif args.command == "compact":
+        users = list(iter_json_users())
+        for user in users:
+            compact_mood_history(user["id"])
+        print(f"Compacted history for {len(users)} users")
@@ -0,0 +1,106 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from utils.model_cache import ModelHolder
+from utils.suggestion_table import SuggestionTable, SUGGESTION_TABLE_FILE
+
+# Seconds the suggestions page waits for the model before showing rule-based suggestions
+SUGGESTION_DEADLINE = float(os.environ.get("SUGGESTION_DEADLINE", "2"))
+# Seconds a page run keeps waiting, after rendering, to swap in a late model response
+SUGGESTION_LATE_WAIT = float(os.environ.get("SUGGESTION_LATE_WAIT", "15"))
+# Model requests running at once in this process; further requests queue
+SUGGESTION_WORKERS = int(os.environ.get("SUGGESTION_WORKERS", "4"))
+# Queued or running requests above which speculative prefetches are skipped
+SUGGESTION_MAX_PENDING = int(os.environ.get("SUGGESTION_MAX_PENDING", "32"))
+
+_executor = None
+_executor_guard = threading.Lock()
+
+_pending = 0
+_pending_guard = threading.Lock()
+
+# Built by tools/precompute_suggestions.py; reloaded when the file changes
+table_holder = ModelHolder(SUGGESTION_TABLE_FILE, loader=SuggestionTable.load)
+
+def llm_enabled():
+    """Whether suggestions should be requested from the model at all"""
+    return bool(os.environ.get("OPENAI_API_KEY"))
+
+def get_precomputed_suggestions(entry):
+    """Return the precomputed suggestions for a check-in's state, or None if there are none"""
+    try:
+        table = table_holder.get()
+    except Exception as e:
+        print(f"Error loading suggestion table: {e}")
+        return None
+    if table is None:
+        return None
+    return table.lookup(entry, entry.get("platform"))
+
+def get_executor():
+    """Return the process-wide pool that runs model requests off the page's script thread"""
+    global _executor
+    if _executor is None:
+        with _executor_guard:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=SUGGESTION_WORKERS,
+                                               thread_name_prefix="suggestions")
+    return _executor
+
+def _request_llm_suggestions(mood_data, platform, read_cache):
+    # Imported here so pages that never call the model don't load the client
+    from utils.openai_utils import fetch_llm_suggestions
+    return fetch_llm_suggestions(mood_data, platform, read_cache=read_cache)
+
+def _request_done(future):
+    global _pending
+    with _pending_guard:
+        _pending -= 1
+
+def submit_llm_suggestions(mood_data, platform=None, speculative=False, read_cache=True):
+    """Start a model request in the background and return its Future.
+
+    The Future raises whatever the request raised, so callers decide which
+    fallback to show. Speculative requests return None instead of queueing
+    once SUGGESTION_MAX_PENDING requests are waiting, so prefetching can't
+    build a backlog in front of requests a page is waiting for.
+    """
+    global _pending
+    with _pending_guard:
+        if speculative and _pending >= SUGGESTION_MAX_PENDING:
+            return None
+        _pending += 1
+    future = get_executor().submit(_request_llm_suggestions, dict(mood_data), platform, read_cache)
+    future.add_done_callback(_request_done)
+    return future
+
+def start_suggestion_job(entry, suggestion_round=0, speculative=False):
+    """Request the model's suggestions for a check-in; return the job to keep in the session, or None.
+
+    Later rounds come from "Get New Suggestions", so they skip the cached
+    answer and ask the model again; the fresh answer still replaces it in
+    the cache.
+    """
+    future = submit_llm_suggestions(entry, entry.get("platform"), speculative=speculative,
+                                    read_cache=suggestion_round == 0)
+    if future is None:
+        return None
+    return {"entry": entry.get("date"), "round": suggestion_round, "future": future}
+
+def prefetch_suggestions(session_state):
+    """Start the model request for the latest check-in before the suggestions page asks for it.
+
+    Called right after a check-in is saved. Rule-based suggestions take
+    microseconds, so only the model request is worth starting early, and
+    not even that when the state has precomputed suggestions.
+    """
+    session_state["ai_suggestions"] = []
+    session_state["suggestion_round"] = 0
+    session_state.pop("suggestion_job", None)
+    if not llm_enabled() or not session_state.get("mood_data"):
+        return
+    if get_precomputed_suggestions(session_state["mood_data"][-1]) is not None:
+        return
+    job = start_suggestion_job(session_state["mood_data"][-1], speculative=True)
+    if job is not None:
+        session_state["suggestion_job"] = job
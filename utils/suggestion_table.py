@@ -0,0 +1,106 @@
+import os
+import json
+from utils.file_utils import atomic_write_json
+
+SUGGESTION_TABLE_FILE = os.environ.get("SUGGESTION_TABLE_FILE", os.path.join("data", "suggestion_table.json"))
+
+# Discrete inputs of the suggestion prompt; platform None is the general check-in
+LEVELS = range(1, 6)
+STATES_PER_PLATFORM = len(LEVELS) ** 3 * 2
+
+def table_platforms():
+    """Platforms with a slot in the table: the general check-in and every questionnaire"""
+    from utils.questionnaire import get_registry
+    return [None] + list(get_registry())
+
+def prompt_state(mood_data, platform=None):
+    """Return the (mood, sleep, stress, anxiety, platform) a check-in's prompt is built from"""
+    return (
+        mood_data.get('mood', 3),
+        mood_data.get('sleep', 3),
+        mood_data.get('stress', 3),
+        bool(mood_data.get('anxiety', False)),
+        platform or None
+    )
+
+def iter_states(platforms):
+    """Yield every state in table order"""
+    for platform in platforms:
+        for mood in LEVELS:
+            for sleep in LEVELS:
+                for stress in LEVELS:
+                    for anxiety in (False, True):
+                        yield (mood, sleep, stress, anxiety, platform)
+
+class SuggestionTable:
+    """Suggestion sets precomputed for every discrete check-in state.
+
+    A state's position is computed from its values, so a lookup is one index
+    into a list. Identical suggestions are stored once in a shared pool and
+    states refer to them by number, which keeps the file small when many
+    states share suggestions. Each entry records when and from which source
+    it was generated, so a refresh can regenerate only stale entries.
+    Entries are [suggestion numbers, generated_at, source].
+    """
+
+    def __init__(self, platforms, pool=None, entries=None):
+        self.platforms = list(platforms)
+        self.pool = pool or []
+        self.entries = entries or [None] * (len(self.platforms) * STATES_PER_PLATFORM)
+        self._platform_slots = {platform: i for i, platform in enumerate(self.platforms)}
+        self._pool_ids = {json.dumps(s, sort_keys=True): i for i, s in enumerate(self.pool)}
+
+    def state_index(self, mood, sleep, stress, anxiety, platform):
+        """Return the entry index of a state, or None if the table doesn't cover it"""
+        slot = self._platform_slots.get(platform)
+        if slot is None or mood not in LEVELS or sleep not in LEVELS or stress not in LEVELS:
+            return None
+        return ((((slot * 5 + int(mood) - 1) * 5 + int(sleep) - 1) * 5 + int(stress) - 1) * 2 + int(anxiety))
+
+    def lookup(self, mood_data, platform=None):
+        """Return a copy of the precomputed suggestions for a check-in, or None"""
+        index = self.state_index(*prompt_state(mood_data, platform))
+        if index is None or self.entries[index] is None:
+            return None
+        return [dict(self.pool[i]) for i in self.entries[index][0]]
+
+    def get_entry(self, state):
+        index = self.state_index(*state)
+        return None if index is None else self.entries[index]
+
+    def set_entry(self, state, suggestions, generated_at, source):
+        """Store the suggestions for one state"""
+        ids = []
+        for suggestion in suggestions:
+            key = json.dumps(suggestion, sort_keys=True)
+            if key not in self._pool_ids:
+                self._pool_ids[key] = len(self.pool)
+                self.pool.append(suggestion)
+            ids.append(self._pool_ids[key])
+        self.entries[self.state_index(*state)] = [ids, generated_at, source]
+
+    def compact(self):
+        """Drop pooled suggestions that no entry refers to any more"""
+        used = sorted({i for entry in self.entries if entry is not None for i in entry[0]})
+        renumber = {old: new for new, old in enumerate(used)}
+        self.pool = [self.pool[i] for i in used]
+        self._pool_ids = {json.dumps(s, sort_keys=True): i for i, s in enumerate(self.pool)}
+        for entry in self.entries:
+            if entry is not None:
+                entry[0] = [renumber[i] for i in entry[0]]
+
+    def to_dict(self):
+        return {
+            "platforms": self.platforms,
+            "pool": self.pool,
+            "entries": self.entries
+        }
+
+    def save(self, path=SUGGESTION_TABLE_FILE):
+        atomic_write_json(path, self.to_dict())
+
+    @classmethod
+    def load(cls, path=SUGGESTION_TABLE_FILE):
+        with open(path, "r") as f:
+            data = json.load(f)
+        return cls(data["platforms"], data["pool"], data["entries"])
@@ -0,0 +1,112 @@
+import os
+import json
+import shutil
+import numpy as np
+from utils.file_utils import file_lock, atomic_write_json
+from utils.feature_encoder import COLUMN_DTYPES, empty_vocabulary, responses_to_columns
+
+# Columnar copy of the ML dataset: one fixed-width binary file per raw column
+# (see feature_encoder.COLUMN_DTYPES), appended as responses arrive and
+# memory-mapped read-only for training
+TRAINING_STORE_DIR = os.path.join("data", "training_store")
+
+def _meta_file(store_dir):
+    return os.path.join(store_dir, "meta.json")
+
+def _column_file(store_dir, name):
+    return os.path.join(store_dir, name + ".bin")
+
+def exists(store_dir=TRAINING_STORE_DIR):
+    """Return True if the training store has been created"""
+    return os.path.exists(_meta_file(store_dir))
+
+def load_meta(store_dir=TRAINING_STORE_DIR):
+    """Return the store's column vocabulary: platforms seen and optional-column flags"""
+    try:
+        with open(_meta_file(store_dir), "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return empty_vocabulary()
+
+def _row_count(store_dir):
+    counts = []
+    for name, dtype in COLUMN_DTYPES.items():
+        try:
+            size = os.path.getsize(_column_file(store_dir, name))
+        except FileNotFoundError:
+            size = 0
+        counts.append(size // np.dtype(dtype).itemsize)
+    return min(counts)
+
+def _append_columns_locked(store_dir, columns):
+    # Drop rows left half-written by an interrupted append so columns stay aligned
+    rows = _row_count(store_dir)
+    for name, dtype in COLUMN_DTYPES.items():
+        path = _column_file(store_dir, name)
+        with open(path, "ab") as f:
+            if f.tell() != rows * np.dtype(dtype).itemsize:
+                f.truncate(rows * np.dtype(dtype).itemsize)
+                f.seek(0, os.SEEK_END)
+            f.write(np.ascontiguousarray(columns[name], dtype=dtype).tobytes())
+
+def append_responses(responses, store_dir=TRAINING_STORE_DIR):
+    """Append response dicts to the store"""
+    with file_lock(store_dir, label="training_store"):
+        os.makedirs(store_dir, exist_ok=True)
+        meta = load_meta(store_dir)
+        before = json.dumps(meta, sort_keys=True)
+        columns = responses_to_columns(responses, meta)
+
+        # The vocabulary only ever grows, so write it before the rows that use it
+        if json.dumps(meta, sort_keys=True) != before or not exists(store_dir):
+            atomic_write_json(_meta_file(store_dir), meta)
+        _append_columns_locked(store_dir, columns)
+
+def rebuild(responses, store_dir=TRAINING_STORE_DIR, chunk_size=50000):
+    """Replace the store with one built from an iterable of response dicts"""
+    with file_lock(store_dir, label="training_store"):
+        tmp_dir = f"{store_dir}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+
+        meta = empty_vocabulary()
+        chunk = []
+        for row in responses:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                _append_columns_locked(tmp_dir, responses_to_columns(chunk, meta))
+                chunk = []
+        _append_columns_locked(tmp_dir, responses_to_columns(chunk, meta))
+        atomic_write_json(_meta_file(tmp_dir), meta)
+
+        shutil.rmtree(store_dir, ignore_errors=True)
+        os.rename(tmp_dir, store_dir)
+
+def install(built_dir, store_dir=TRAINING_STORE_DIR):
+    """Replace the store with one that rebuild() wrote to another directory"""
+    with file_lock(store_dir, label="training_store"):
+        shutil.rmtree(store_dir, ignore_errors=True)
+        os.rename(built_dir, store_dir)
+
+def load_columns(store_dir=TRAINING_STORE_DIR):
+    """Return (columns, meta), with each column memory-mapped read-only"""
+    meta = load_meta(store_dir)
+    rows = _row_count(store_dir)
+    columns = {}
+    for name, dtype in COLUMN_DTYPES.items():
+        if rows == 0:
+            # np.memmap can't map an empty file
+            columns[name] = np.zeros(0, dtype=dtype)
+        else:
+            columns[name] = np.memmap(_column_file(store_dir, name), dtype=dtype, mode="r", shape=(rows,))
+    return columns, meta
+
+def wellbeing_targets(columns):
+    """Compute the heuristic wellbeing score used as the training target"""
+    mood = columns["mood"].astype(np.float64)
+    sleep = columns["sleep"].astype(np.float64)
+    stress = 6 - columns["stress"].astype(np.float64)  # Invert stress so higher is better
+    anxiety = 1 - columns["anxiety"].astype(np.float64)  # 0 if anxious, 1 if not
+
+    wellbeing_score = (mood * 0.4) + (sleep * 0.3) + (stress * 0.2) + (anxiety * 0.1)
+    return np.round((wellbeing_score / 5) * 100)
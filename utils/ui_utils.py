@@ -25,9 +25,10 @@ def display_emoji_scale(key, question_text):
     
     return None
 
-def display_wellbeing_score(data):
-    """Display wellbeing score with appropriate styling"""
-    score = calculate_wellbeing_score(data)
+def display_wellbeing_score(data, score=None):
+    """Display wellbeing score with appropriate styling, computing it from data unless given"""
+    if score is None:
+        score = calculate_wellbeing_score(data)
     
     # Determine color based on score
     if score >= 80: